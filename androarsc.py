@@ -54,7 +54,19 @@ option_5 = {
     'help': 'version of the API',
     'action': 'count'
 }
-options = [option_0, option_1, option_2, option_3, option_4, option_5]
+option_6 = {
+    'name': ('-s', '--stream'),
+    'help': 'write all the resources, or the selected ones, as they are '
+            'decoded (for large files)',
+    'action': 'store_true'
+}
+option_7 = {
+    'name': ('-j', '--jsonl'),
+    'help': 'with --stream, write JSON Lines instead of XML',
+    'action': 'store_true'
+}
+options = [option_0, option_1, option_2, option_3, option_4, option_5,
+           option_6, option_7]
 
 
 def main(options, arguments):
@@ -72,6 +84,20 @@ def main(options, arguments):
             print("Unknown file type")
             return
 
+        if options.stream:
+            if options.output != None:
+                fd = codecs.open(options.output, "w", "utf-8")
+            else:
+                fd = sys.stdout
+            try:
+                arscobj.write_resources(
+                    fd, options.package, options.locale, options.type,
+                    "jsonl" if options.jsonl else "xml")
+            finally:
+                if fd is not sys.stdout:
+                    fd.close()
+            return
+
         if not options.package and not options.type and not options.locale:
             buff = ""
             for package in arscobj.get_packages_names():
@@ -187,7 +187,7 @@ def export_apps_to_format(filename,
 
                 current_filename_class = output_name + current_filename_class + ".java"
                 with open(current_filename_class, "w") as fd:
-                    fd.write(current_class.get_source())
+                    current_class.write_source(fd)
                 dump_classes.append(method.get_class_name())
 
             print("bytecodes ...", end=' ')
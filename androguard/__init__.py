@@ -1 +1,11 @@
+import importlib
 
+# The submodules are only imported when they are used (PEP 562), so that
+# `import androguard` stays cheap.
+_SUBMODULES = ("core", "decompiler", "gui", "misc", "session", "util")
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -0,0 +1,14 @@
+"""
+Benchmarks of the analysis.
+
+:mod:`androguard.bench.generator` builds synthetic DEX and APK files of any
+size, and :mod:`androguard.bench.runner` times the phases of the analysis on
+them, or on real applications, and compares the results with a baseline.
+:mod:`androguard.bench.meminfo` reads the memory usage of the process.
+
+:Example:
+    $ python -m androguard.bench --examples --synthetic 1000,10,10000 \\
+          --json bench.json
+    $ python -m androguard.bench --examples --synthetic 1000,10,10000 \\
+          --baseline bench.json
+"""
@@ -0,0 +1,100 @@
+"""
+Time the phases of the analysis of APK and DEX files, and check them against
+a baseline. Exit with status 1 if a phase is slower than in the baseline.
+"""
+from __future__ import print_function
+import argparse
+import os
+import sys
+
+from androguard.bench import runner
+
+# The root of the source tree, and its test applications
+SOURCE_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                           "..")
+EXAMPLES = ["examples/android/TestsAndroguard/bin/TestActivity.apk",
+            "examples/android/TestsAndroguard/bin/classes.dex"]
+
+
+def parse_synthetic(value):
+    try:
+        nb_classes, nb_methods, nb_strings = [int(v) for v in value.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            "expected CLASSES,METHODS,STRINGS, got %r" % value)
+    return nb_classes, nb_methods, nb_strings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m androguard.bench",
+                                     description=__doc__)
+    parser.add_argument("inputs", nargs="*",
+                        help="APK or DEX files, or directories")
+    parser.add_argument("--examples", action="store_true",
+                        help="also run the test applications of the source "
+                             "tree")
+    parser.add_argument("--synthetic", action="append", default=[],
+                        type=parse_synthetic,
+                        metavar="CLASSES,METHODS,STRINGS",
+                        help="also run a synthetic DEX file of this size")
+    parser.add_argument("--phases", default=None,
+                        help="the phases to run, separated by commas, among "
+                             "%s" % ", ".join(runner.PHASES))
+    parser.add_argument("--decompile", action="store_true",
+                        help="also run the decompile phase")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="keep the best time of this number of runs")
+    parser.add_argument("--json", help="save the results in this file")
+    parser.add_argument("--baseline", help="compare with the results saved in "
+                                           "this file")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="the allowed slowdown compared with the "
+                             "baseline, 0.25 for 25%%")
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="do not compare the phases faster than this "
+                             "number of seconds in the baseline")
+    args = parser.parse_args(argv)
+
+    inputs = list(args.inputs)
+    if args.examples:
+        # Named like from the root of the source tree when run from there,
+        # so the results can be compared with the baseline
+        inputs.extend(os.path.relpath(os.path.join(SOURCE_ROOT, example))
+                      for example in EXAMPLES)
+    if not inputs and not args.synthetic:
+        parser.error("nothing to run")
+
+    if args.phases:
+        phases = args.phases.split(",")
+        unknown = set(phases) - set(runner.PHASES)
+        if unknown:
+            parser.error("unknown phases: %s" % ", ".join(sorted(unknown)))
+    else:
+        phases = [p for p in runner.PHASES if p not in runner.SLOW_PHASES]
+    if args.decompile and "decompile" not in phases:
+        phases.append("decompile")
+
+    results = runner.run_corpus(inputs, phases, args.repeat, args.synthetic)
+
+    baseline = None
+    if args.baseline:
+        baseline = runner.load_results(args.baseline)
+    runner.show_results(results, baseline)
+
+    if args.json:
+        runner.save_results(results, args.json)
+
+    if baseline is not None:
+        regressions = runner.compare(results, baseline, args.tolerance,
+                                     args.min_time)
+        for name, path, reference, wall in regressions:
+            print("REGRESSION %s %s: %.3fs, baseline %.3fs (+%d%%)" %
+                  (name, path, wall, reference,
+                   100 * (wall - reference) / reference))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
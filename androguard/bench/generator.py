@@ -0,0 +1,257 @@
+"""
+Synthetic inputs for the benchmarks.
+
+:func:`generate_dex` writes a valid DEX file with the requested number of
+classes, methods and strings. Each method loads a string, updates a static
+field of its class and calls another method, so the xrefs, the control flow
+graphs and the decompiler all have some work to do.
+
+:func:`generate_apk` packs DEX files into an APK, whose manifest, resources
+and signature are taken from a template APK.
+"""
+import io
+import os
+import random
+import struct
+import zipfile
+import hashlib
+import zlib
+
+from androguard.core.bytecodes.dvm import writeuleb128
+
+# A template APK of the source tree
+TEMPLATE_APK = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                            "..", "examples", "android", "TestsAndroguard",
+                            "bin", "TestActivity.apk")
+
+NO_INDEX = 0xffffffff
+ACC_PUBLIC = 0x1
+ACC_STATIC = 0x8
+
+HEADER_SIZE = 0x70
+
+TYPE_HEADER_ITEM = 0x0000
+TYPE_STRING_ID_ITEM = 0x0001
+TYPE_TYPE_ID_ITEM = 0x0002
+TYPE_PROTO_ID_ITEM = 0x0003
+TYPE_FIELD_ID_ITEM = 0x0004
+TYPE_METHOD_ID_ITEM = 0x0005
+TYPE_CLASS_DEF_ITEM = 0x0006
+TYPE_MAP_LIST = 0x1000
+TYPE_CLASS_DATA_ITEM = 0x2000
+TYPE_CODE_ITEM = 0x2001
+TYPE_STRING_DATA_ITEM = 0x2002
+
+
+def _align(buff, alignment=4):
+    buff.write(b"\x00" * (-buff.tell() % alignment))
+
+
+def generate_dex(nb_classes=100, nb_methods=10, nb_strings=1000, seed=0,
+                 package="bench", callee_package=None):
+    """
+        Return a DEX file with nb_classes classes of nb_methods static methods,
+        whose code loads nb_strings distinct constant strings
+
+        :param nb_classes: the number of classes
+        :type nb_classes: int
+        :param nb_methods: the number of methods of each class
+        :type nb_methods: int
+        :param nb_strings: the number of constant strings
+        :type nb_strings: int
+        :param seed: the seed of the calls between the methods
+        :type seed: int
+        :param package: the package of the classes
+        :type package: string
+        :param callee_package: the package of the classes whose methods are
+                               called and whose fields are used, defined by
+                               another DEX file with the same number of
+                               classes and methods. The classes of this DEX
+                               file if None.
+        :type callee_package: string
+
+        :rtype: bytes
+    """
+    rand = random.Random(seed)
+    nb_classes = max(nb_classes, 1)
+    nb_methods = max(nb_methods, 1)
+
+    classes = ["L%s/C%06d;" % (package, i) for i in range(nb_classes)]
+    callees = classes
+    if callee_package is not None:
+        callees = ["L%s/C%06d;" % (callee_package, i)
+                   for i in range(nb_classes)]
+    method_names = ["m%d" % j for j in range(nb_methods)]
+    constants = ["str%08d" % k for k in range(nb_strings)]
+
+    strings = sorted(set(["Ljava/lang/Object;", "V", "I", "f"] + classes +
+                          callees + method_names + constants))
+    string_idx = dict((value, idx) for idx, value in enumerate(strings))
+
+    types = sorted(set(["Ljava/lang/Object;", "V", "I"] + classes + callees),
+                   key=lambda value: string_idx[value])
+    type_idx = dict((value, idx) for idx, value in enumerate(types))
+
+    # A single prototype: ()V, with "V" as shorty
+    protos = [(string_idx["V"], type_idx["V"], 0)]
+
+    # One static int field "f" per class
+    defined = sorted(set(classes + callees))
+    fields = [(type_idx[name], type_idx["I"], string_idx["f"])
+              for name in defined]
+    fields.sort()
+    field_idx = dict((field[0], idx) for idx, field in enumerate(fields))
+
+    methods = [(type_idx[name], 0, string_idx[method_name], name, method_name)
+               for name in defined for method_name in method_names]
+    methods.sort()
+    method_idx = dict(((method[3], method[4]), idx)
+                      for idx, method in enumerate(methods))
+
+    nb_ids = (len(strings) * 4 + len(types) * 4 + len(protos) * 12 +
+              len(fields) * 8 + len(methods) * 8 + nb_classes * 32)
+    data_off = HEADER_SIZE + nb_ids
+    data = io.BytesIO()
+    data.write(b"\x00" * data_off)
+
+    # code items
+    code_offs = {}
+    nb_calls = nb_classes * nb_methods
+    for num, (name, method_name) in enumerate(
+            (name, method_name) for name in classes
+            for method_name in method_names):
+        _align(data)
+        code_offs[name, method_name] = data.tell()
+
+        target = rand.randrange(nb_calls)
+        target_name = callees[target // nb_methods]
+        target_method = method_names[target % nb_methods]
+        constant = constants[num % nb_strings] if constants else "f"
+        if callee_package is None:
+            f_idx = field_idx[type_idx[name]]
+        else:
+            f_idx = field_idx[type_idx[target_name]]
+
+        insns = struct.pack(
+            "<BBH" "BBH" "BBBB" "BBH" "BBHH" "BB",
+            0x1a, 0, string_idx[constant],  # const-string v0, constant
+            0x60, 1, f_idx,  # sget v1, f
+            0xd8, 1, 1, 1,  # add-int/lit8 v1, v1, 1
+            0x67, 1, f_idx,  # sput v1, f
+            0x71, 0, method_idx[target_name, target_method], 0,  # invoke-static
+            0x0e, 0)  # return-void
+        data.write(struct.pack("<4H2L", 2, 0, 0, 0, 0, len(insns) // 2))
+        data.write(insns)
+    code_off = data_off + (-data_off % 4)
+
+    # string data
+    string_data_off = data.tell()
+    string_offs = []
+    for value in strings:
+        string_offs.append(data.tell())
+        encoded = value.encode("ascii")
+        data.write(writeuleb128(len(encoded)) + encoded + b"\x00")
+
+    # class data
+    class_data_off = data.tell()
+    class_data_offs = []
+    for name in classes:
+        class_data_offs.append(data.tell())
+        data.write(writeuleb128(1) + writeuleb128(0) +
+                   writeuleb128(nb_methods) + writeuleb128(0))
+        data.write(writeuleb128(field_idx[type_idx[name]]) +
+                   writeuleb128(ACC_PUBLIC | ACC_STATIC))
+        previous = 0
+        for idx in sorted(method_idx[name, method_name]
+                          for method_name in method_names):
+            data.write(writeuleb128(idx - previous) +
+                       writeuleb128(ACC_PUBLIC | ACC_STATIC) +
+                       writeuleb128(code_offs[methods[idx][3],
+                                              methods[idx][4]]))
+            previous = idx
+
+    _align(data)
+    map_off = data.tell()
+    string_ids_off = HEADER_SIZE
+    type_ids_off = string_ids_off + len(strings) * 4
+    proto_ids_off = type_ids_off + len(types) * 4
+    field_ids_off = proto_ids_off + len(protos) * 12
+    method_ids_off = field_ids_off + len(fields) * 8
+    class_defs_off = method_ids_off + len(methods) * 8
+    map_items = [
+        (TYPE_HEADER_ITEM, 1, 0),
+        (TYPE_STRING_ID_ITEM, len(strings), string_ids_off),
+        (TYPE_TYPE_ID_ITEM, len(types), type_ids_off),
+        (TYPE_PROTO_ID_ITEM, len(protos), proto_ids_off),
+        (TYPE_FIELD_ID_ITEM, len(fields), field_ids_off),
+        (TYPE_METHOD_ID_ITEM, len(methods), method_ids_off),
+        (TYPE_CLASS_DEF_ITEM, nb_classes, class_defs_off),
+        (TYPE_CODE_ITEM, nb_calls, code_off),
+        (TYPE_STRING_DATA_ITEM, len(strings), string_data_off),
+        (TYPE_CLASS_DATA_ITEM, nb_classes, class_data_off),
+        (TYPE_MAP_LIST, 1, map_off),
+    ]
+    data.write(struct.pack("<L", len(map_items)))
+    for item_type, size, offset in map_items:
+        data.write(struct.pack("<2H2L", item_type, 0, size, offset))
+    file_size = data.tell()
+
+    # ids
+    data.seek(HEADER_SIZE)
+    for offset in string_offs:
+        data.write(struct.pack("<L", offset))
+    for value in types:
+        data.write(struct.pack("<L", string_idx[value]))
+    for shorty, return_type, parameters_off in protos:
+        data.write(struct.pack("<3L", shorty, return_type, parameters_off))
+    for class_type, field_type, name in fields:
+        data.write(struct.pack("<2HL", class_type, field_type, name))
+    for class_type, proto, name, _, _ in methods:
+        data.write(struct.pack("<2HL", class_type, proto, name))
+    for name, offset in zip(classes, class_data_offs):
+        data.write(struct.pack("<8L", type_idx[name], ACC_PUBLIC,
+                               type_idx["Ljava/lang/Object;"], 0, NO_INDEX, 0,
+                               offset, 0))
+
+    data.seek(0)
+    data.write(b"dex\n035\x00")
+    data.write(b"\x00" * 24)  # checksum and signature
+    data.write(struct.pack(
+        "<20L", file_size, HEADER_SIZE, 0x12345678, 0, 0, map_off,
+        len(strings), string_ids_off, len(types), type_ids_off, len(protos),
+        proto_ids_off, len(fields), field_ids_off, len(methods),
+        method_ids_off, nb_classes, class_defs_off, file_size - data_off,
+        data_off))
+
+    raw = bytearray(data.getvalue())
+    raw[12:32] = hashlib.sha1(raw[32:]).digest()
+    raw[8:12] = struct.pack("<L", zlib.adler32(bytes(raw[12:])) & 0xffffffff)
+    return bytes(raw)
+
+
+def generate_apk(dex_files, template=TEMPLATE_APK):
+    """
+        Return an APK with the DEX files (classes.dex, classes2.dex...), and
+        the other entries of the template APK
+
+        :param dex_files: the raw DEX files
+        :type dex_files: list of bytes
+        :param template: the filename of the template APK
+        :type template: string
+
+        :rtype: bytes
+    """
+    raw = io.BytesIO()
+    with zipfile.ZipFile(template) as z:
+        with zipfile.ZipFile(raw, "w", zipfile.ZIP_DEFLATED) as apk:
+            for info in z.infolist():
+                if info.filename.startswith("classes") and \
+                        info.filename.endswith(".dex"):
+                    continue
+                apk.writestr(info, z.read(info.filename))
+            for num, dex in enumerate(dex_files):
+                if num == 0:
+                    apk.writestr("classes.dex", dex)
+                else:
+                    apk.writestr("classes%d.dex" % (num + 1), dex)
+    return raw.getvalue()
@@ -0,0 +1,348 @@
+"""
+Run the phases of the analysis on a corpus, and compare the results with a
+baseline.
+
+Each input is analyzed phase by phase (apk, axml, arsc, signature, dex, xref,
+cfg, decompile), under a :class:`Profiler`, so the detailed phases of the
+parsers are recorded too. The wall and CPU times, and the growth of the
+resident memory of the process, of each phase are kept. The results are plain
+dicts, which are saved as JSON.
+
+:Example:
+    >>> results = run_corpus(["app.apk"], repeat=3)
+    >>> save_results(results, "bench.json")
+    >>> regressions = compare(results, load_results("baseline.json"))
+"""
+from __future__ import print_function
+import collections
+import io
+import json
+import os
+import platform
+import sys
+
+from androguard.bench import meminfo
+from androguard.core import androconf
+from androguard.core import profiling
+
+# Version of the format of the results
+RESULTS_VERSION = 1
+
+# All the phases, in the order they run
+PHASES = ["apk", "axml", "arsc", "signature", "dex", "xref", "cfg",
+          "decompile"]
+
+# The phases which are not run by default, as they are the slowest ones
+SLOW_PHASES = ["decompile"]
+
+
+def get_rss():
+    """
+        Return the resident memory of the process, in bytes, or 0 if it is
+        not available
+    """
+    return int(meminfo.resident())
+
+
+def get_peak_rss():
+    """
+        Return the peak resident memory of the process, in bytes, or 0 if it
+        is not available
+    """
+    peak = int(meminfo.peak_resident())
+    if peak:
+        return peak
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # In bytes on OS X, in kB everywhere else
+    if sys.platform == "darwin":
+        return peak
+    return peak * 1024
+
+
+class _Phase(object):
+
+    def __init__(self, measures, name):
+        self.measures = measures
+        self.name = name
+
+    def __enter__(self):
+        self.rss = get_rss()
+        self.phase = profiling.phase(self.name)
+        self.phase.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.phase.__exit__(exc_type, exc_value, tb)
+        self.measures[self.name] = get_rss() - self.rss
+        return False
+
+
+def _run_phases(name, raw, phases):
+    """
+        Run the phases on raw, and return the summary of the input, with the
+        growth of the resident memory of each phase
+    """
+    from androguard.core.bytecodes import apk
+    from androguard.core.bytecodes import dvm
+    from androguard.core.analysis import analysis
+
+    rss = collections.OrderedDict()
+    summary = collections.OrderedDict([
+        ("name", name),
+        ("size", len(raw)),
+        ("type", None),
+        ("dex", 0),
+        ("classes", 0),
+        ("methods", 0),
+        ("strings", 0),
+    ])
+
+    file_type = androconf.is_android_raw(raw)
+    summary["type"] = file_type
+    if file_type == "APK":
+        with _Phase(rss, "apk"):
+            a = apk.APK(raw, raw=True)
+        dex_files = a.read_files(a.get_dex_names())
+
+        if "axml" in phases:
+            manifest = a.get_file("AndroidManifest.xml")
+            with _Phase(rss, "axml"):
+                apk.AXMLPrinter(manifest).get_xml()
+
+        if "arsc" in phases and "resources.arsc" in a.get_files():
+            resources = a.get_file("resources.arsc")
+            with _Phase(rss, "arsc"):
+                arsc = apk.ARSCParser(resources)
+                for package_name in arsc.get_packages_names():
+                    arsc.get_public_resources(package_name)
+                    arsc.get_string_resources(package_name)
+
+        if "signature" in phases:
+            try:
+                with _Phase(rss, "signature"):
+                    for signature_name in a.get_signature_names():
+                        a.get_certificate(signature_name)
+            except ImportError as e:
+                # pyasn1 or cryptography are not installed
+                androconf.warning("signature: %s" % e)
+    elif file_type == "DEX":
+        dex_files = [raw]
+    else:
+        raise ValueError("%s is not an APK or a DEX file" % name)
+
+    summary["dex"] = len(dex_files)
+    if "dex" not in phases:
+        return summary, rss
+
+    vms = []
+    with _Phase(rss, "dex"):
+        for dex in dex_files:
+            vms.append(dvm.DalvikVMFormat(dex))
+    for d in vms:
+        summary["classes"] += len(d.get_classes())
+        summary["methods"] += len(d.get_methods())
+        summary["strings"] += len(d.get_strings())
+
+    if "xref" not in phases:
+        return summary, rss
+
+    with _Phase(rss, "xref"):
+        dx = analysis.Analysis(vms[0])
+        for d in vms[1:]:
+            dx.add(d)
+        dx.create_xref()
+
+    if "cfg" in phases:
+        with _Phase(rss, "cfg"):
+            for d in vms:
+                for method in d.get_methods():
+                    dx.get_method(method)
+
+    if "decompile" in phases:
+        from androguard.decompiler.decompiler import DecompilerDAD
+        with _Phase(rss, "decompile"):
+            for d in vms:
+                decompiler = DecompilerDAD(d, dx)
+                for current_class in d.get_classes():
+                    decompiler.get_source_class(current_class)
+
+    return summary, rss
+
+
+def run(name, raw, phases=None, repeat=1):
+    """
+        Run the phases on an APK or a DEX file, and return its result
+
+        The times of each phase are the best ones of the `repeat` runs, its
+        memory growth is the one of the first run.
+
+        :param name: the name of the input in the results
+        :type name: string
+        :param raw: the APK or DEX file
+        :type raw: bytes
+        :param phases: the phases to run, all but the slow ones by default
+        :type phases: list of string
+        :param repeat: the number of runs
+        :type repeat: int
+
+        :rtype: dict
+    """
+    if phases is None:
+        phases = [p for p in PHASES if p not in SLOW_PHASES]
+
+    best = collections.OrderedDict()
+    for _ in range(max(repeat, 1)):
+        profiler = profiling.Profiler()
+        with profiler:
+            summary, rss = _run_phases(name, raw, phases)
+
+        for phase in profiler.get_report().phases:
+            path = phase["name"]
+            current = best.get(path)
+            if current is None:
+                current = collections.OrderedDict([
+                    ("wall", phase["wall"]),
+                    ("cpu", phase["cpu"]),
+                    ("calls", phase["calls"]),
+                    ("rss", rss.get(path, 0)),
+                ])
+                best[path] = current
+            elif phase["wall"] < current["wall"]:
+                current["wall"] = phase["wall"]
+                current["cpu"] = phase["cpu"]
+
+    summary["phases"] = best
+    summary["peak_rss"] = get_peak_rss()
+    return summary
+
+
+def iter_corpus(inputs):
+    """
+        Yield the (name, raw) of the APK and DEX files of inputs, a list of
+        files and directories
+    """
+    for path in inputs:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for filename in sorted(files):
+                    filename = os.path.join(root, filename)
+                    if androconf.is_android(filename) in ("APK", "DEX"):
+                        with open(filename, "rb") as fd:
+                            yield filename, fd.read()
+        else:
+            with open(path, "rb") as fd:
+                yield path, fd.read()
+
+
+def run_corpus(inputs, phases=None, repeat=1, synthetic=None):
+    """
+        Run the phases on the APK and DEX files of inputs, and on synthetic
+        DEX files, and return the results
+
+        :param inputs: files and directories
+        :type inputs: list of string
+        :param synthetic: the (classes, methods, strings) of the synthetic
+                          DEX files, see :func:`generator.generate_dex`
+        :type synthetic: list of tuple
+
+        :rtype: dict
+    """
+    results = []
+    for name, raw in iter_corpus(inputs):
+        results.append(run(name, raw, phases, repeat))
+
+    if synthetic:
+        from androguard.bench import generator
+        for nb_classes, nb_methods, nb_strings in synthetic:
+            name = "synthetic-%d-%d-%d" % (nb_classes, nb_methods, nb_strings)
+            raw = generator.generate_dex(nb_classes, nb_methods, nb_strings)
+            results.append(run(name, raw, phases, repeat))
+
+    return collections.OrderedDict([
+        ("version", RESULTS_VERSION),
+        ("python", platform.python_version()),
+        ("platform", platform.platform()),
+        ("results", results),
+    ])
+
+
+def save_results(results, filename):
+    """
+        Save the results in filename, as JSON
+    """
+    with io.open(filename, "w", encoding="utf-8") as fd:
+        fd.write(u"%s" % json.dumps(results, indent=2))
+
+
+def load_results(filename):
+    """
+        Return the results saved in filename
+    """
+    with io.open(filename, "r", encoding="utf-8") as fd:
+        return json.load(fd, object_pairs_hook=collections.OrderedDict)
+
+
+def compare(results, baseline, tolerance=0.25, min_time=0.05):
+    """
+        Return the phases of results slower than in the baseline, as a list of
+        (name, phase, baseline time, time)
+
+        The phases of the inputs which are not in the baseline, and the phases
+        faster than min_time in the baseline, are ignored.
+
+        :param tolerance: the allowed slowdown, 0.25 for 25%
+        :type tolerance: float
+        :param min_time: the minimum wall time, in seconds, of the phases
+                         compared
+        :type min_time: float
+
+        :rtype: list
+    """
+    baseline_results = dict((result["name"], result)
+                            for result in baseline["results"])
+    regressions = []
+    for result in results["results"]:
+        reference = baseline_results.get(result["name"])
+        if reference is None:
+            continue
+        for path, measures in result["phases"].items():
+            reference_measures = reference["phases"].get(path)
+            if reference_measures is None:
+                continue
+            reference_wall = reference_measures["wall"]
+            if reference_wall < min_time:
+                continue
+            if measures["wall"] > reference_wall * (1 + tolerance):
+                regressions.append((result["name"], path, reference_wall,
+                                    measures["wall"]))
+    return regressions
+
+
+def show_results(results, baseline=None, out=sys.stdout):
+    """
+        Print the results, with the times of the baseline if any
+    """
+    reference = {}
+    if baseline is not None:
+        for result in baseline["results"]:
+            reference[result["name"]] = result["phases"]
+
+    for result in results["results"]:
+        print("%s: %d bytes, %d dex, %d classes, %d methods, %d strings, "
+              "peak rss %d kB" % (result["name"], result["size"], result["dex"],
+                                  result["classes"], result["methods"],
+                                  result["strings"], result["peak_rss"] // 1024),
+              file=out)
+        phases = reference.get(result["name"], {})
+        for path, measures in result["phases"].items():
+            line = "  %-40s %9.3fs wall %9.3fs cpu %10d kB rss" % (
+                path, measures["wall"], measures["cpu"],
+                measures["rss"] // 1024)
+            if path in phases:
+                line += " (baseline %.3fs)" % phases[path]["wall"]
+            print(line, file=out)
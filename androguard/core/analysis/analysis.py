@@ -1,18 +1,39 @@
 from __future__ import print_function
 
-from future import standard_library
-standard_library.install_aliases()
+import sys
+if sys.version_info[0] < 3:
+    from future import standard_library
+    standard_library.install_aliases()
 from builtins import str
 from builtins import range
 from builtins import object
 import re, collections
-import threading, queue, time
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 
 
-from androguard.core.androconf import error, warning, debug, is_ascii_problem,\
-    load_api_specific_resource_module
+from androguard.core.androconf import error, warning, debug, get_debug, \
+    is_ascii_problem, load_api_specific_resource_module
+from androguard.core import profiling
 from androguard.core.bytecodes import dvm
-from androguard.core.bytecodes.api_permissions import DVM_PERMISSIONS_BY_PERMISSION, DVM_PERMISSIONS_BY_ELEMENT
+
+
+def __getattr__(name):
+    # The api_permissions tables are big, so they are only imported when
+    # they are used (PEP 562)
+    if name in ("DVM_PERMISSIONS_BY_PERMISSION", "DVM_PERMISSIONS_BY_ELEMENT"):
+        from androguard.core.bytecodes import api_permissions
+        return getattr(api_permissions, name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+if sys.version_info < (3, 7):
+    # There is no module __getattr__ before Python 3.7
+    from androguard.core.bytecodes.api_permissions import \
+        DVM_PERMISSIONS_BY_PERMISSION, DVM_PERMISSIONS_BY_ELEMENT
+
 
 class DVMBasicBlock(object):
     """
@@ -392,6 +413,10 @@ class MethodAnalysis(object):
         if code == None:
             return
 
+        # A MethodAnalysis is built for every method, so the debug level is
+        # only checked once here.
+        trace = get_debug()
+
         current_basic = DVMBasicBlock(0, self.__vm, self.method, self.basic_blocks)
         self.basic_blocks.push(current_basic)
 
@@ -402,7 +427,8 @@ class MethodAnalysis(object):
         h = {}
         idx = 0
 
-        debug("Parsing instructions")
+        if trace:
+            debug("Parsing instructions")
         instructions = [i for i in bc.get_instructions()]
         for i in instructions:
             for j in BasicOPCODES:
@@ -414,14 +440,16 @@ class MethodAnalysis(object):
 
             idx += i.get_length()
 
-        debug("Parsing exceptions")
+        if trace:
+            debug("Parsing exceptions")
         excepts = dvm.determineException(self.__vm, self.method)
         for i in excepts:
             l.extend([i[0]])
             for handler in i[2:]:
                 l.append(handler[1])
 
-        debug("Creating basic blocks in %s" % self.method)
+        if trace:
+            debug("Creating basic blocks in %s", self.method)
         idx = 0
         for i in instructions:
             # index is a destination
@@ -446,7 +474,8 @@ class MethodAnalysis(object):
         if current_basic.get_nb_instructions() == 0:
             self.basic_blocks.pop(-1)
 
-        debug("Settings basic blocks childs")
+        if trace:
+            debug("Settings basic blocks childs")
 
         for i in self.basic_blocks.get():
             try:
@@ -454,7 +483,8 @@ class MethodAnalysis(object):
             except KeyError:
                 i.set_childs([])
 
-        debug("Creating exceptions")
+        if trace:
+            debug("Creating exceptions")
 
         # Create exceptions
         self.exceptions.add(excepts, self.basic_blocks)
@@ -544,6 +574,83 @@ class StringAnalysis(object):
         return data
 
 
+class StringMatch(object):
+    """
+        A string of a DEX file found by a :class:`dvm.StringSearch`
+    """
+
+    def __init__(self, vm, idx, value, patterns, string_analysis=None):
+        self.vm = vm
+        self.idx = idx
+        self.value = value
+        self.patterns = patterns
+        self.string_analysis = string_analysis
+
+    def get_vm(self):
+        return self.vm
+
+    def get_idx(self):
+        return self.idx
+
+    def get_value(self):
+        return self.value
+
+    def get_patterns(self):
+        return self.patterns
+
+    def get_string_analysis(self):
+        return self.string_analysis
+
+    def get_xref_from(self):
+        """
+            Return the methods which use the string, as a set of
+            (ClassAnalysis, EncodedMethod)
+        """
+        if self.string_analysis == None:
+            return set()
+        return self.string_analysis.get_xref_from()
+
+    def __str__(self):
+        data = "%d %s matches %s\n" % (self.idx, repr(self.value),
+                                        ", ".join(self.patterns))
+        for ref_class, ref_method in self.get_xref_from():
+            data += "%s:%s\n" % (ref_class.get_vm_class().get_name(),
+                                  ref_method)
+        return data
+
+
+class PermissionPaths(Mapping):
+    """
+        The methods which reach a permission, as a read-only dict
+        method -> path. Only the next method of each path is kept, the
+        paths are rebuilt when they are read.
+
+        :param next_hops: dict method -> next method towards the protected
+                          API, None for the API itself
+        :type next_hops: dict
+    """
+
+    def __init__(self, next_hops):
+        self.next_hops = next_hops
+
+    def __getitem__(self, method):
+        path = [method]
+        callee = self.next_hops[method]
+        while callee is not None:
+            path.append(callee)
+            callee = self.next_hops[callee]
+        return path
+
+    def __contains__(self, method):
+        return method in self.next_hops
+
+    def __iter__(self):
+        return iter(self.next_hops)
+
+    def __len__(self):
+        return len(self.next_hops)
+
+
 class MethodClassAnalysis(object):
 
     def __init__(self, method):
@@ -625,6 +732,9 @@ class ExternalClass(object):
         self.name = name
         self.methods = {}
 
+    def get_name(self):
+        return self.name
+
     def GetMethod(self, name, descriptor):
         key = name + str(descriptor)
         if key not in self.methods:
@@ -720,6 +830,18 @@ class ClassAnalysis(object):
     def get_vm_class(self):
         return self.orig_class
 
+    def _reset_xref(self):
+        # The method and field analyses are kept, as they may have been
+        # handed out, and filled again by the next Analysis.create_xref()
+        for method_analysis in self._methods.values():
+            method_analysis.xrefto.clear()
+            method_analysis.xreffrom.clear()
+        for field_analysis in self._fields.values():
+            field_analysis.xrefread.clear()
+            field_analysis.xrefwrite.clear()
+        self.xrefto.clear()
+        self.xreffrom.clear()
+
     def __str__(self):
         # Print only instanceiations from other classes here
         # TODO also method xref and field xref should be printed?
@@ -745,49 +867,140 @@ class ClassAnalysis(object):
 
 
 class Analysis(object):
+    """
+        The xrefs of one or several DEX files, like the classes*.dex of a
+        multidex application, which share a single result
+
+        :param vm: the first DEX file, the others are given to :meth:`add`
+        :type vm: :class:`DalvikVMFormat`
+    """
 
     def __init__(self, vm):
-        self.vms = [vm]
+        self.vms = []
         self.classes = {}
         self.strings = {}
+        # The permissions reached by the methods, by API level
+        self._permissions = {}
+        # The number of DEX files whose xrefs are created, and if they must be
+        # created again
+        self._nb_xref_vms = 0
+        self._stale_xref = False
 
-        for current_class in vm.get_classes():
-            self.classes[current_class.get_name()] = ClassAnalysis(
-                current_class, True)
+        self.add(vm)
 
     def create_xref(self):
+        """
+            Create the xrefs of the DEX files added since the last call, in a
+            single pass. The references are resolved across all the DEX files.
+
+            The previous xrefs are kept, unless a new DEX file defines a class
+            which they refer to as an external one: then the xrefs of all the
+            DEX files are created again.
+        """
         debug("Creating XREF/DREF")
-        started_at = time.time()
-
-        instances_class_name = list(self.classes.keys())
-
-        queue_classes = queue.Queue()
-        last_vm = self.vms[-1]
-        for current_class in last_vm.get_classes():
-            queue_classes.put(current_class)
-
-        threads = []
-        # TODO maybe adjust this number by the 
-        # number of cores or make it configureable?
-        for n in range(2):
-            thread = threading.Thread(target=self._create_xref, args=(instances_class_name, last_vm, queue_classes))
-            thread.daemon = True
-            thread.start()
-            threads.append(thread)
-
-        debug("Waiting all threads")
-        queue_classes.join()
-
-        debug("")
-        diff = time.time() - started_at
-        debug("End of creating XREF/DREF {:.0f}:{:.2f}".format(*divmod(diff, 60)))
-
-    def _create_xref(self, instances_class_name, last_vm, queue_classes):
-        while not queue_classes.empty():
-            current_class = queue_classes.get()
-            debug("Creating XREF/DREF for %s" % current_class.get_name())
+        self._permissions = {}
+        with profiling.phase("xref"):
+            if self._nb_xref_vms == 0 or self._stale_xref:
+                self._reset_xref()
+                vms = self.vms
+            else:
+                vms = self.vms[self._nb_xref_vms:]
+                self._index_classes(vms)
+            for vm in vms:
+                self._create_xref(vm)
+            self._nb_xref_vms = len(self.vms)
+            self._stale_xref = False
+        debug("End of creating XREF/DREF")
+
+    def _reset_xref(self):
+        # The ClassAnalysis are kept, as add() already handed them out
+        for class_analysis in self.classes.values():
+            class_analysis._reset_xref()
+        self.strings = {}
+        self._methods_index = {}
+        self._fields_index = {}
+        self._internal_classes = set()
+        self._index_classes(self.vms)
+
+    def _index_classes(self, vms):
+        # The classes and members of the DEX files, by name. The first
+        # definition of a class wins, like in the VM.
+        for vm in vms:
+            for current_class in vm.get_classes():
+                name = current_class.get_name()
+                class_analysis = self.classes.get(name)
+                if class_analysis is None:
+                    self.classes[name] = ClassAnalysis(current_class, True)
+                elif class_analysis.get_vm_class() is not current_class:
+                    continue
+                self._internal_classes.add(name)
+                for method in current_class.get_methods():
+                    self._methods_index.setdefault(
+                        (name, method.get_name(), method.get_descriptor()),
+                        method)
+                for field in current_class.get_fields():
+                    self._fields_index.setdefault(
+                        (name, field.get_name(), field.get_descriptor()),
+                        field)
+
+    def _resolve_type(self, vm, idx):
+        # The ClassAnalysis of an internal class, or None
+        type_info = vm.get_cm_type(idx)
+        if type_info in self._internal_classes:
+            return self.classes[type_info]
+        return None
+
+    def _resolve_method(self, vm, idx):
+        # The ClassAnalysis of the class of the method, the method (an
+        # ExternalMethod if it is not defined by the DEX files) and if the
+        # class is internal, or None
+        method_info = vm.get_cm_method(idx)
+        if not method_info:
+            return None
+
+        class_info = method_info[0]
+        method_item = self._methods_index.get(
+            (class_info, method_info[1], ''.join(method_info[2])))
+
+        # Seems to be an external classes
+        if not method_item:
+            if class_info not in self.classes:
+                self.classes[class_info] = ClassAnalysis(
+                    ExternalClass(class_info), False)
+            method_item = self.classes[class_info].GetFakeMethod(
+                method_info[1], method_info[2])
+
+        return (self.classes[class_info], method_item,
+                class_info in self._internal_classes)
+
+    def _resolve_field(self, vm, idx):
+        field_info = vm.get_cm_field(idx)
+        return self._fields_index.get(
+            (field_info[0], field_info[2], field_info[1]))
+
+    def _resolve_string(self, vm, idx):
+        string_value = vm.get_cm_string(idx)
+        if string_value not in self.strings:
+            self.strings[string_value] = StringAnalysis(string_value)
+        return self.strings[string_value]
+
+    def _create_xref(self, vm):
+        trace = get_debug()
+
+        # The references are resolved once per index of the DEX file, and not
+        # for each instruction
+        types = {}
+        methods = {}
+        fields = {}
+        strings = {}
+
+        for current_class in vm.get_classes():
+            if trace:
+                debug("Creating XREF/DREF for %s", current_class.get_name())
+            class_analysis = self.classes[current_class.get_name()]
             for current_method in current_class.get_methods():
-                debug("Creating XREF for %s" % current_method)
+                if trace:
+                    debug("Creating XREF for %s", current_method)
 
                 code = current_method.get_code()
                 if code == None:
@@ -798,117 +1011,98 @@ class Analysis(object):
                 try:
                     for instruction in bc.get_instructions():
                         op_value = instruction.get_op_value()
-                        if op_value in [0x1c, 0x22]:
-                            idx_type = instruction.get_ref_kind()
-                            type_info = last_vm.get_cm_type(idx_type)
+                        if op_value == 0x22 or op_value == 0x1c:
+                            idx = instruction.get_ref_kind()
+                            try:
+                                type_analysis = types[idx]
+                            except KeyError:
+                                type_analysis = types[idx] = self._resolve_type(
+                                    vm, idx)
 
                             # Internal xref related to class manipulation
-                            if type_info in instances_class_name and type_info != current_class.get_name(
-                            ):
+                            if type_analysis is not None and \
+                                    type_analysis is not class_analysis:
                                 # new instance
                                 if op_value == 0x22:
-                                    self.classes[current_class.get_name(
-                                    )].AddXrefTo(REF_NEW_INSTANCE,
-                                                 self.classes[type_info],
-                                                 current_method, off)
-                                    self.classes[type_info].AddXrefFrom(
-                                        REF_NEW_INSTANCE,
-                                        self.classes[current_class.get_name()],
-                                        current_method, off)
+                                    ref_kind = REF_NEW_INSTANCE
                                 # class reference
                                 else:
-                                    self.classes[current_class.get_name(
-                                    )].AddXrefTo(REF_CLASS_USAGE,
-                                                 self.classes[type_info],
-                                                 current_method, off)
-                                    self.classes[type_info].AddXrefFrom(
-                                        REF_CLASS_USAGE,
-                                        self.classes[current_class.get_name()],
-                                        current_method, off)
+                                    ref_kind = REF_CLASS_USAGE
+                                class_analysis.AddXrefTo(ref_kind,
+                                                         type_analysis,
+                                                         current_method, off)
+                                type_analysis.AddXrefFrom(ref_kind,
+                                                          class_analysis,
+                                                          current_method, off)
 
                         elif ((op_value >= 0x6e and op_value <= 0x72) or
                               (op_value >= 0x74 and op_value <= 0x78)):
-                            idx_meth = instruction.get_ref_kind()
-                            method_info = last_vm.get_cm_method(idx_meth)
-                            if method_info:
-                                class_info = method_info[0]
-
-                                method_item = last_vm.get_method_descriptor(
-                                    method_info[0], method_info[1],
-                                    ''.join(method_info[2]))
-
-                                # Seems to be an external classes
-                                if not method_item:
-                                    if method_info[0] not in self.classes:
-                                        self.classes[method_info[0]] = ClassAnalysis(ExternalClass(method_info[0]), False)
-                                    method_item = self.classes[method_info[0]].GetFakeMethod(method_info[1], method_info[2])
-
-
-                                if method_item:
-                                    self.classes[current_class.get_name(
-                                    )].AddMXrefTo(current_method,
-                                                  self.classes[class_info],
-                                                  method_item,
-                                                  off)
-                                    self.classes[class_info].AddMXrefFrom(
-                                        method_item,
-                                        self.classes[current_class.get_name()],
-                                        current_method,
-                                        off)
-
-                                    # Internal xref related to class manipulation
-                                    if class_info in instances_class_name and class_info != current_class.get_name(
-                                    ):
-                                        self.classes[current_class.get_name(
-                                        )].AddXrefTo(REF_CLASS_USAGE,
-                                                     self.classes[class_info],
-                                                     method_item, off)
-                                        self.classes[class_info].AddXrefFrom(
-                                            REF_CLASS_USAGE,
-                                            self.classes[current_class.get_name()],
-                                            current_method, off)
+                            idx = instruction.get_ref_kind()
+                            try:
+                                method_ref = methods[idx]
+                            except KeyError:
+                                method_ref = methods[idx] = self._resolve_method(
+                                    vm, idx)
+
+                            if method_ref:
+                                target_analysis, method_item, internal = method_ref
+                                class_analysis.AddMXrefTo(current_method,
+                                                          target_analysis,
+                                                          method_item, off)
+                                target_analysis.AddMXrefFrom(method_item,
+                                                             class_analysis,
+                                                             current_method,
+                                                             off)
+
+                                # Internal xref related to class manipulation
+                                if internal and \
+                                        target_analysis is not class_analysis:
+                                    class_analysis.AddXrefTo(REF_CLASS_USAGE,
+                                                             target_analysis,
+                                                             method_item, off)
+                                    target_analysis.AddXrefFrom(
+                                        REF_CLASS_USAGE, class_analysis,
+                                        current_method, off)
 
                         elif op_value >= 0x1a and op_value <= 0x1b:
-                            string_value = last_vm.get_cm_string(
-                                instruction.get_ref_kind())
-                            if string_value not in self.strings:
-                                self.strings[string_value] = StringAnalysis(
-                                    string_value)
-                            self.strings[string_value].AddXrefFrom(
-                                self.classes[current_class.get_name()],
-                                current_method)
+                            idx = instruction.get_ref_kind()
+                            try:
+                                string_analysis = strings[idx]
+                            except KeyError:
+                                string_analysis = strings[idx] = \
+                                    self._resolve_string(vm, idx)
+                            string_analysis.AddXrefFrom(class_analysis,
+                                                        current_method)
 
                         elif op_value >= 0x52 and op_value <= 0x6d:
-                            idx_field = instruction.get_ref_kind()
-                            field_info = last_vm.get_cm_field(idx_field)
-                            field_item = last_vm.get_field_descriptor(
-                                field_info[0], field_info[2], field_info[1])
+                            idx = instruction.get_ref_kind()
+                            try:
+                                field_item = fields[idx]
+                            except KeyError:
+                                field_item = fields[idx] = self._resolve_field(
+                                    vm, idx)
                             if field_item:
                                 # read access to a field
                                 if (op_value >= 0x52 and op_value <= 0x58) or (
                                         op_value >= 0x60 and op_value <= 0x66):
-                                    self.classes[current_class.get_name(
-                                    )].AddFXrefRead(
-                                        current_method,
-                                        self.classes[current_class.get_name()],
+                                    class_analysis.AddFXrefRead(
+                                        current_method, class_analysis,
                                         field_item)
                                 # write access to a field
                                 else:
-                                    self.classes[current_class.get_name(
-                                    )].AddFXrefWrite(
-                                        current_method,
-                                        self.classes[current_class.get_name()],
+                                    class_analysis.AddFXrefWrite(
+                                        current_method, class_analysis,
                                         field_item)
 
                         off += instruction.get_length()
                 except dvm.InvalidInstruction as e:
                     warning("Invalid instruction %s" % str(e))
-            queue_classes.task_done()
 
     def get_method(self, method):
         for vm in self.vms:
             if method in vm.get_methods():
-                return MethodAnalysis(vm, method)
+                with profiling.phase("cfg"):
+                    return MethodAnalysis(vm, method)
         return None
 
     def get_method_by_name(self, class_name, method_name, method_descriptor):
@@ -951,13 +1145,147 @@ class Analysis(object):
     def get_strings_analysis(self):
         return self.strings
 
+    def search_strings(self, patterns=(), literals=(), flags=0, search=None):
+        """
+            Search many patterns at once in the strings of all the DEX files,
+            see :class:`dvm.StringSearch`
+
+            :param patterns: python regexes, searched anywhere in the strings
+            :type patterns: list of strings
+            :param literals: strings searched as is
+            :type literals: list of strings
+            :param flags: the flags of the regexes
+            :type flags: int
+            :param search: an already built search, instead of the patterns
+            :type search: :class:`dvm.StringSearch`
+
+            :rtype: a list of :class:`StringMatch`
+        """
+        if search == None:
+            search = dvm.StringSearch(patterns, literals, flags)
+        matches = []
+        for vm in self.vms:
+            matches.extend(self.get_string_matches(vm, search.search(vm)))
+        return matches
+
+    def get_string_matches(self, vm, matches):
+        """
+            Return the :class:`StringMatch` of the results of
+            :meth:`dvm.StringSearch.search` on vm, with their xrefs
+        """
+        return [StringMatch(vm, idx, value, patterns, self.strings.get(value))
+                for idx, value, patterns in matches]
+
+    def get_permission_apis(self, api_level=None):
+        """
+            Return the protected APIs called by the application, as a dict
+            :class:`MethodClassAnalysis` -> list of permissions
+
+            :param api_level: the API level of the permission mappings, the
+                              default one if None
+            :type api_level: string
+        """
+        mappings = load_api_specific_resource_module(
+            "api_permission_mappings", api_level)
+        by_methods = mappings["AOSP_PERMISSIONS_BY_METHODS"]
+
+        # The fields are not taken into account: there are no xrefs to the
+        # external fields
+        apis = {}
+        for class_analysis in self.get_external_classes():
+            for method_analysis in class_analysis.get_methods():
+                method = method_analysis.method
+                permissions = by_methods.get("%s-%s-%s" % (
+                    method.get_class_name(), method.get_name(),
+                    method.get_descriptor()))
+                if permissions:
+                    apis[method_analysis] = permissions
+        return apis
+
+    def get_permissions(self, api_level=None):
+        """
+            Return the methods which reach each permission, as a dict
+            permission -> :class:`PermissionPaths` (method -> path). The path
+            is the shortest list of methods from the method to the protected
+            API which requires the permission, both included.
+
+            The permissions are propagated backward through the xrefs once
+            per API level, so :meth:`create_xref` must have been called.
+
+            :param api_level: the API level of the permission mappings, the
+                              default one if None
+            :type api_level: string
+
+            :rtype: dict
+        """
+        key = str(api_level) if api_level else None
+        permissions = self._permissions.get(key)
+        if permissions is None:
+            permissions = self._propagate_permissions(
+                self.get_permission_apis(api_level))
+            self._permissions[key] = permissions
+        return permissions
+
+    def get_method_permissions(self, method, api_level=None):
+        """
+            Return the permissions which can be reached from method
+
+            :param method: the method
+            :type method: :class:`EncodedMethod` or :class:`ExternalMethod`
+            :param api_level: the API level of the permission mappings
+            :type api_level: string
+
+            :rtype: a list of permissions
+        """
+        return sorted(permission for permission, paths in self.get_permissions(
+            api_level).items() if method in paths)
+
+    def _propagate_permissions(self, apis):
+        # Breadth first search from all the protected APIs at once, along the
+        # callers: the frontier holds the permissions which reached each
+        # method at the previous level, and a method only records the first
+        # callee through which it reaches a permission
+        next_hops = collections.defaultdict(dict)
+        frontier = collections.defaultdict(set)
+        for method_analysis, permissions in apis.items():
+            for permission in permissions:
+                next_hops[permission][method_analysis.method] = None
+                frontier[method_analysis.method].add(permission)
+
+        while frontier:
+            reached = collections.defaultdict(set)
+            for method, permissions in frontier.items():
+                method_analysis = self.get_method_analysis(method)
+                if method_analysis is None:
+                    continue
+                for _, caller, _ in method_analysis.get_xref_from():
+                    for permission in permissions:
+                        hops = next_hops[permission]
+                        if caller not in hops:
+                            hops[caller] = method
+                            reached[caller].add(permission)
+            frontier = reached
+
+        return dict((permission, PermissionPaths(hops))
+                    for permission, hops in next_hops.items())
+
     def add(self, vm):
+        """
+            Add a DEX file, whose classes are available right away. Its xrefs,
+            and the ones to its classes, are created by the next call to
+            :meth:`create_xref`.
+        """
         self.vms.append(vm)
+        self._permissions = {}
 
         for current_class in vm.get_classes():
-            if current_class.get_name() not in self.classes:
+            current = self.classes.get(current_class.get_name())
+            if current is None or not current.internal:
                 self.classes[current_class.get_name()] = ClassAnalysis(
                     current_class, True)
+            if current is not None and not current.internal:
+                # The previous xrefs refer to the external class
+                self._stale_xref = True
 
 def is_ascii_obfuscation(vm):
     for classe in vm.get_classes():
@@ -1,10 +1,11 @@
 import sys
 import os
 import logging
+import struct
+import collections
 import types
 import random
 import string
-import imp
 
 ANDROGUARD_VERSION = "3.0-dev"
 
@@ -200,11 +201,7 @@ def is_android(filename):
     if not filename:
         return None
 
-    with open(filename, "rb") as fd:
-        f_bytes = fd.read()
-        return is_android_raw(f_bytes)
-
-    return None
+    return sniff_android(filename)[0]
 
 
 def is_android_raw(raw):
@@ -212,20 +209,225 @@ def is_android_raw(raw):
         Returns a string that describes the type of file, for common Android
         specific formats
     """
-    val = None
+    return sniff_android_raw(raw)[0]
+
+
+def sniff_android(filename):
+    """
+        Return the type of the file, like :func:`is_android`, and the names
+        of its entries if it is a ZIP file.
 
-    if raw[0:2] == b"PK" and b'META-INF/MANIFEST.MF' in raw:
-        val = "APK"
-    elif raw[0:3] == b"dex":
-        val = "DEX"
-    elif raw[0:3] == b"dey":
-        val = "DEY"
-    elif raw[0:4] == b"\x03\x00\x08\x00":
-        val = "AXML"
-    elif raw[0:4] == b"\x02\x00\x0C\x00":
-        val = b"ARSC"
+        Only the magic bytes are read and, for a ZIP file, its end of central
+        directory record and its central directory.
 
-    return val
+        @param filename : the filename
+        @rtype : a tuple (type, list of entry names or None)
+    """
+    with open(filename, "rb") as fd:
+        fd.seek(0, os.SEEK_END)
+        size = fd.tell()
+
+        def read_at(offset, length):
+            fd.seek(offset)
+            return fd.read(length)
+
+        file_type, directory = _sniff(read_at, size)
+        if file_type is _UNKNOWN_ZIP:
+            # The central directory can't be read, so look for the manifest
+            # anywhere in the file, like the ZIP readers which recover the
+            # entries from the local headers
+            fd.seek(0)
+            return _sniff_damaged_zip(fd.read()), None
+        return file_type, _get_names(directory)
+
+
+def sniff_android_raw(raw):
+    """
+        Return the type of the buffer, like :func:`is_android_raw`, and the
+        names of its entries if it is a ZIP file
+
+        @rtype : a tuple (type, list of entry names or None)
+    """
+    file_type, directory = sniff_android_directory_raw(raw)
+    return file_type, _get_names(directory)
+
+
+def sniff_android_directory_raw(raw):
+    """
+        Return the type of the buffer, like :func:`is_android_raw`, and the
+        :class:`ZipEntry` of its entries if it is a ZIP file, which can be
+        given to the APK constructor so that it doesn't read the central
+        directory again
+
+        @rtype : a tuple (type, list of :class:`ZipEntry` or None)
+    """
+    def read_at(offset, length):
+        return bytes(raw[offset:offset + length])
+
+    file_type, directory = _sniff(read_at, len(raw))
+    if file_type is _UNKNOWN_ZIP:
+        return _sniff_damaged_zip(raw), None
+    return file_type, directory
+
+
+def _get_names(directory):
+    if directory is None:
+        return None
+    return [entry.filename for entry in directory]
+
+
+_UNKNOWN_ZIP = object()
+
+_ZIP_EOCD = struct.Struct("<4s4H2LH")
+_ZIP64_EOCD_LOCATOR = struct.Struct("<4sLQL")
+_ZIP64_EOCD = struct.Struct("<4sQ2H2L4Q")
+_ZIP_CENTRAL_DIRECTORY = struct.Struct("<4s4B4HL2L5H2L")
+
+
+def _sniff(read_at, size):
+    header = read_at(0, 4)
+    if header[0:2] == b"PK":
+        directory = get_zip_directory(read_at, size)
+        if directory is None:
+            return _UNKNOWN_ZIP, None
+        if any(entry.filename == "META-INF/MANIFEST.MF"
+               for entry in directory):
+            return "APK", directory
+        return None, directory
+    elif header[0:3] == b"dex":
+        return "DEX", None
+    elif header[0:3] == b"dey":
+        return "DEY", None
+    elif header[0:4] == b"\x03\x00\x08\x00":
+        return "AXML", None
+    elif header[0:4] == b"\x02\x00\x0C\x00":
+        return "ARSC", None
+    return None, None
+
+
+def _sniff_damaged_zip(raw):
+    if b"META-INF/MANIFEST.MF" in raw:
+        return "APK"
+    return None
+
+
+# An entry of the central directory of a ZIP file, with the names of the
+# attributes of zipfile.ZipInfo. header_offset is the offset of the local
+# header in the file, including the data prepended to the archive.
+ZipEntry = collections.namedtuple("ZipEntry", [
+    "filename", "header_offset", "compress_type", "compress_size",
+    "file_size", "CRC", "flag_bits"])
+
+
+def _get_zip64_extra(extra, file_size, compress_size, header_offset):
+    idx = 0
+    while idx + 4 <= len(extra):
+        tag, length = struct.unpack("<2H", extra[idx:idx + 4])
+        if tag == 0x0001:
+            data = extra[idx + 4:idx + 4 + length]
+            values = struct.unpack("<%dQ" % (len(data) // 8),
+                                   data[:len(data) // 8 * 8])
+            fields = [file_size, compress_size, header_offset]
+            pos = 0
+            for num, value in enumerate(fields):
+                if value == 0xFFFFFFFF and pos < len(values):
+                    fields[num] = values[pos]
+                    pos += 1
+            return fields
+        idx += 4 + length
+    return file_size, compress_size, header_offset
+
+
+def get_zip_directory(read_at, size):
+    """
+        Return the :class:`ZipEntry` of each entry of a ZIP file, in the
+        order of its central directory, or None if it can't be found
+
+        :param read_at: a function returning `length` bytes at `offset`
+        :param size: the size of the file
+    """
+    # The end of central directory record is followed by a comment of at
+    # most 64KB
+    tail_size = min(size, _ZIP_EOCD.size + 0xFFFF)
+    tail_offset = size - tail_size
+    tail = read_at(tail_offset, tail_size)
+
+    pos = tail.rfind(b"PK\x05\x06")
+    while pos >= 0 and len(tail) - pos < _ZIP_EOCD.size:
+        pos = tail.rfind(b"PK\x05\x06", 0, pos)
+    if pos < 0:
+        return None
+
+    eocd_offset = tail_offset + pos
+    (_, _, _, _, nb_entries, cd_size, cd_offset,
+     _) = _ZIP_EOCD.unpack(tail[pos:pos + _ZIP_EOCD.size])
+    directory_end = eocd_offset
+
+    if pos >= _ZIP64_EOCD_LOCATOR.size:
+        locator = _ZIP64_EOCD_LOCATOR.unpack(
+            tail[pos - _ZIP64_EOCD_LOCATOR.size:pos])
+        if locator[0] == b"PK\x06\x07":
+            directory_end = eocd_offset - _ZIP64_EOCD_LOCATOR.size - \
+                _ZIP64_EOCD.size
+            record = read_at(directory_end, _ZIP64_EOCD.size)
+            if len(record) != _ZIP64_EOCD.size or record[:4] != b"PK\x06\x06":
+                return None
+            (_, _, _, _, _, _, _, nb_entries, cd_size,
+             cd_offset) = _ZIP64_EOCD.unpack(record)
+
+    # Data may be prepended to the archive, which shifts all the offsets
+    concat = directory_end - cd_size - cd_offset
+    if concat < 0:
+        return None
+
+    directory = read_at(cd_offset + concat, cd_size)
+    entries = []
+    idx = 0
+    header_size = _ZIP_CENTRAL_DIRECTORY.size
+    while idx + header_size <= len(directory):
+        header = _ZIP_CENTRAL_DIRECTORY.unpack(
+            directory[idx:idx + header_size])
+        if header[0] != b"PK\x01\x02":
+            return None
+        (flags, compress_type, crc, compress_size, file_size, name_size,
+         extra_size, comment_size, header_offset) = (
+            header[5], header[6], header[9], header[10], header[11],
+            header[12], header[13], header[14], header[18])
+
+        start = idx + header_size
+        name = directory[start:start + name_size]
+        if flags & 0x800:
+            name = name.decode("utf-8", "replace")
+        else:
+            name = name.decode("cp437")
+        # Like zipfile, the names end at the first null byte
+        null_byte = name.find(u"\x00")
+        if null_byte >= 0:
+            name = name[:null_byte]
+
+        if 0xFFFFFFFF in (file_size, compress_size, header_offset):
+            extra = directory[start + name_size:start + name_size + extra_size]
+            file_size, compress_size, header_offset = _get_zip64_extra(
+                extra, file_size, compress_size, header_offset)
+
+        entries.append(ZipEntry(name, header_offset + concat, compress_type,
+                                compress_size, file_size, crc, flags))
+        idx += header_size + name_size + extra_size + comment_size
+
+    if len(entries) != nb_entries and nb_entries != 0xFFFF:
+        return None
+    return entries
+
+
+def get_zip_entries(read_at, size):
+    """
+        Return the names of the entries of a ZIP file, read from its central
+        directory, or None if it can't be found
+
+        :param read_at: a function returning `length` bytes at `offset`
+        :param size: the size of the file
+    """
+    return _get_names(get_zip_directory(read_at, size))
 
 
 # Init Logger
@@ -252,7 +454,12 @@ def set_info():
 
 
 def get_debug():
-    return log_andro.getEffectiveLevel() == logging.DEBUG
+    """Return True if the debug messages are emitted.
+
+    Hot loops should check it once, outside of the loop, before building
+    their messages.
+    """
+    return log_runtime.isEnabledFor(logging.DEBUG)
 
 
 def warning(x):
@@ -266,12 +473,14 @@ def error(x):
     raise ()
 
 
-def debug(x):
-    log_runtime.debug(x)
+def debug(x, *args):
+    """Log a debug message. The message is only formatted with `args` if
+    it is emitted, so do not format it before the call."""
+    log_runtime.debug(x, *args)
 
 
-def info(x):
-    log_runtime.info(x)
+def info(x, *args):
+    log_runtime.info(x, *args)
 
 
 def set_options(key, value):
@@ -362,20 +571,14 @@ def color_range(startcolor, goalcolor, steps):
 
 
 def load_api_specific_resource_module(resource_name, api):
-    # Those two imports are quite slow.
-    from androguard.core.api_specific_resources.aosp_permissions.aosp_permissions import AOSP_PERMISSIONS
-    from androguard.core.api_specific_resources.api_permission_mappings.api_permission_mappings import AOSP_PERMISSIONS_MAPPINGS
-
-    if resource_name == "aosp_permissions":
-        module = AOSP_PERMISSIONS
-    elif resource_name == "api_permission_mappings":
-        module = AOSP_PERMISSIONS_MAPPINGS
-    else:
+    from androguard.core import api_specific_resources
+
+    if resource_name not in api_specific_resources.RESOURCES:
         error("Invalid resource: %s" % resource_name)
 
     if not api:
         api = CONF["DEFAULT_API"]
-    value = module.get(api)
+    value = api_specific_resources.load_resource(resource_name, api)
     if value:
         return value
-    return module.get('9')
+    return api_specific_resources.load_resource(resource_name, '9')
@@ -1 +1,54 @@
+"""
+Resources which depend on the API level: the AOSP permissions and the
+mappings between the API and the permissions.
 
+Each resource is stored as a gzipped JSON file per API level, in the
+directory named after the resource. A file is only loaded the first time its
+API level is requested, and then shared by all its users.
+"""
+import gzip
+import io
+import json
+import pkgutil
+import threading
+
+RESOURCES = ("aosp_permissions", "api_permission_mappings")
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+def load_resource(resource_name, api):
+    """
+        Return the resource `resource_name` of the API level `api`, or None if
+        it is not available for this API level
+
+        :param resource_name: "aosp_permissions" or "api_permission_mappings"
+        :type resource_name: string
+        :param api: the API level
+        :type api: string or int
+
+        :rtype: dict
+    """
+    key = (resource_name, str(api))
+    try:
+        return _loaded[key]
+    except KeyError:
+        pass
+
+    with _lock:
+        if key not in _loaded:
+            _loaded[key] = _read_resource(*key)
+        return _loaded[key]
+
+
+def _read_resource(resource_name, api):
+    if resource_name not in RESOURCES or not api.isdigit():
+        return None
+    try:
+        raw = pkgutil.get_data(__name__, "%s/%s_api%s.json.gz" %
+                               (resource_name, resource_name, api))
+    except IOError:
+        return None
+    with gzip.GzipFile(fileobj=io.BytesIO(raw)) as fd:
+        return json.loads(fd.read().decode("utf-8"))
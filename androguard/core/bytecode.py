@@ -5,11 +5,11 @@ from builtins import str
 from builtins import range
 from builtins import object
 import hashlib
-from xml.sax.saxutils import escape
 from struct import unpack, pack
 import textwrap
 
 import json
+from androguard.util import escape
 from .androconf import warning, error, CONF, enable_colors, remove_colors, save_colors, color_range
 
 
@@ -1,39 +1,41 @@
 from __future__ import division
 from __future__ import print_function
 
-from future import standard_library
-standard_library.install_aliases()
+import sys
+if sys.version_info[0] < 3:
+    from future import standard_library
+    standard_library.install_aliases()
 from builtins import chr
 from builtins import str
 from builtins import range
 from builtins import object
 from androguard.core import bytecode
 from androguard.core import androconf
+from androguard.core import profiling
+from androguard.core import zipstorage
 from androguard.core.bytecodes.dvm_permissions import DVM_PERMISSIONS
-from androguard.util import read
-
-from androguard.core.resources import public
+from androguard.util import read, escape
 
+import array
 import io
+import json
+import mmap
 from struct import pack, unpack
-from xml.sax.saxutils import escape
 from zlib import crc32
 import re
 import collections
 import sys
 import binascii
+import hashlib
+import threading
 
 from xml.dom import minidom
 
-# Used for reading Certificates
-from pyasn1.codec.der.decoder import decode
-from pyasn1.codec.der.encoder import encode
-from cryptography import x509
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes
-
 NS_ANDROID_URI = 'http://schemas.android.com/apk/res/android'
 
+# The PKCS#7 signature blocks, which hold the certificates
+SIGNATURE_EXPR = re.compile(r"^(META-INF/)(.*)(\.RSA|\.EC|\.DSA)$")
+
 # 0: chilkat
 # 1: default python zipfile module
 # 2: patch zipfile module
@@ -132,6 +134,21 @@ class FileNotPresent(Error):
 
 
 ######################################################## APK FORMAT ########################################################
+# Whether a magic module is installed, see _has_magic
+_MAGIC = None
+
+
+def _has_magic():
+    global _MAGIC
+    if _MAGIC is None:
+        try:
+            import magic
+            _MAGIC = True
+        except ImportError:
+            _MAGIC = False
+    return _MAGIC
+
+
 class APK(object):
     """
         This class can access to all elements in an APK file
@@ -141,12 +158,16 @@ class APK(object):
         :param mode: specify the mode to open the file (optional)
         :param magic_file: specify the magic file (optional)
         :param zipmodule: specify the type of zip module to use (0:chilkat, 1:zipfile, 2:patch zipfile)
+        :param zip_directory: the central directory of the file, as returned
+                              by :func:`androconf.sniff_android_directory_raw`,
+                              if it has already been read (optional)
 
         :type filename: string
         :type raw: boolean
         :type mode: string
         :type magic_file: string
         :type zipmodule: int
+        :type zip_directory: list of :class:`androconf.ZipEntry`
 
         :Example:
           APK("myfile.apk")
@@ -159,7 +180,8 @@ class APK(object):
                  mode="r",
                  magic_file=None,
                  zipmodule=ZIPMODULE,
-                 skip_analysis=False):
+                 skip_analysis=False,
+                 zip_directory=None):
         self.filename = filename
 
         self.xml = {}
@@ -178,13 +200,88 @@ class APK(object):
         self.files = {}
         self.files_crc32 = {}
 
+        self._signature_names = None
+        self._certificates_der = {}
+        self._fingerprints = {}
+        self._certificates = {}
+
         self.magic_file = magic_file
 
         if raw is True:
-            self.__raw = bytearray(filename)
+            if isinstance(filename, (bytes, bytearray)):
+                self.__raw = filename
+            else:
+                self.__raw = bytearray(filename)
+        elif self.zipmodule == 1 and self.mode == "r":
+            self.__raw = zipstorage.map_file(filename)
         else:
             self.__raw = bytearray(read(filename))
 
+        with profiling.phase("zip"):
+            self._open_zip(zip_directory)
+
+        if not skip_analysis:
+            with profiling.phase("manifest"):
+                for i in self.zip.namelist():
+                    if i == "AndroidManifest.xml":
+                        self.axml[i] = AXMLPrinter(self._read_uncached(i))
+                        try:
+                            self.xml[i] = minidom.parseString(self.axml[i].get_buff())
+                        except Exception as e:
+                            androconf.warning("AXML parsing failed", e)
+                            self.xml[i] = None
+
+                        if self.xml[i] != None:
+                            self.package = self.xml[i].documentElement.getAttribute(
+                                "package")
+                            self.androidversion[
+                                "Code"
+                            ] = self.xml[i].documentElement.getAttributeNS(
+                                NS_ANDROID_URI, "versionCode")
+                            self.androidversion[
+                                "Name"
+                            ] = self.xml[i].documentElement.getAttributeNS(
+                                NS_ANDROID_URI, "versionName")
+
+                            for item in self.xml[i].getElementsByTagName('uses-permission'):
+                                self.permissions.append(str(item.getAttributeNS(
+                                    NS_ANDROID_URI, "name")))
+
+                            # getting details of the declared permissions
+                            for d_perm_item in self.xml[i].getElementsByTagName('permission'):
+                                d_perm_name = self._get_res_string_value(str(
+                                    d_perm_item.getAttributeNS(NS_ANDROID_URI, "name")))
+                                d_perm_label = self._get_res_string_value(str(
+                                    d_perm_item.getAttributeNS(NS_ANDROID_URI,
+                                                               "label")))
+                                d_perm_description = self._get_res_string_value(str(
+                                    d_perm_item.getAttributeNS(NS_ANDROID_URI,
+                                                               "description")))
+                                d_perm_permissionGroup = self._get_res_string_value(str(
+                                    d_perm_item.getAttributeNS(NS_ANDROID_URI,
+                                                               "permissionGroup")))
+                                d_perm_protectionLevel = self._get_res_string_value(str(
+                                    d_perm_item.getAttributeNS(NS_ANDROID_URI,
+                                                               "protectionLevel")))
+
+                                d_perm_details = {
+                                    "label": d_perm_label,
+                                    "description": d_perm_description,
+                                    "permissionGroup": d_perm_permissionGroup,
+                                    "protectionLevel": d_perm_protectionLevel,
+                                }
+                                self.declared_permissions[d_perm_name] = d_perm_details
+
+                            self.valid_apk = True
+
+            with profiling.phase("files types"):
+                self.get_files_types()
+            with profiling.phase("permissions"):
+                self.permission_module = androconf.load_api_specific_resource_module(
+                    "aosp_permissions", self.get_target_sdk_version())
+
+
+    def _open_zip(self, directory=None):
         if self.zipmodule == 0:
             self.zip = ChilkatZip(self.__raw)
         elif self.zipmodule == 2:
@@ -192,84 +289,35 @@ class APK(object):
             self.zip = zipfile.ZipFile(io.BytesIO(self.__raw), mode=self.mode)
         else:
             import zipfile
+            if self.mode == "r":
+                try:
+                    self.zip = zipstorage.ZipStorage(self.__raw,
+                                                     entries=directory)
+                    return
+                except zipfile.BadZipfile:
+                    # Let zipfile report the damaged archives
+                    pass
             self.zip = zipfile.ZipFile(io.BytesIO(self.__raw), mode=self.mode)
 
-        if not skip_analysis:
-            for i in self.zip.namelist():
-                if i == "AndroidManifest.xml":
-                    self.axml[i] = AXMLPrinter(self.zip.read(i))
-                    try:
-                        self.xml[i] = minidom.parseString(self.axml[i].get_buff())
-                    except Exception as e:
-                        androconf.warning("AXML parsing failed", e)
-                        self.xml[i] = None
-
-                    if self.xml[i] != None:
-                        self.package = self.xml[i].documentElement.getAttribute(
-                            "package")
-                        self.androidversion[
-                            "Code"
-                        ] = self.xml[i].documentElement.getAttributeNS(
-                            NS_ANDROID_URI, "versionCode")
-                        self.androidversion[
-                            "Name"
-                        ] = self.xml[i].documentElement.getAttributeNS(
-                            NS_ANDROID_URI, "versionName")
-
-                        for item in self.xml[i].getElementsByTagName('uses-permission'):
-                            self.permissions.append(str(item.getAttributeNS(
-                                NS_ANDROID_URI, "name")))
-
-                        # getting details of the declared permissions
-                        for d_perm_item in self.xml[i].getElementsByTagName('permission'):
-                            d_perm_name = self._get_res_string_value(str(
-                                d_perm_item.getAttributeNS(NS_ANDROID_URI, "name")))
-                            d_perm_label = self._get_res_string_value(str(
-                                d_perm_item.getAttributeNS(NS_ANDROID_URI,
-                                                           "label")))
-                            d_perm_description = self._get_res_string_value(str(
-                                d_perm_item.getAttributeNS(NS_ANDROID_URI,
-                                                           "description")))
-                            d_perm_permissionGroup = self._get_res_string_value(str(
-                                d_perm_item.getAttributeNS(NS_ANDROID_URI,
-                                                           "permissionGroup")))
-                            d_perm_protectionLevel = self._get_res_string_value(str(
-                                d_perm_item.getAttributeNS(NS_ANDROID_URI,
-                                                           "protectionLevel")))
-
-                            d_perm_details = {
-                                "label": d_perm_label,
-                                "description": d_perm_description,
-                                "permissionGroup": d_perm_permissionGroup,
-                                "protectionLevel": d_perm_protectionLevel,
-                            }
-                            self.declared_permissions[d_perm_name] = d_perm_details
-
-                        self.valid_apk = True
-
-            self.get_files_types()
-            self.permission_module = androconf.load_api_specific_resource_module(
-                "aosp_permissions", self.get_target_sdk_version())
-
-
     def __getstate__(self):
-        # Upon pickling, we need to remove the ZipFile
-        x = self.__dict__
+        # Upon pickling, we need to remove the ZipFile, and the certificate
+        # objects, which can't be pickled
+        x = self.__dict__.copy()
         del x['zip']
+        x['_certificates'] = {}
+        if isinstance(self.__raw, mmap.mmap):
+            x['_APK__raw'] = self.__raw[:]
 
         return x
 
     def __setstate__(self, state):
         self.__dict__ = state
+        self.__dict__.setdefault('_signature_names', None)
+        self.__dict__.setdefault('_certificates_der', {})
+        self.__dict__.setdefault('_fingerprints', {})
+        self.__dict__.setdefault('_certificates', {})
 
-        if self.zipmodule == 0:
-            self.zip = ChilkatZip(self.__raw)
-        elif self.zipmodule == 2:
-            from androguard.patch import zipfile
-            self.zip = zipfile.ZipFile(io.BytesIO(self.__raw), mode=self.mode)
-        else:
-            import zipfile
-            self.zip = zipfile.ZipFile(io.BytesIO(self.__raw), mode=self.mode)
+        self._open_zip()
 
     def _get_res_string_value(self, string):
         if not string.startswith('@string/'):
@@ -462,13 +510,32 @@ class APK(object):
         """
         if self.files == {}:
             # Generate File Types / CRC List
+            if not _has_magic():
+                # The files don't need to be read to get "Unknown"
+                for i in self.get_files():
+                    self.files[i] = "Unknown"
+                return self.files
+
             for i in self.get_files():
-                buffer = self.zip.read(i)
-                self.files_crc32[i] = crc32(buffer)
+                buffer, self.files_crc32[i] = self._read_file_crc32(i)
                 self.files[i] = self._get_file_magic_name(buffer)
 
         return self.files
 
+    def _read_uncached(self, filename):
+        # The data of the file, without keeping it in the cache of the
+        # ZipStorage, for the files which are read once
+        if isinstance(self.zip, zipstorage.ZipStorage):
+            return self.zip.read(filename, cache=False)
+        return self.zip.read(filename)
+
+    def _read_file_crc32(self, filename):
+        # The data of the file, and its CRC checked against the data
+        buffer = self._read_uncached(filename)
+        if isinstance(self.zip, zipstorage.ZipStorage):
+            return buffer, self.zip.get_crc32(filename)
+        return buffer, crc32(buffer) & 0xFFFFFFFF
+
     def _patch_magic(self, buffer, orig):
         if ("Zip" in orig) or ("DBase" in orig):
             val = androconf.is_android_raw(buffer)
@@ -482,13 +549,20 @@ class APK(object):
     def get_files_crc32(self):
         """
         Calculates and returns a dictionary of filenames and CRC32
-        
+
+        The CRCs are the ones of the data itself, not the ones claimed by the
+        central directory: a tampered file raises BadZipfile. They are
+        computed on the first call.
+
         :return: dict of filename: CRC32
         """
-        if self.files_crc32 == {}:
-            for i in self.get_files():
-                buffer = self.zip.read(i)
-                self.files_crc32[i] = crc32(buffer)
+        for i in self.get_files():
+            if i in self.files_crc32:
+                continue
+            if isinstance(self.zip, zipstorage.ZipStorage):
+                self.files_crc32[i] = self.zip.get_crc32(i)
+            else:
+                self.files_crc32[i] = self._read_file_crc32(i)[1]
 
         return self.files_crc32
 
@@ -503,9 +577,10 @@ class APK(object):
 
     def get_raw(self):
         """
-            Return raw bytes of the APK
+            Return raw bytes of the APK, mapped in memory if it was read from
+            a file
 
-            :rtype: string
+            :rtype: bytes, bytearray or mmap
         """
         return self.__raw
 
@@ -531,21 +606,59 @@ class APK(object):
         except FileNotPresent:
             return ""
 
+    def get_dex_names(self):
+        """
+            Return the names of the classes dex files, in the order they are
+            loaded: classes.dex, classes2.dex... up to the first missing one
+
+            :rtype: a list of strings
+        """
+        files = set(self.get_files())
+        names = []
+        name = "classes.dex"
+        while name in files:
+            names.append(name)
+            name = "classes%d.dex" % (len(names) + 1)
+        return names
+
     def get_all_dex(self):
         """
             Return the raw data of all classes dex files
 
             :rtype: a generator
         """
-        try:
-            yield self.get_file("classes.dex")
+        for name in self.get_dex_names():
+            yield self.get_file(name)
 
-            # Multidex support
-            basename = "classes%d.dex"
-            for i in range(2, sys.maxsize):
-                yield self.get_file(basename % i)
-        except FileNotPresent:
-            pass
+    def read_files(self, filenames, max_workers=None):
+        """
+            Return the raw data of the files, which are inflated concurrently,
+            as zlib does not hold the GIL
+
+            :param filenames: the names of the files
+            :type filenames: list of strings
+            :param max_workers: the maximum number of threads, the number of
+                                CPUs by default
+            :type max_workers: int
+
+            :rtype: a list of bytes
+        """
+        import multiprocessing
+        if max_workers is None:
+            max_workers = multiprocessing.cpu_count()
+        max_workers = min(max_workers, len(filenames))
+
+        # zipfile and Chilkat read from a shared file
+        if max_workers <= 1 or not isinstance(self.zip, zipstorage.ZipStorage):
+            return [self.get_file(name) for name in filenames]
+
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(max_workers)
+        try:
+            return pool.map(self.get_file, filenames)
+        finally:
+            pool.close()
+            pool.join()
 
     def get_elements(self, tag_name, attribute):
         """
@@ -755,7 +868,7 @@ class APK(object):
         aosp_permissions = []
         all_permissions = self.get_requested_permissions()
         for perm in all_permissions:
-            if perm in list(self.permission_module["AOSP_PERMISSIONS"].keys()):
+            if perm in self.permission_module["AOSP_PERMISSIONS"]:
                 aosp_permissions.append(perm)
         return aosp_permissions
 
@@ -783,7 +896,7 @@ class APK(object):
         third_party_permissions = []
         all_permissions = self.get_requested_permissions()
         for perm in all_permissions:
-            if perm not in list(self.permission_module["AOSP_PERMISSIONS"].keys()):
+            if perm not in self.permission_module["AOSP_PERMISSIONS"]:
                 third_party_permissions.append(perm)
         return third_party_permissions
 
@@ -835,29 +948,63 @@ class APK(object):
         """
         return self.get_elements("uses-library", "name")
 
+    def get_certificate_der(self, filename):
+        """
+            Return the DER encoding of the first certificate of the signature
+            file filename
+
+            :rtype: bytes
+        """
+        try:
+            return self._certificates_der[filename]
+        except KeyError:
+            pass
+        der = get_pkcs7_certificate_der(self.get_file(filename))
+        self._certificates_der[filename] = der
+        return der
+
     def get_certificate(self, filename):
         """
             Return a certificate object by giving the name in the apk file
+
+            The certificates are parsed once, and shared with the other APKs
+            signed by the same certificate, see :class:`CertificateCache`.
+
+            :rtype: :class:`cryptography.x509.Certificate`
         """
-        pkcs7message = self.get_file(filename)
-
-        message, _ = decode(pkcs7message)
-        cert = encode(message[1][3])
-        # Remove the first identifier
-        # byte 0 == identifier, skip
-        # byte 1 == length. If byte1 & 0x80 > 1, we have long format
-        #                   The length of to read bytes is then coded
-        #                   in byte1 & 0x7F
-        l = cert[1]
-        # Python2 compliance
-        if not isinstance(l, int):
-            l = ord(l)
-        cert = cert[2 + (l & 0x7F) if l & 0x80 > 1 else 2:]
-    
-        certificate = x509.load_der_x509_certificate(cert, default_backend())
-    
+        try:
+            return self._certificates[filename]
+        except KeyError:
+            pass
+        certificate = CERTIFICATE_CACHE.get(self.get_certificate_der(filename))
+        self._certificates[filename] = certificate
         return certificate
 
+    def get_certificates(self):
+        """
+            Return the certificate of each signature file
+
+            :rtype: a list of :class:`cryptography.x509.Certificate`
+        """
+        return [self.get_certificate(name)
+                for name in self.get_signature_names() or []]
+
+    def get_certificate_fingerprints(self, filename):
+        """
+            Return the SHA-1 and SHA-256 fingerprints of the certificate of
+            the signature file filename, in hexadecimal, by algorithm
+
+            :rtype: dict
+        """
+        try:
+            return self._fingerprints[filename]
+        except KeyError:
+            pass
+        fingerprints = get_certificate_fingerprints(
+            self.get_certificate_der(filename))
+        self._fingerprints[filename] = fingerprints
+        return fingerprints
+
     def new_zip(self, filename, deleted_files=None, new_files={}):
         """
             Create a new zip file
@@ -922,8 +1069,9 @@ class APK(object):
                 # There is a rare case, that no resource file is supplied.
                 # Maybe it was added manually, thus we check here
                 return None
-            self.arsc["resources.arsc"] = ARSCParser(self.zip.read(
-                "resources.arsc"))
+            with profiling.phase("arsc"):
+                self.arsc["resources.arsc"] = ARSCParser(self.zip.read(
+                    "resources.arsc"))
             return self.arsc["resources.arsc"]
 
     def get_signature_name(self):
@@ -936,15 +1084,12 @@ class APK(object):
         """
              Return a list of the signature file names.
         """
-        signature_expr = re.compile("^(META-INF/)(.*)(\.RSA|\.EC|\.DSA)$")
-        signatures = []
+        if self._signature_names is None:
+            self._signature_names = [i for i in self.get_files()
+                                     if SIGNATURE_EXPR.search(i)]
 
-        for i in self.get_files():
-            if signature_expr.search(i):
-                signatures.append(i)
-
-        if len(signatures) > 0:
-            return signatures
+        if len(self._signature_names) > 0:
+            return list(self._signature_names)
 
         return None
 
@@ -958,27 +1103,22 @@ class APK(object):
         """
             Return a list of the data of the signature files.
         """
-        signature_expr = re.compile("^(META-INF/)(.*)(\.RSA|\.EC|\.DSA)$")
-        signature_datas = []
-
-        for i in self.get_files():
-            if signature_expr.search(i):
-                signature_datas.append(self.get_file(i))
-
-        if len(signature_datas) > 0:
-            return signature_datas
+        signature_names = self.get_signature_names()
+        if signature_names is None:
+            return None
 
-        return None
+        return [self.get_file(i) for i in signature_names]
 
     def show(self):
         self.get_files_types()
 
+        files_crc32 = self.get_files_crc32()
         print("FILES: ")
         for i in self.get_files():
             try:
-                print("\t", i, self.files[i], "%x" % self.files_crc32[i])
+                print("\t", i, self.files[i], "%x" % files_crc32[i])
             except KeyError:
-                print("\t", i, "%x" % self.files_crc32[i])
+                print("\t", i, "%x" % files_crc32[i])
 
         print("DECLARED PERMISSIONS:")
         declared_permissions = self.get_declared_permissions()
@@ -1017,6 +1157,194 @@ class APK(object):
             show_Certificate(self.get_certificate(c))
 
 
+def _read_der_header(data, offset):
+    """
+        Return the (tag, start, end) of the content of the DER element at
+        offset of data, a bytearray
+    """
+    if offset + 2 > len(data):
+        raise ValueError("truncated DER element")
+    tag = data[offset]
+    length = data[offset + 1]
+    offset += 2
+    if length & 0x80:
+        nb_bytes = length & 0x7F
+        # 0x80 is the indefinite length of BER
+        if nb_bytes == 0 or offset + nb_bytes > len(data):
+            raise ValueError("unsupported DER length")
+        length = 0
+        for byte in data[offset:offset + nb_bytes]:
+            length = length << 8 | byte
+        offset += nb_bytes
+    if offset + length > len(data):
+        raise ValueError("truncated DER element")
+    return tag, offset, offset + length
+
+
+def _get_pkcs7_certificate_der(data):
+    data = bytearray(data)
+
+    # ContentInfo: SEQUENCE { contentType, [0] EXPLICIT SignedData }
+    tag, start, _ = _read_der_header(data, 0)
+    if tag != 0x30:
+        raise ValueError("not a PKCS#7 ContentInfo")
+    _, _, offset = _read_der_header(data, start)
+    tag, start, _ = _read_der_header(data, offset)
+    if tag != 0xA0:
+        raise ValueError("no PKCS#7 content")
+
+    # SignedData: SEQUENCE { version, digestAlgorithms, contentInfo,
+    #                        [0] IMPLICIT certificates OPTIONAL, ... }
+    tag, offset, _ = _read_der_header(data, start)
+    if tag != 0x30:
+        raise ValueError("not a PKCS#7 SignedData")
+    for _ in range(3):
+        _, _, offset = _read_der_header(data, offset)
+    tag, start, _ = _read_der_header(data, offset)
+    if tag != 0xA0:
+        raise ValueError("no certificates in the PKCS#7 SignedData")
+
+    _, _, end = _read_der_header(data, start)
+    return bytes(data[start:end])
+
+
+def get_pkcs7_certificate_der(pkcs7message):
+    """
+        Return the DER encoding of the first certificate of a PKCS#7 signature
+        block, like the META-INF/*.RSA files
+
+        :param pkcs7message: the signature block
+        :type pkcs7message: bytes
+
+        :rtype: bytes
+    """
+    try:
+        return _get_pkcs7_certificate_der(pkcs7message)
+    except (ValueError, IndexError):
+        pass
+
+    # BER encodings, with indefinite lengths, need a full decoder
+    from pyasn1.codec.der.decoder import decode
+    from pyasn1.codec.der.encoder import encode
+
+    message, _ = decode(pkcs7message)
+    cert = encode(message[1][3])
+    # Remove the first identifier
+    # byte 0 == identifier, skip
+    # byte 1 == length. If byte1 & 0x80 > 1, we have long format
+    #                   The length of to read bytes is then coded
+    #                   in byte1 & 0x7F
+    l = cert[1]
+    # Python2 compliance
+    if not isinstance(l, int):
+        l = ord(l)
+    return cert[2 + (l & 0x7F) if l & 0x80 > 1 else 2:]
+
+
+def get_certificate_fingerprints(der):
+    """
+        Return the SHA-1 and SHA-256 fingerprints of a certificate, in
+        hexadecimal, by algorithm
+
+        :param der: the DER encoding of the certificate
+        :type der: bytes
+
+        :rtype: dict
+    """
+    return collections.OrderedDict([
+        ("sha1", hashlib.sha1(der).hexdigest()),
+        ("sha256", hashlib.sha256(der).hexdigest()),
+    ])
+
+
+class CertificateCache(object):
+    """
+        The parsed certificates, by the SHA-256 of their DER encoding
+
+        A single cache is shared by all the APKs, as most of the apps are
+        signed by a few certificates. Beyond maxsize certificates, the least
+        recently used ones are dropped.
+
+        :param maxsize: the maximum number of certificates kept
+        :type maxsize: int
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._certificates = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, der):
+        """
+            Return the certificate of the DER encoding der
+
+            :rtype: :class:`cryptography.x509.Certificate`
+        """
+        key = hashlib.sha256(der).digest()
+        with self._lock:
+            certificate = self._certificates.pop(key, None)
+            if certificate is not None:
+                self.hits += 1
+                self._certificates[key] = certificate
+                return certificate
+
+        from cryptography import x509
+        from cryptography.hazmat.backends import default_backend
+        certificate = x509.load_der_x509_certificate(der, default_backend())
+
+        with self._lock:
+            self.misses += 1
+            self._certificates[key] = certificate
+            while len(self._certificates) > self.maxsize:
+                self._certificates.popitem(last=False)
+        return certificate
+
+    def clear(self):
+        with self._lock:
+            self._certificates.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._certificates)
+
+
+# The certificates of all the APKs
+CERTIFICATE_CACHE = CertificateCache()
+
+
+def get_signature_files(filename):
+    """
+        Return the (name, data) of the signature files of an APK, reading only
+        its central directory and these files, and not the whole APK
+
+        :param filename: the path of the APK
+        :type filename: string
+
+        :rtype: a list of tuples
+    """
+    import zipfile
+    with zipfile.ZipFile(filename) as z:
+        return [(name, z.read(name)) for name in z.namelist()
+                if SIGNATURE_EXPR.search(name)]
+
+
+def get_signature_certificates(filename):
+    """
+        Return the (name, certificate) of the signature files of an APK,
+        reading only these files, see :func:`get_signature_files`
+
+        :param filename: the path of the APK
+        :type filename: string
+
+        :rtype: a list of (string, :class:`cryptography.x509.Certificate`)
+    """
+    return [(name, CERTIFICATE_CACHE.get(get_pkcs7_certificate_der(data)))
+            for name, data in get_signature_files(filename)]
+
+
 def get_Name(name, short=False):
     """
         Return the distinguished name of an X509 Certificate
@@ -1055,6 +1383,8 @@ def show_Certificate(cert, short=False):
         :type short: Boolean
     """
     
+    from cryptography.hazmat.primitives import hashes
+
     for h in [hashes.MD5, hashes.SHA1, hashes.SHA256, hashes.SHA512]:
         print("{}: {}".format(h.name, binascii.hexlify(cert.fingerprint(h())).decode("ascii")))
     print("Issuer: {}".format(get_Name(cert.issuer, short=short)))
@@ -1067,10 +1397,37 @@ def show_Certificate(cert, short=False):
 UTF8_FLAG = 0x00000100
 
 
+def _read_int32_array(buff, count):
+    """
+        Read count little endian int32 from buff, in one go
+
+        :rtype: `array.array`
+    """
+    values = array.array('i')
+    if count > 0:
+        data = buff.read(4 * count)
+        data = bytes(data[:len(data) & ~3])
+        # array.frombytes is fromstring on Python 2
+        if hasattr(values, "frombytes"):
+            values.frombytes(data)
+        else:
+            values.fromstring(data)
+        if sys.byteorder == "big":
+            values.byteswap()
+    return values
+
+
 class StringBlock(object):
+    """
+        A string pool of an AXML or ARSC file
+
+        The strings are decoded when they are requested by
+        :meth:`getString`, or all at once by :meth:`getStrings`.
+    """
 
     def __init__(self, buff, header):
         self._cache = {}
+        self._strings = None
         self.header = header
         self.stringCount = unpack('<i', buff.read(4))[0]
         self.styleOffsetCount = unpack('<i', buff.read(4))[0]
@@ -1081,16 +1438,10 @@ class StringBlock(object):
         self.stringsOffset = unpack('<i', buff.read(4))[0]
         self.stylesOffset = unpack('<i', buff.read(4))[0]
 
-        self.m_stringOffsets = []
-        self.m_styleOffsets = []
+        self.m_stringOffsets = _read_int32_array(buff, self.stringCount)
+        self.m_styleOffsets = _read_int32_array(buff, self.styleOffsetCount)
         self.m_charbuff = ""
-        self.m_styles = []
-
-        for i in range(0, self.stringCount):
-            self.m_stringOffsets.append(unpack('<i', buff.read(4))[0])
-
-        for i in range(0, self.styleOffsetCount):
-            self.m_styleOffsets.append(unpack('<i', buff.read(4))[0])
+        self.m_styles = array.array('i')
 
         size = self.header.size - self.stringsOffset
         if self.stylesOffset != 0:
@@ -1109,10 +1460,12 @@ class StringBlock(object):
             if (size % 4) != 0:
                 androconf.warning("ooo")
 
-            for i in range(0, size // 4):
-                self.m_styles.append(unpack('<i', buff.read(4))[0])
+            self.m_styles = _read_int32_array(buff, size // 4)
 
     def getString(self, idx):
+        if self._strings is not None and 0 <= idx < len(self._strings):
+            return self._strings[idx]
+
         if idx in self._cache:
             return self._cache[idx]
 
@@ -1129,6 +1482,54 @@ class StringBlock(object):
 
         return self._cache[idx]
 
+    def getStrings(self):
+        """
+            Return all the strings of the pool, decoded in one sweep, and keep
+            them
+
+            :rtype: list of string
+        """
+        if self._strings is not None:
+            return self._strings
+
+        # Indexing a bytearray gives ints on Python 2 and 3
+        charbuff = bytearray(self.m_charbuff)
+        strings = []
+        if self.m_isUTF8:
+            for offset in self.m_stringOffsets:
+                # The length in characters, then in bytes, on 1 or 2 bytes
+                str_len = charbuff[offset]
+                if str_len & 0x80:
+                    str_len = ((str_len & 0x7f) << 8) | charbuff[offset + 1]
+                    offset += 2
+                else:
+                    offset += 1
+                encoded_bytes = charbuff[offset]
+                if encoded_bytes & 0x80:
+                    encoded_bytes = ((encoded_bytes & 0x7f) << 8) | \
+                                    charbuff[offset + 1]
+                    offset += 2
+                else:
+                    offset += 1
+                strings.append(self.decode_bytes(
+                    charbuff[offset:offset + encoded_bytes], 'utf-8', str_len))
+        else:
+            for offset in self.m_stringOffsets:
+                # The length in characters, on 1 or 2 uint16
+                str_len = charbuff[offset] | (charbuff[offset + 1] << 8)
+                if str_len & 0x8000:
+                    str_len = ((str_len & 0x7fff) << 16) | \
+                              charbuff[offset + 2] | (charbuff[offset + 3] << 8)
+                    offset += 4
+                else:
+                    offset += 2
+                strings.append(self.decode_bytes(
+                    charbuff[offset:offset + str_len * 2], 'utf-16', str_len))
+
+        self._strings = strings
+        self._cache = {}
+        return strings
+
     def getStyle(self, idx):
         # FIXME
         return self.m_styles[idx]
@@ -1161,8 +1562,6 @@ class StringBlock(object):
         return string
 
     def decodeLength(self, offset, sizeof_char):
-        length = self.m_charbuff[offset]
-
         sizeof_2chars = sizeof_char << 1
         fmt_chr = 'B' if sizeof_char == 1 else 'H'
         fmt = "<2" + fmt_chr
@@ -1171,7 +1570,7 @@ class StringBlock(object):
 
         highbit = 0x80 << (8 * (sizeof_char - 1))
 
-        if (length & highbit) != 0:
+        if (length1 & highbit) != 0:
             return ((length1 & ~highbit) << (8 * sizeof_char)) | length2, sizeof_2chars
         else:
             return length1, sizeof_char
@@ -1449,6 +1848,8 @@ class AXMLParser(object):
 
         res = self.sb.getString(name)
         if not res:
+            from androguard.core.resources import public
+
             attr = self.m_resourceIDs[name]
             if attr in public.SYSTEM_RESOURCES['attributes']['inverse']:
                 res = 'android:' + public.SYSTEM_RESOURCES['attributes']['inverse'][
@@ -1675,21 +2076,47 @@ ACONFIGURATION_UI_MODE = 0x1000
 
 
 class ARSCParser(object):
+    """
+        Parse a resources.arsc file
+
+        Only the headers of the chunks are parsed here: the entries of a
+        resource are decoded the first time they are needed, and kept.
+        :meth:`get_res_configs`, :meth:`get_resolved_res_configs` and
+        :meth:`get_id` only decode the entries of the requested resource,
+        while the methods listing the resources of a package decode all of
+        them.
+
+        :param raw_buff: the resources.arsc file
+        :type raw_buff: bytes
+    """
 
     def __init__(self, raw_buff):
         self.analyzed = False
         self._resolved_strings = None
+        # config -> resource id -> resolved values, see ResourceResolver
+        self._resolved_res_configs = {}
         self.buff = bytecode.BuffHandle(raw_buff)
 
         self.header = ARSCHeader(self.buff)
         self.packageCount = unpack('<i', self.buff.read(4))[0]
 
-        self.packages = {}
+        # package name -> (package, type strings, key strings, chunks), with
+        # the chunks as (header, ARSCResTypeSpec or ARSCResType or None)
+        self._packages = {}
+        self._packages_items = None
+        # (package id, type id) -> ARSCResType of each config
+        self._res_types = collections.defaultdict(list)
+        # (package name, type name) -> ARSCResType of each config
+        self._res_types_by_name = collections.defaultdict(list)
+        # (package name, locale, type name, key) -> value, filled on demand
+        self._res_values_index = {}
+
         self.values = {}
-        self.resource_values = collections.defaultdict(collections.defaultdict)
+        # resource id -> {config: ARSCResTableEntry}, filled on demand
+        self.resource_values = {}
         self.resource_configs = collections.defaultdict(lambda: collections.defaultdict(set))
-        self.resource_keys = collections.defaultdict(
-            lambda: collections.defaultdict(collections.defaultdict))
+        # package name -> type name -> key -> resource id, filled on demand
+        self.resource_keys = collections.defaultdict(dict)
         self.stringpool_main = None
 
         # skip to the start of the first chunk
@@ -1708,14 +2135,12 @@ class ARSCParser(object):
                 self.stringpool_main = StringBlock(self.buff, res_header)
 
             elif res_header.type == RES_TABLE_PACKAGE_TYPE:
-                assert len(self.packages) < self.packageCount, "Got more packages than expected"
+                assert len(self._packages) < self.packageCount, "Got more packages than expected"
 
                 current_package = ARSCResTablePackage(self.buff, res_header)
                 package_name = current_package.get_name()
                 package_data_end = res_header.start + res_header.size
 
-                self.packages[package_name] = []
-
                 self.buff.set_idx(current_package.header.start + current_package.typeStrings)
                 type_sp_header = ARSCHeader(self.buff)
                 assert type_sp_header.type == RES_STRING_POOL_TYPE, \
@@ -1728,9 +2153,9 @@ class ARSCParser(object):
                     "Expected String Pool header, got %x" % key_sp_header.type
                 mKeyStrings = StringBlock(self.buff, key_sp_header)
 
-                self.packages[package_name].append(current_package)
-                self.packages[package_name].append(mTableStrings)
-                self.packages[package_name].append(mKeyStrings)
+                chunks = []
+                self._packages[package_name] = (current_package, mTableStrings,
+                                                mKeyStrings, chunks)
 
                 pc = PackageContext(current_package, self.stringpool_main,
                                     mTableStrings, mKeyStrings)
@@ -1745,38 +2170,26 @@ class ARSCParser(object):
                         # we are way off the package chunk; bail out
                         break
 
-                    self.packages[package_name].append(pkg_chunk_header)
-
                     if pkg_chunk_header.type == RES_TABLE_TYPE_SPEC_TYPE:
-                        self.packages[package_name].append(ARSCResTypeSpec(
-                            self.buff, pc))
+                        chunks.append((pkg_chunk_header,
+                                       ARSCResTypeSpec(self.buff, pc)))
 
                     elif pkg_chunk_header.type == RES_TABLE_TYPE_TYPE:
                         a_res_type = ARSCResType(self.buff, pc)
-                        self.packages[package_name].append(a_res_type)
+                        chunks.append((pkg_chunk_header, a_res_type))
                         self.resource_configs[package_name][a_res_type].add(
                            a_res_type.config)
+                        self._res_types[current_package.id & 0xff,
+                                        a_res_type.id & 0xff].append(a_res_type)
+                        self._res_types_by_name[package_name,
+                                                a_res_type.get_type()].append(
+                                                    a_res_type)
 
-                        entries = []
-                        for i in range(0, a_res_type.entryCount):
-                            current_package.mResId = current_package.mResId & 0xffff0000 | i
-                            entries.append((unpack('<i', self.buff.read(4))[0],
-                                            current_package.mResId))
-
-                        self.packages[package_name].append(entries)
-
-                        for entry, res_id in entries:
-                            if self.buff.end():
-                                break
-
-                            if entry != -1:
-                                ate = ARSCResTableEntry(self.buff, res_id, pc)
-                                self.packages[package_name].append(ate)
-                    elif pkg_chunk_header.type == RES_TABLE_LIBRARY_TYPE:
-                        androconf.warning("RES_TABLE_LIBRARY_TYPE chunk is not supported")
                     else:
+                        if pkg_chunk_header.type == RES_TABLE_LIBRARY_TYPE:
+                            androconf.warning("RES_TABLE_LIBRARY_TYPE chunk is not supported")
                         # silently skip other chunk types
-                        pass
+                        chunks.append((pkg_chunk_header, None))
 
                     # skip to the next chunk
                     self.buff.set_idx(pkg_chunk_header.start + pkg_chunk_header.size)
@@ -1784,80 +2197,155 @@ class ARSCParser(object):
             # move to the next resource chunk
             self.buff.set_idx(res_header.start + res_header.size)
 
+    @property
+    def packages(self):
+        """
+            The items of each package, in the order of the file: the
+            :class:`ARSCResTablePackage`, its type and key strings, then the
+            header of each chunk, followed for the type specs by the
+            :class:`ARSCResTypeSpec`, and for the types by the
+            :class:`ARSCResType`, its (offset, resource id) entries, and the
+            :class:`ARSCResTableEntry` of each entry.
+
+            All the entries are decoded the first time.
+        """
+        if self._packages_items is None:
+            packages = {}
+            for package_name, (package, mTableStrings, mKeyStrings,
+                               chunks) in self._packages.items():
+                items = [package, mTableStrings, mKeyStrings]
+                for header, chunk in chunks:
+                    items.append(header)
+                    if chunk is None:
+                        continue
+                    items.append(chunk)
+                    if header.type == RES_TABLE_TYPE_TYPE:
+                        mResId = chunk.mResId & 0xffff0000
+                        offsets = chunk.get_entries_offsets()
+                        items.append([(offset, mResId | i)
+                                      for i, offset in enumerate(offsets)])
+                        items.extend(ate for _, ate in chunk.get_entries())
+                packages[package_name] = items
+            self._packages_items = packages
+        return self._packages_items
+
+    def _get_res_types(self, rid):
+        """
+            Return the :class:`ARSCResType` of each config of the type of the
+            resource id rid
+        """
+        return self._res_types.get(((rid >> 24) & 0xff, (rid >> 16) & 0xff),
+                                   [])
+
+    def _get_res_values(self, rid):
+        """
+            Return the :class:`ARSCResTableEntry` of each config of the
+            resource id rid, as a dict
+        """
+        try:
+            return self.resource_values[rid]
+        except KeyError:
+            pass
+
+        res_options = {}
+        for res_type in self._get_res_types(rid):
+            ate = res_type.get_entry(rid & 0xffff)
+            if ate is not None:
+                res_options[res_type.config] = ate
+        self.resource_values[rid] = res_options
+        return res_options
+
+    def _get_res_keys(self, package_name, type_name):
+        """
+            Return the resource id of each key of the type type_name, as a
+            dict. Only the keys of the entries are read.
+        """
+        keys = self.resource_keys[package_name].get(type_name)
+        if keys is not None:
+            return keys
+
+        keys = {}
+        res_ids = {}
+        for res_type in self._res_types_by_name.get((package_name, type_name),
+                                                    []):
+            mResId = res_type.mResId & 0xffff0000
+            mKeyStrings = res_type.parent.mKeyStrings
+            for idx, key in res_type.get_entries_keys(res_ids):
+                res_ids[idx] = mResId | idx
+                keys[mKeyStrings.getString(key)] = mResId | idx
+        self.resource_keys[package_name][type_name] = keys
+        return keys
+
+    def _get_resource_value(self, type_name, ate):
+        """
+            Return the value of the entry ate, as listed in the values of its
+            type, or None if it is not listed
+        """
+        if type_name == "string":
+            return self.get_resource_string(ate)
+
+        elif type_name == "id":
+            if not ate.is_complex():
+                return self.get_resource_id(ate)
+
+        elif type_name == "bool":
+            if not ate.is_complex():
+                return self.get_resource_bool(ate)
+
+        elif type_name == "integer":
+            return self.get_resource_integer(ate)
+
+        elif type_name == "color":
+            return self.get_resource_color(ate)
+
+        elif type_name == "dimen":
+            return self.get_resource_dimen(ate)
+
+        return None
+
     def _analyse(self):
         if self.analyzed:
             return
 
         self.analyzed = True
 
-        for package_name in self.packages:
+        # All the values are needed
+        if self.stringpool_main is not None:
+            self.stringpool_main.getStrings()
+
+        for package_name, (_, _, _, chunks) in self._packages.items():
             self.values[package_name] = {}
 
-            nb = 3
-            while nb < len(self.packages[package_name]):
-                header = self.packages[package_name][nb]
-                if isinstance(header, ARSCHeader):
-                    if header.type == RES_TABLE_TYPE_TYPE:
-                        a_res_type = self.packages[package_name][nb + 1]
-
-                        if a_res_type.config.get_language(
-                        ) not in self.values[package_name]:
-                            self.values[package_name][
-                                a_res_type.config.get_language()
-                            ] = {}
-                            self.values[package_name][a_res_type.config.get_language(
-                            )]["public"] = []
-
-                        c_value = self.values[package_name][
-                            a_res_type.config.get_language()
-                        ]
-
-                        entries = self.packages[package_name][nb + 2]
-                        nb_i = 0
-                        for entry, res_id in entries:
-                            if entry != -1:
-                                ate = self.packages[package_name][nb + 3 + nb_i]
-
-                                self.resource_values[ate.mResId][a_res_type.config] = ate
-                                self.resource_keys[package_name][a_res_type.get_type()][ate.get_value()] = ate.mResId
-
-                                if ate.get_index() != -1:
-                                    c_value["public"].append(
-                                        (a_res_type.get_type(), ate.get_value(),
-                                         ate.mResId))
-
-                                if a_res_type.get_type() not in c_value:
-                                    c_value[a_res_type.get_type()] = []
-
-                                if a_res_type.get_type() == "string":
-                                    c_value["string"].append(
-                                        self.get_resource_string(ate))
-
-                                elif a_res_type.get_type() == "id":
-                                    if not ate.is_complex():
-                                        c_value["id"].append(
-                                            self.get_resource_id(ate))
-
-                                elif a_res_type.get_type() == "bool":
-                                    if not ate.is_complex():
-                                        c_value["bool"].append(
-                                            self.get_resource_bool(ate))
-
-                                elif a_res_type.get_type() == "integer":
-                                    c_value["integer"].append(
-                                        self.get_resource_integer(ate))
-
-                                elif a_res_type.get_type() == "color":
-                                    c_value["color"].append(
-                                        self.get_resource_color(ate))
-
-                                elif a_res_type.get_type() == "dimen":
-                                    c_value["dimen"].append(
-                                        self.get_resource_dimen(ate))
-
-                                nb_i += 1
-                        nb += 3 + nb_i - 1  # -1 to account for the nb+=1 on the next line
-                nb += 1
+            for header, a_res_type in chunks:
+                if header.type != RES_TABLE_TYPE_TYPE:
+                    continue
+
+                language = a_res_type.config.get_language()
+                if language not in self.values[package_name]:
+                    self.values[package_name][language] = {}
+                    self.values[package_name][language]["public"] = []
+
+                c_value = self.values[package_name][language]
+                res_type_name = a_res_type.get_type()
+
+                for _, ate in a_res_type.get_entries():
+                    self.resource_values.setdefault(
+                        ate.mResId, {})[a_res_type.config] = ate
+
+                    if ate.get_index() != -1:
+                        c_value["public"].append(
+                            (res_type_name, ate.get_value(),
+                             ate.mResId))
+
+                    if res_type_name not in c_value:
+                        c_value[res_type_name] = []
+
+                    value = self._get_resource_value(res_type_name, ate)
+                    if value is not None:
+                        c_value[res_type_name].append(value)
+
+        for package_name, type_name in self._res_types_by_name:
+            self._get_res_keys(package_name, type_name)
 
     def get_resource_string(self, ate):
         return [ate.get_value(), ate.get_key_data()]
@@ -1910,7 +2398,7 @@ class ARSCParser(object):
         return ["", ""]
 
     def get_packages_names(self):
-        return list(self.packages.keys())
+        return list(self._packages.keys())
 
     def get_locales(self, package_name):
         self._analyse()
@@ -2069,24 +2557,220 @@ class ARSCParser(object):
 
         return buff.encode('utf-8')
 
+    def _iter_res_types(self, package_name=None, locale=None, type_name=None):
+        for name, (_, _, _, chunks) in self._packages.items():
+            if package_name is not None and name != package_name:
+                continue
+            for header, res_type in chunks:
+                if header.type != RES_TABLE_TYPE_TYPE:
+                    continue
+                if locale is not None and \
+                        res_type.config.get_language() != locale:
+                    continue
+                if type_name is not None and res_type.get_type() != type_name:
+                    continue
+                yield name, res_type
+
+    def iter_resources(self, package_name=None, locale=None, type_name=None):
+        """
+            Yield the (package name, :class:`ARSCResType`,
+            :class:`ARSCResTableEntry`) of the entries, in the order of the
+            file. The entries are decoded one at a time, and are not kept.
+
+            :param package_name: only the entries of this package
+            :param locale: only the entries of this language ('\\x00\\x00'
+                           for the default one)
+            :param type_name: only the entries of this type
+        """
+        for name, res_type in self._iter_res_types(package_name, locale,
+                                                   type_name):
+            for _, ate in res_type.iter_entries():
+                yield name, res_type, ate
+
+    def write_resources(self, fd, package_name=None, locale=None,
+                        type_name=None, output_format="xml"):
+        """
+            Write the resources to the text file fd, as they are decoded, so
+            the memory used does not depend on the number of resources
+
+            The XML output has a <resources> element for each type and config,
+            in the style of the strings.xml files, or a single one per package
+            in the style of public.xml if type_name is "public". The JSON
+            Lines output has an object per entry.
+
+            :param fd: the file, opened in text mode
+            :param package_name: only the entries of this package
+            :param locale: only the entries of this language ('\\x00\\x00'
+                           for the default one)
+            :param type_name: only the entries of this type, or "public"
+            :param output_format: "xml" or "jsonl"
+        """
+        if output_format not in ("xml", "jsonl"):
+            raise ValueError("Unknown output format %r" % output_format)
+
+        public = type_name == "public"
+        if public:
+            type_name = None
+
+        if output_format == "xml":
+            fd.write(u'<?xml version="1.0" encoding="utf-8"?>\n')
+            fd.write(u"<packages>\n")
+
+        for name in self.get_packages_names():
+            if package_name is not None and name != package_name:
+                continue
+
+            if output_format == "xml":
+                fd.write(u'<package name="%s">\n' % _xml_attr(name))
+                if public:
+                    fd.write(u"<resources>\n")
+
+            # The public resources are listed once, whatever their configs
+            seen = set()
+            for _, res_type in self._iter_res_types(name, locale, type_name):
+                res_type_name = res_type.get_type()
+                locale_name = get_locale_name(res_type.config)
+
+                # The fields of the chunk are the same for all its entries
+                if output_format == "jsonl":
+                    template = u'{"package": %s, "type": %s, "name": %%s, ' \
+                               u'"id": %%d' % (json.dumps(name),
+                                                json.dumps(res_type_name))
+                    if public:
+                        template += u"}\n"
+                    else:
+                        template += u', "locale": %s, "config": %s, ' \
+                                    u'"value": %%s}\n' % (
+                                        json.dumps(locale_name),
+                                        json.dumps(res_type.config._get_tuple()))
+                elif not public:
+                    fd.write(u'<resources type="%s" locale="%s" config="%r">\n' % (
+                        _xml_attr(res_type_name), _xml_attr(locale_name),
+                        res_type.config))
+
+                for _, ate in res_type.iter_entries():
+                    if public:
+                        if ate.mResId in seen or ate.get_index() == -1:
+                            continue
+                        seen.add(ate.mResId)
+
+                    if output_format == "jsonl":
+                        if public:
+                            fd.write(template % (json.dumps(ate.get_value()),
+                                                 ate.mResId))
+                        else:
+                            fd.write(template % (json.dumps(ate.get_value()),
+                                                 ate.mResId,
+                                                 json.dumps(_get_json_value(ate))))
+                    elif public:
+                        fd.write(u'<public type="%s" name="%s" id="0x%08x" />\n' % (
+                            _xml_attr(res_type_name), _xml_attr(ate.get_value()),
+                            ate.mResId))
+                    else:
+                        fd.write(self._get_xml_value(res_type_name, ate))
+
+                if output_format == "xml" and not public:
+                    fd.write(u"</resources>\n")
+
+            if output_format == "xml":
+                if public:
+                    fd.write(u"</resources>\n")
+                fd.write(u"</package>\n")
+
+        if output_format == "xml":
+            fd.write(u"</packages>\n")
+
+    def _get_xml_value(self, type_name, ate):
+        """
+            Return the XML element of the entry ate, in the format of the
+            get_*_resources methods for their types
+        """
+        name = _xml_attr(ate.get_value())
+        if ate.is_complex():
+            buff = u'<item type="%s" name="%s"' % (_xml_attr(type_name), name)
+            if ate.item.id_parent:
+                buff += u' parent="0x%08x"' % ate.item.id_parent
+            buff += u">\n"
+            for item_name, item in ate.item.items:
+                buff += u'<item name="0x%08x">%s</item>\n' % (
+                    item_name, escape(item.format_value()))
+            return buff + u"</item>\n"
+
+        if type_name in ("string", "id", "bool", "integer", "color", "dimen"):
+            value = self._get_resource_value(type_name, ate)
+            if type_name == "id":
+                if len(value) == 1:
+                    return u'<item type="id" name="%s"/>\n' % name
+                return u'<item type="id" name="%s">%s</item>\n' % (
+                    name, escape(value[1]))
+            return u'<%s name="%s">%s</%s>\n' % (type_name, name,
+                                                  escape(u"%s" % value[1]),
+                                                  type_name)
+
+        return u'<item type="%s" name="%s">%s</item>\n' % (
+            _xml_attr(type_name), name, escape(ate.key.format_value()))
+
     def get_id(self, package_name, rid, locale='\x00\x00'):
-        self._analyse()
+        for res_type in self._get_res_types(rid):
+            if res_type.get_package_name() != package_name or \
+                    res_type.config.get_language() != locale:
+                continue
 
-        try:
-            for i in self.values[package_name][locale]["public"]:
-                if i[2] == rid:
-                    return i
-        except KeyError:
-            return None
+            ate = res_type.get_entry(rid & 0xffff)
+            if ate is not None and ate.get_index() != -1:
+                return res_type.get_type(), ate.get_value(), ate.mResId
+        return None
 
     class ResourceResolver(object):
-        def __init__(self, android_resources, config=None):
+        """
+            Resolve the references of the resources, in the wanted config
+
+            The resolved resources are kept in cache, a dict which
+            :class:`ARSCParser` shares between its resolvers of the same
+            config. The references of a cycle are skipped, and the resources
+            depending on them are not kept.
+        """
+        def __init__(self, android_resources, config=None, cache=None):
             self.resources = android_resources
             self.wanted_config = config
+            self.cache = {} if cache is None else cache
+            self._resolving = set()
+            self._cyclic = False
 
         def resolve(self, res_id):
+            return list(self._resolve(res_id))
+
+        def resolve_many(self, res_ids):
+            """
+                Return the resolved values of each resource id of res_ids, as
+                a dict
+            """
+            return collections.OrderedDict(
+                (res_id, self.resolve(res_id)) for res_id in res_ids)
+
+        def _resolve(self, res_id):
+            try:
+                return self.cache[res_id]
+            except KeyError:
+                pass
+
+            if res_id in self._resolving:
+                androconf.warning("Cyclic reference to the resource 0x%08x" %
+                                  res_id)
+                self._cyclic = True
+                return []
+
+            cyclic = self._cyclic
+            self._cyclic = False
+            self._resolving.add(res_id)
+
             result = []
             self._resolve_into_result(result, res_id, self.wanted_config)
+
+            self._resolving.discard(res_id)
+            if not self._cyclic:
+                self.cache[res_id] = result
+            self._cyclic |= cyclic
             return result
 
         def _resolve_into_result(self, result, res_id, config):
@@ -2108,19 +2792,35 @@ class ARSCParser(object):
             if item.is_reference():
                 res_id = item.get_data()
                 if res_id:
-                    self._resolve_into_result(
-                        result,
-                        item.get_data(),
-                        self.wanted_config)
+                    result.extend(self._resolve(res_id))
             else:
                 if complex_:
                     result.append(item.format_value())
                 else:
                     result.append((config, item.format_value()))
 
+    def _get_resolver(self, config):
+        try:
+            cache = self._resolved_res_configs[config]
+        except KeyError:
+            cache = self._resolved_res_configs[config] = {}
+        return ARSCParser.ResourceResolver(self, config, cache)
+
     def get_resolved_res_configs(self, rid, config=None):
-        resolver = ARSCParser.ResourceResolver(self, config)
-        return resolver.resolve(rid)
+        return self._get_resolver(config).resolve(rid)
+
+    def resolve_many(self, rids, config=None):
+        """
+            Return the resolved (config, value) of each resource id of rids,
+            as a dict. The references shared by the resources are resolved
+            once.
+
+            :param rids: the resource ids
+            :type rids: list of int
+            :param config: the wanted config
+            :type config: :class:`ARSCResTableConfig`
+        """
+        return self._get_resolver(config).resolve_many(rids)
 
     def get_resolved_strings(self):
         self._analyse()
@@ -2158,38 +2858,63 @@ class ARSCParser(object):
         return r
 
     def get_res_configs(self, rid, config=None):
-        self._analyse()
-
         if not rid:
             raise ValueError("'rid' should be set")
 
-        try:
-            res_options = self.resource_values[rid]
-            if len(res_options) > 1 and config:
-                return [(
-                    config,
-                    res_options[config])]
-            else:
-                return list(res_options.items())
-
-        except KeyError:
-            return []
+        res_options = self._get_res_values(rid)
+        if len(res_options) > 1 and config:
+            try:
+                return [(config, res_options[config])]
+            except KeyError:
+                return []
+        return list(res_options.items())
 
     def get_string(self, package_name, name, locale='\x00\x00'):
-        self._analyse()
+        return self.get_res_value(package_name, "string", name, locale)
+
+    def get_res_value(self, package_name, resource_type, name,
+                      locale='\x00\x00'):
+        """
+            Return the value of the resource name of type resource_type, as
+            listed in the values of the locale (for example [name, value] for
+            a string), or None
+
+            Only the entries of this resource are decoded, and the result is
+            kept.
 
+            :param package_name: the name of the package
+            :type package_name: string
+            :param resource_type: the type of the resource, like "string"
+            :type resource_type: string
+            :param name: the name of the resource
+            :type name: string
+            :param locale: the language of the config
+            :type locale: string
+        """
+        index_key = (package_name, locale, resource_type, name)
         try:
-            for i in self.values[package_name][locale]["string"]:
-                if i[0] == name:
-                    return i
+            return self._res_values_index[index_key]
         except KeyError:
-            return None
+            pass
+
+        value = None
+        rid = self.get_res_id_by_key(package_name, resource_type, name)
+        if rid is not None:
+            for res_type in self._get_res_types(rid):
+                if res_type.get_package_name() != package_name or \
+                        res_type.config.get_language() != locale:
+                    continue
+
+                ate = res_type.get_entry(rid & 0xffff)
+                if ate is not None:
+                    value = self._get_resource_value(resource_type, ate)
+                    if value is not None:
+                        break
+        self._res_values_index[index_key] = value
+        return value
 
     def get_res_id_by_key(self, package_name, resource_type, key):
-        try:
-            return self.resource_keys[package_name][resource_type][key]
-        except KeyError:
-            return None
+        return self._get_res_keys(package_name, resource_type).get(key)
 
     def get_items(self, package_name):
         self._analyse()
@@ -2286,6 +3011,104 @@ class ARSCResType(object):
 
         self.config = ARSCResTableConfig(buff)
 
+        # The offsets of the entries follow the config, and are relative to
+        # entriesStart. The entries are decoded on demand by get_entry.
+        self.buff = buff
+        self.entriesOffsets = buff.get_idx()
+        self.entriesData = self.start - ARSCHeader.SIZE + self.entriesStart
+        self._entries = {}
+
+    def get_entries_offsets(self):
+        """
+            Return the offset of each entry, -1 for the missing ones
+        """
+        return unpack('<%di' % self.entryCount,
+                      self.buff.read_at(self.entriesOffsets,
+                                        4 * self.entryCount))
+
+    def get_entry(self, idx):
+        """
+            Return the :class:`ARSCResTableEntry` idx, or None if it is
+            missing
+        """
+        try:
+            return self._entries[idx]
+        except KeyError:
+            pass
+
+        offset = -1
+        if 0 <= idx < self.entryCount:
+            offset = unpack('<i', self.buff.read_at(self.entriesOffsets + 4 * idx,
+                                                    4))[0]
+        return self._decode_entry(idx, offset)
+
+    def get_entries_keys(self, known=()):
+        """
+            Return the (idx, key) of the entries, without decoding them
+
+            :param known: the entries to skip
+            :type known: a container of idx
+        """
+        keys = []
+        for idx, offset in enumerate(self.get_entries_offsets()):
+            if offset == -1 or idx in known:
+                continue
+            ate = self._entries.get(idx)
+            if ate is not None:
+                keys.append((idx, ate.get_index()))
+                continue
+            start = self.entriesData + offset
+            if start + 8 > self.buff.size():
+                break
+            keys.append((idx, unpack('<I', self.buff.read_at(start + 4, 4))[0]))
+        return keys
+
+    def get_entries(self):
+        """
+            Return the (idx, :class:`ARSCResTableEntry`) of all the entries,
+            in the order of the table
+        """
+        entries = []
+        for idx, offset in enumerate(self.get_entries_offsets()):
+            if offset == -1:
+                continue
+            ate = self._entries.get(idx)
+            if ate is None:
+                ate = self._decode_entry(idx, offset)
+                if ate is None:
+                    break
+            entries.append((idx, ate))
+        return entries
+
+    def iter_entries(self):
+        """
+            Yield the (idx, :class:`ARSCResTableEntry`) of all the entries,
+            like :meth:`get_entries`, but without keeping the entries which
+            were not decoded yet
+        """
+        for idx, offset in enumerate(self.get_entries_offsets()):
+            if offset == -1:
+                continue
+            ate = self._entries.get(idx)
+            if ate is None:
+                ate = self._read_entry(idx, offset)
+                if ate is None:
+                    break
+            yield idx, ate
+
+    def _read_entry(self, idx, offset):
+        start = self.entriesData + offset
+        if offset == -1 or start + 8 > self.buff.size():
+            return None
+        self.buff.set_idx(start)
+        return ARSCResTableEntry(self.buff, (self.mResId & 0xffff0000) | idx,
+                                 self.parent)
+
+    def _decode_entry(self, idx, offset):
+        ate = self._read_entry(idx, offset)
+        self._entries[idx] = ate
+        return ate
+
     def get_type(self):
         return self.parent.mTableStrings.getString(self.id - 1)
 
@@ -2508,6 +3331,36 @@ class ARSCResStringPoolRef(object):
             self.data)
 
 
+def get_locale_name(config):
+    """
+        Return the locale of the :class:`ARSCResTableConfig` config, as
+        "fr" or "fr-rCA", or "" for the default one
+    """
+    language = config.get_language().replace("\x00", "")
+    country = config.get_country().replace("\x00", "")
+    if country:
+        return "%s-r%s" % (language, country)
+    return language
+
+
+def _xml_attr(value):
+    return escape(value).replace('"', "&quot;")
+
+
+def _get_json_value(ate):
+    """
+        Return the value of the entry ate: a string for a simple entry, or a
+        dict with its parent and its (name, value) items for a complex one
+    """
+    if ate.is_complex():
+        return collections.OrderedDict([
+            ("parent", ate.item.id_parent),
+            ("items", [[item_name, item.format_value()]
+                       for item_name, item in ate.item.items]),
+        ])
+    return ate.key.format_value()
+
+
 def get_arsc_info(arscobj):
     buff = ""
     for package in arscobj.get_packages_names():
@@ -5,15 +5,15 @@ from builtins import chr
 from builtins import str
 from builtins import range
 from builtins import object
-from androguard.core import bytecode, androconf
+from androguard.core import bytecode, androconf, profiling
 from androguard.core.bytecodes.apk import APK
 from androguard.core.androconf import CONF, debug, warning
 
 import sys
 import re
 import struct
+import collections
 import binascii
-import time
 from struct import pack, unpack, calcsize
 
 DEX_FILE_MAGIC_35 = 'dex\n035\x00'
@@ -2382,6 +2382,10 @@ class FieldHIdItem(object):
         except IndexError:
             return FieldIdItemInvalid()
 
+    def _reload(self):
+        for i in self.elem:
+            i._reload()
+
     def reload(self):
         for i in self.elem:
             i.reload()
@@ -2785,7 +2789,7 @@ class EncodedField(object):
 
     def set_name(self, value):
         self.CM.set_hook_field_name(self, value)
-        self._reload()
+        self.reload()
 
     def get_obj(self):
         return []
@@ -3199,7 +3203,7 @@ class EncodedMethod(object):
 
     def set_name(self, value):
         self.CM.set_hook_method_name(self, value)
-        self._reload()
+        self.reload()
 
     def get_raw(self):
         if self.code != None:
@@ -3668,6 +3672,27 @@ class ClassDefItem(object):
     def get_source_ext(self):
         return self.CM.decompiler_ob.get_source_class_ext(self)
 
+    def iter_source_ext(self):
+        """
+            Return an iterator over the source code sections of the class,
+            decompiling one method at a time if the decompiler supports it
+        """
+        decompiler = self.CM.decompiler_ob
+        if hasattr(decompiler, "iter_source_class_ext"):
+            return decompiler.iter_source_class_ext(self)
+        return iter(decompiler.get_source_class_ext(self))
+
+    def write_source(self, fd):
+        """
+            Write the source code of the entire class to the file object `fd`,
+            decompiling one method at a time if the decompiler supports it
+        """
+        decompiler = self.CM.decompiler_ob
+        if hasattr(decompiler, "write_source_class"):
+            decompiler.write_source_class(self, fd)
+        else:
+            fd.write(decompiler.get_source_class(self))
+
     def get_ast(self):
         return self.CM.decompiler_ob.get_ast_class(self)
 
@@ -7046,9 +7071,11 @@ class MapItem(object):
         return self.size
 
     def next(self, buff, cm):
-        androconf.debug("Parsing section %s" % TYPE_MAP_ITEM[self.type])
-        started_at = time.time()
+        androconf.debug("Parsing section %s", TYPE_MAP_ITEM[self.type])
+        with profiling.phase(TYPE_MAP_ITEM[self.type]):
+            self._parse(buff, cm)
 
+    def _parse(self, buff, cm):
         if TYPE_MAP_ITEM[self.type] == "TYPE_STRING_ID_ITEM":
             self.item = [StringIdItem(buff, cm) for i in range(0, self.size)]
 
@@ -7111,10 +7138,6 @@ class MapItem(object):
             androconf.warning("Map item %d @ 0x%x(%d) is unknown" %
                           (self.type, buff.get_idx(), buff.get_idx()))
 
-        diff = time.time() - started_at
-        minutes, seconds = float(diff // 60), float(diff % 60)
-        androconf.debug("End of parsing %s = %s:%s" % (TYPE_MAP_ITEM[self.type], str(minutes), str(round(seconds,2))))
-
     def reload(self):
         if self.item != None:
             if isinstance(self.item, list):
@@ -7178,6 +7201,8 @@ class ClassManager(object):
         self.__manage_item_off = []
 
         self.__strings_off = {}
+        self.__strings_idx = None
+        self.__type_lists = None
 
         self.__obj_offset = {}
         self.__item_offset = {}
@@ -7223,6 +7248,17 @@ class ClassManager(object):
     def get_string_by_offset(self, offset):
         return self.__strings_off[offset]
 
+    def get_string_idx_by_offset(self, offset):
+        """
+            Return the index of the string whose data is at offset, or None
+        """
+        if self.__strings_idx == None:
+            self.__strings_idx = {}
+            for idx, item in enumerate(self.__manage_item.get(
+                    "TYPE_STRING_ID_ITEM") or []):
+                self.__strings_idx.setdefault(item.get_string_data_off(), idx)
+        return self.__strings_idx.get(offset)
+
     def get_lazy_analysis(self):
         return self.lazy_analysis
 
@@ -7321,9 +7357,14 @@ class ClassManager(object):
         if off == 0:
             return []
 
-        for i in self.__manage_item["TYPE_TYPE_LIST"]:
-            if i.get_type_list_off() == off:
-                return [type_.get_string() for type_ in i.get_list()]
+        if self.__type_lists == None:
+            self.__type_lists = {}
+            for i in self.__manage_item["TYPE_TYPE_LIST"]:
+                self.__type_lists.setdefault(i.get_type_list_off(), i)
+
+        i = self.__type_lists.get(off)
+        if i != None:
+            return [type_.get_string() for type_ in i.get_list()]
 
     def get_type(self, idx):
         _type = self.__manage_item["TYPE_TYPE_ID_ITEM"].get(idx)
@@ -7372,6 +7413,7 @@ class ClassManager(object):
 
         # FIXME
         self.__manage_item["TYPE_METHOD_ID_ITEM"]._reload()
+        self.__manage_item["TYPE_FIELD_ID_ITEM"]._reload()
 
         for i in class_def.get_methods():
             i.reload()
@@ -7382,6 +7424,8 @@ class ClassManager(object):
         if python_export:
             self.vm._create_python_export_class(class_def)
 
+        self._clear_vm_cache()
+
     def set_hook_method_name(self, encoded_method, value):
         python_export = True
 
@@ -7429,7 +7473,8 @@ class ClassManager(object):
             else:
                 debug("skipping creating new name in python")
 
-        method.reload()
+        method._reload()
+        self._clear_vm_cache()
 
     def set_hook_field_name(self, encoded_field, value):
         python_export = True
@@ -7456,7 +7501,13 @@ class ClassManager(object):
                 name = bytecode.FormatNameToPython(value)
                 setattr(class_def.F, name, encoded_field)
 
-        field.reload()
+        field._reload()
+        self._clear_vm_cache()
+
+    def _clear_vm_cache(self):
+        # The indexes of the DalvikVMFormat are keyed by names
+        if self.vm != None:
+            self.vm._clear_cache()
 
     def set_hook_string(self, idx, value):
         self.hook_strings[idx] = value
@@ -7504,12 +7555,9 @@ class MapList(object):
             self.CM.add_type_item(TYPE_MAP_ITEM[mi.get_type()], mi, c_item)
 
         for i in self.map_item:
-            androconf.debug("Reloading %s" % TYPE_MAP_ITEM[i.get_type()])
-            started_at = time.time()
-            i.reload()
-            diff = time.time() - started_at
-            minutes, seconds = float(diff // 60), float(diff % 60)
-            androconf.debug("End of reloading %s = %s:%s" % (TYPE_MAP_ITEM[i.get_type()], str(minutes), str(round(seconds,2))))
+            androconf.debug("Reloading %s", TYPE_MAP_ITEM[i.get_type()])
+            with profiling.phase("reload " + TYPE_MAP_ITEM[i.get_type()]):
+                i.reload()
 
     def reload(self):
         pass
@@ -7576,6 +7624,78 @@ class DREF(object):
         self.items.append((x, y))
 
 
+class StringSearch(object):
+    """
+        Search many patterns at once in the strings of DEX files.
+
+        The literals are combined into a single regex, so each string is
+        scanned once for all of them; only the strings which match it are
+        tested against each literal, to know which ones matched. The regexes
+        are searched one by one, since they can't always be combined (flags,
+        named groups and backreferences are local to each of them).
+
+        :param patterns: python regexes, searched anywhere in the strings
+        :type patterns: list of strings
+        :param literals: strings searched as is
+        :type literals: list of strings
+        :param flags: the flags of the regexes (re.IGNORECASE ...)
+        :type flags: int
+
+        :Example:
+          StringSearch([r"https?://"], ["api_key"]).search(d)
+    """
+
+    def __init__(self, patterns=(), literals=(), flags=0):
+        self.patterns = [(pattern, re.compile(pattern, flags))
+                         for pattern in patterns]
+        self.literals = [(literal, re.compile(re.escape(literal), flags))
+                         for literal in literals]
+
+        self.regex = None
+        if self.literals:
+            self.regex = re.compile(
+                "|".join(prog.pattern for _, prog in self.literals), flags)
+
+    def match(self, value):
+        """
+            Return the patterns found in value
+
+            :rtype: a list of strings
+        """
+        found = [pattern for pattern, prog in self.patterns
+                 if prog.search(value)]
+        if self.regex != None and self.regex.search(value) != None:
+            found.extend(literal for literal, prog in self.literals
+                         if prog.search(value))
+        return found
+
+    def search(self, vm):
+        """
+            Search the patterns in the string pool of vm, in a single pass over
+            its string data section
+
+            :param vm: a :class:`DalvikVMFormat` object
+
+            :rtype: a list of (string index, string, patterns found), sorted
+                    by index
+        """
+        matches = []
+        if not self.patterns and self.regex == None:
+            return matches
+
+        cm = vm.get_class_manager()
+        for item in vm.get_string_data_item() or []:
+            value = item.get()
+            found = self.match(value)
+            if not found:
+                continue
+            idx = cm.get_string_idx_by_offset(item.get_off())
+            if idx != None:
+                matches.append((idx, value, found))
+        matches.sort(key=lambda match: match[0])
+        return matches
+
+
 class DalvikVMFormat(bytecode._Bytecode):
     """
         This class can parse a classes.dex file of an Android application (APK).
@@ -7635,10 +7755,23 @@ class DalvikVMFormat(bytecode._Bytecode):
             self.debug = self.map_list.get_item_type("TYPE_DEBUG_INFO_ITEM")
             self.header = self.map_list.get_item_type("TYPE_HEADER_ITEM")
 
+        self._clear_cache()
+
+    def _clear_cache(self):
+        """
+            Forget the indexes of the classes, methods and fields. They are
+            rebuilt on the next lookup, with the current names.
+        """
         self.classes_names = None
+        self.__cache_classes = None
+        self.__cache_all_methods = None
+        self.__cache_all_fields = None
         self.__cache_methods = None
+        self.__cache_methods_class = None
+        self.__cache_methods_name = None
         self.__cached_methods_idx = None
         self.__cache_fields = None
+        self.__cache_fields_class = None
 
     def get_api_version(self):
         '''
@@ -7887,10 +8020,11 @@ class DalvikVMFormat(bytecode._Bytecode):
 
           :rtype: a :class:`ClassDefItem` object
         """
-        for i in self.classes.class_def:
-            if i.get_name() == name:
-                return i
-        return None
+        if self.__cache_classes == None:
+            self.__cache_classes = {}
+            for i in self.classes.class_def:
+                self.__cache_classes.setdefault(i.get_name(), i)
+        return self.__cache_classes.get(name)
 
     def get_method(self, name):
         """
@@ -7901,12 +8035,7 @@ class DalvikVMFormat(bytecode._Bytecode):
             :rtype: a list with all :class:`EncodedMethod` objects
         """
         prog = re.compile(name)
-        l = []
-        for i in self.classes.class_def:
-            for j in i.get_methods():
-                if prog.match(j.get_name()):
-                    l.append(j)
-        return l
+        return [j for j in self.get_methods() if prog.match(j.get_name())]
 
     def get_field(self, name):
         """
@@ -7917,12 +8046,7 @@ class DalvikVMFormat(bytecode._Bytecode):
             :rtype: a list with all :class:`EncodedField` objects
         """
         prog = re.compile(name)
-        l = []
-        for i in self.classes.class_def:
-            for j in i.get_fields():
-                if prog.match(j.get_name()):
-                    l.append(j)
-        return l
+        return [j for j in self.get_fields() if prog.match(j.get_name())]
 
     def get_all_fields(self):
         """
@@ -7939,25 +8063,23 @@ class DalvikVMFormat(bytecode._Bytecode):
         """
           Return all field objects
 
-          :rtype: a list of :class:`EncodedField` objects
+          :rtype: a tuple of :class:`EncodedField` objects
         """
-        l = []
-        for i in self.classes.class_def:
-            for j in i.get_fields():
-                l.append(j)
-        return l
+        if self.__cache_all_fields == None:
+            self.__cache_all_fields = tuple(j for i in self.classes.class_def
+                                            for j in i.get_fields())
+        return self.__cache_all_fields
 
     def get_methods(self):
         """
           Return all method objects
 
-          :rtype: a list of :class:`EncodedMethod` objects
+          :rtype: a tuple of :class:`EncodedMethod` objects
         """
-        l = []
-        for i in self.classes.class_def:
-            for j in i.get_methods():
-                l.append(j)
-        return l
+        if self.__cache_all_methods == None:
+            self.__cache_all_methods = tuple(j for i in self.classes.class_def
+                                             for j in i.get_methods())
+        return self.__cache_all_methods
 
     def get_len_methods(self):
         """
@@ -7977,9 +8099,8 @@ class DalvikVMFormat(bytecode._Bytecode):
         """
         if self.__cached_methods_idx == None:
             self.__cached_methods_idx = {}
-            for i in self.classes.class_def:
-                for j in i.get_methods():
-                    self.__cached_methods_idx[j.get_method_idx()] = j
+            for j in self.get_methods():
+                self.__cached_methods_idx[j.get_method_idx()] = j
 
         try:
             return self.__cached_methods_idx[idx]
@@ -8003,10 +8124,9 @@ class DalvikVMFormat(bytecode._Bytecode):
 
         if self.__cache_methods == None:
             self.__cache_methods = {}
-            for i in self.classes.class_def:
-                for j in i.get_methods():
-                    self.__cache_methods[j.get_class_name() + j.get_name() +
-                                         j.get_descriptor()] = j
+            for j in self.get_methods():
+                self.__cache_methods[j.get_class_name() + j.get_name() +
+                                     j.get_descriptor()] = j
 
         return self.__cache_methods.get(key)
 
@@ -8019,16 +8139,18 @@ class DalvikVMFormat(bytecode._Bytecode):
             :param method_name: the name of the method
             :type method_name: string
 
-            :rtype: None or a :class:`EncodedMethod` object
+            :rtype: a tuple of :class:`EncodedMethod` objects
         """
-        l = []
-        for i in self.classes.class_def:
-            if i.get_name() == class_name:
+        if self.__cache_methods_name == None:
+            methods_name = collections.defaultdict(list)
+            for i in self.classes.class_def:
+                name = i.get_name()
                 for j in i.get_methods():
-                    if j.get_name() == method_name:
-                        l.append(j)
+                    methods_name[(name, j.get_name())].append(j)
+            self.__cache_methods_name = dict(
+                (key, tuple(value)) for key, value in methods_name.items())
 
-        return l
+        return self.__cache_methods_name.get((class_name, method_name), ())
 
     def get_methods_class(self, class_name):
         """
@@ -8037,15 +8159,12 @@ class DalvikVMFormat(bytecode._Bytecode):
             :param class_name: the class name
             :type class_name: string
 
-            :rtype: a list with :class:`EncodedMethod` objects
+            :rtype: a tuple with :class:`EncodedMethod` objects
         """
-        l = []
-        for i in self.classes.class_def:
-            for j in i.get_methods():
-                if class_name == j.get_class_name():
-                    l.append(j)
-
-        return l
+        if self.__cache_methods_class == None:
+            self.__cache_methods_class = self._index_by_class(
+                self.get_methods())
+        return self.__cache_methods_class.get(class_name, ())
 
     def get_fields_class(self, class_name):
         """
@@ -8054,15 +8173,17 @@ class DalvikVMFormat(bytecode._Bytecode):
             :param class_name: the class name
             :type class_name: string
 
-            :rtype: a list with :class:`EncodedField` objects
+            :rtype: a tuple with :class:`EncodedField` objects
         """
-        l = []
-        for i in self.classes.class_def:
-            for j in i.get_fields():
-                if class_name == j.get_class_name():
-                    l.append(j)
+        if self.__cache_fields_class == None:
+            self.__cache_fields_class = self._index_by_class(self.get_fields())
+        return self.__cache_fields_class.get(class_name, ())
 
-        return l
+    def _index_by_class(self, items):
+        index = collections.defaultdict(list)
+        for j in items:
+            index[j.get_class_name()].append(j)
+        return dict((key, tuple(value)) for key, value in index.items())
 
     def get_field_descriptor(self, class_name, field_name, descriptor):
         """
@@ -8082,10 +8203,9 @@ class DalvikVMFormat(bytecode._Bytecode):
 
         if self.__cache_fields == None:
             self.__cache_fields = {}
-            for i in self.classes.class_def:
-                for j in i.get_fields():
-                    self.__cache_fields[j.get_class_name() + j.get_name() +
-                                        j.get_descriptor()] = j
+            for j in self.get_fields():
+                self.__cache_fields[j.get_class_name() + j.get_name() +
+                                    j.get_descriptor()] = j
 
         return self.__cache_fields.get(key)
 
@@ -8106,13 +8226,25 @@ class DalvikVMFormat(bytecode._Bytecode):
 
             :rtype: a list of strings matching the regex expression
         """
-        str_list = []
         if regular_expressions.count is None:
             return None
-        for i in self.get_strings():
-            if re.match(regular_expressions, i):
-                str_list.append(i)
-        return str_list
+        prog = re.compile(regular_expressions)
+        return [i.get() for i in self.strings if prog.match(i.get())]
+
+    def search_strings(self, patterns=(), literals=(), flags=0):
+        """
+            Search many patterns at once in the strings
+
+            :param patterns: python regexes, searched anywhere in the strings
+            :type patterns: list of strings
+            :param literals: strings searched as is
+            :type literals: list of strings
+            :param flags: the flags of the regexes
+            :type flags: int
+
+            :rtype: a list of (string index, string, patterns found)
+        """
+        return StringSearch(patterns, literals, flags).search(self)
 
     def get_format_type(self):
         """
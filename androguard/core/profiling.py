@@ -0,0 +1,374 @@
+"""
+Per-phase instrumentation of the analysis.
+
+The parsers and the analysis wrap their main phases (zip reading, manifest,
+resources, DEX map sections, xrefs, CFG building, decompilation...) with
+:func:`phase`. This costs nothing as long as no :class:`Profiler` is active.
+When one is, every phase records its wall and CPU time, and optionally the
+memory allocated (with `tracemalloc`) and the number of objects created.
+
+The active profiler is global to the process, so the phases run by other
+threads (like the ones inflating the DEX files of an APK) are recorded too.
+The profilers may be activated and deactivated by several threads: the
+last one activated, and not deactivated yet, is the active one.
+
+:Example:
+    >>> profiler = Profiler(memory=True)
+    >>> a, d, dx = AnalyzeAPK("myfile.apk", profiler=profiler)
+    >>> report = profiler.get_report()
+    >>> report.show()
+    >>> report.save("report.json")
+"""
+from __future__ import print_function
+from builtins import object
+import collections
+import gc
+import io
+import json
+import threading
+import time
+
+try:
+    _clock = time.perf_counter
+    _cpu_clock = time.process_time
+except AttributeError:
+    _clock = time.time
+    _cpu_clock = time.clock
+
+# The profiler which records the phases, if any: the last one of the
+# activated profilers, which are updated under the lock
+_active = None
+_activated = []
+_activated_lock = threading.Lock()
+
+
+class _NullPhase(object):
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+def _count_objects():
+    # Collect first, so that a collection run by chance during a phase does
+    # not count the garbage of the previous ones
+    gc.collect()
+    return len(gc.get_objects())
+
+
+def phase(name):
+    """
+        Return a context manager recording `name` as a phase of the active
+        profiler. Nested phases are named after their parents, with '/' as
+        separator.
+
+        :param name: the name of the phase
+        :type name: string
+    """
+    if _active is None:
+        return _NULL_PHASE
+    return _Phase(_active, name)
+
+
+def activate(profiler):
+    """
+        Return a context manager activating profiler, which may be None
+
+        :type profiler: :class:`Profiler`
+    """
+    if profiler is None:
+        return _NULL_PHASE
+    return profiler
+
+
+def get_active_profiler():
+    """
+        Return the active :class:`Profiler`, or None
+    """
+    return _active
+
+
+class PhaseStats(object):
+    """
+        The cumulated measures of a phase
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.memory = 0
+        self.objects = 0
+
+    def get_dict(self):
+        return collections.OrderedDict([
+            ("name", self.name),
+            ("calls", self.calls),
+            ("wall", self.wall),
+            ("cpu", self.cpu),
+            ("memory", self.memory),
+            ("objects", self.objects),
+        ])
+
+
+class _Phase(object):
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        profiler = self.profiler
+        stack = profiler._get_stack()
+        if stack:
+            self.path = stack[-1] + "/" + self.name
+        else:
+            self.path = self.name
+        stack.append(self.path)
+
+        # Register the phase now, so the phases are reported in the order
+        # they started
+        with profiler._lock:
+            self.stats = profiler.phases.get(self.path)
+            if self.stats is None:
+                self.stats = PhaseStats(self.path)
+                profiler.phases[self.path] = self.stats
+
+        if profiler.count_objects:
+            self.objects = _count_objects()
+        if profiler.memory:
+            self.memory = profiler._tracemalloc.get_traced_memory()[0]
+        self.cpu = _cpu_clock()
+        self.wall = _clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        wall = _clock() - self.wall
+        cpu = _cpu_clock() - self.cpu
+
+        profiler = self.profiler
+        with profiler._lock:
+            stats = self.stats
+            stats.calls += 1
+            stats.wall += wall
+            stats.cpu += cpu
+            if profiler.memory:
+                current = profiler._tracemalloc.get_traced_memory()[0]
+                stats.memory += current - self.memory
+            if profiler.count_objects:
+                stats.objects += _count_objects() - self.objects
+
+        profiler._get_stack().pop()
+        return False
+
+
+class Profiler(object):
+    """
+        Record the phases run while it is active. It is activated with
+        a `with` statement, or given to :class:`Session` or `AnalyzeAPK`.
+
+        :param memory: record the memory allocated by each phase with
+                       `tracemalloc` (slow)
+        :param count_objects: record the number of objects created, and
+                              still alive, by each phase (slow)
+        :param cprofile: also run the `cProfile` profiler
+
+        :type memory: boolean
+        :type count_objects: boolean
+        :type cprofile: boolean
+    """
+
+    def __init__(self, memory=False, count_objects=False, cprofile=False):
+        self.memory = memory
+        self.count_objects = count_objects
+        self.cprofile = cprofile
+
+        self.phases = collections.OrderedDict()
+        self.wall = 0.0
+        self.cpu = 0.0
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._depth = 0
+        self._started_tracemalloc = False
+        self._tracemalloc = None
+        self._profile = None
+
+    def __getstate__(self):
+        # The locks, the thread local stacks and the running profilers can't
+        # be pickled: a profiler is saved with its measures, inactive
+        state = self.__dict__.copy()
+        for name in ["_lock", "_local", "_tracemalloc", "_profile"]:
+            del state[name]
+        state["_depth"] = 0
+        state["_started_tracemalloc"] = False
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._tracemalloc = None
+        self._profile = None
+
+    def _get_stack(self):
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def __enter__(self):
+        with _activated_lock:
+            return self._activate()
+
+    def __exit__(self, exc_type, exc_value, tb):
+        with _activated_lock:
+            self._deactivate()
+        return False
+
+    def _activate(self):
+        global _active
+
+        self._depth += 1
+        if self._depth > 1:
+            return self
+
+        if self.memory:
+            import tracemalloc
+            self._tracemalloc = tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+
+        if self.cprofile:
+            if self._profile is None:
+                import cProfile
+                self._profile = cProfile.Profile()
+            self._profile.enable()
+
+        _activated.append(self)
+        _active = self
+
+        self._cpu = _cpu_clock()
+        self._wall = _clock()
+        return self
+
+    def _deactivate(self):
+        global _active
+
+        self._depth -= 1
+        if self._depth > 0:
+            return
+
+        self.wall += _clock() - self._wall
+        self.cpu += _cpu_clock() - self._cpu
+
+        _activated.remove(self)
+        _active = _activated[-1] if _activated else None
+
+        if self._profile is not None:
+            self._profile.disable()
+
+        if self._started_tracemalloc:
+            self._tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def get_stats(self):
+        """
+            Return the `pstats.Stats` of the cProfile profiler, or None if it
+            has not been used
+        """
+        if self._profile is None:
+            return None
+        import pstats
+        return pstats.Stats(self._profile)
+
+    def dump_stats(self, filename):
+        """
+            Save the cProfile statistics in filename, in the `pstats` format
+        """
+        self._profile.dump_stats(filename)
+
+    def get_report(self, nb_functions=30):
+        """
+            Return the :class:`ProfileReport` of the recorded phases
+
+            :param nb_functions: the number of functions of the cProfile
+                                 statistics to keep, by cumulative time
+            :type nb_functions: int
+
+            :rtype: :class:`ProfileReport`
+        """
+        functions = []
+        stats = self.get_stats()
+        if stats is not None:
+            for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+                functions.append(collections.OrderedDict([
+                    ("function", "%s:%d(%s)" % func),
+                    ("calls", nc),
+                    ("time", tt),
+                    ("cumulative", ct),
+                ]))
+            functions.sort(key=lambda f: f["cumulative"], reverse=True)
+            functions = functions[:nb_functions]
+
+        with self._lock:
+            phases = [stats.get_dict() for stats in self.phases.values()]
+        return ProfileReport(self.wall, self.cpu, phases, functions)
+
+
+class ProfileReport(object):
+    """
+        The measures of a :class:`Profiler`
+    """
+
+    def __init__(self, wall, cpu, phases, functions=None):
+        self.wall = wall
+        self.cpu = cpu
+        self.phases = phases
+        self.functions = functions or []
+
+    def get_phase(self, name):
+        """
+            Return the measures of the phase `name` as a dict, or None
+        """
+        for phase in self.phases:
+            if phase["name"] == name:
+                return phase
+        return None
+
+    def get_dict(self):
+        return collections.OrderedDict([
+            ("wall", self.wall),
+            ("cpu", self.cpu),
+            ("phases", self.phases),
+            ("functions", self.functions),
+        ])
+
+    def get_json(self):
+        return json.dumps(self.get_dict(), indent=2)
+
+    def save(self, filename):
+        """
+            Save the report in filename, as JSON
+        """
+        with io.open(filename, "w", encoding="utf-8") as fd:
+            fd.write(u"%s" % self.get_json())
+
+    def show(self):
+        print("Total: wall %.3fs, cpu %.3fs" % (self.wall, self.cpu))
+        for phase in self.phases:
+            print("%-50s %6d calls %9.3fs wall %9.3fs cpu %10d bytes %8d objects"
+                  % (phase["name"], phase["calls"], phase["wall"], phase["cpu"],
+                     phase["memory"], phase["objects"]))
+        for function in self.functions:
+            print("%9.3fs %9.3fs %8d %s" % (function["cumulative"],
+                                            function["time"], function["calls"],
+                                            function["function"]))
@@ -0,0 +1,253 @@
+"""
+Random access to the entries of a ZIP file, without zipfile.
+
+:class:`ZipStorage` reads the central directory of the archive once, and
+keeps the :class:`androconf.ZipEntry` of each entry by name. The data of the
+entries is read from the buffer of the whole file, usually a read-only mmap of
+it (see :func:`open_file`): the STORED entries are views of the buffer, and the
+DEFLATED ones are inflated once, and kept in a cache of bounded size, where the
+least recently used ones are dropped.
+
+:Example:
+    >>> storage = open_file("myfile.apk")
+    >>> manifest = storage.read("AndroidManifest.xml")
+    >>> view = storage.get_view("resources.arsc")
+"""
+from builtins import object
+import collections
+import io
+import mmap
+import struct
+import sys
+import threading
+import zlib
+
+from androguard.core import androconf
+
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+
+# The default size of the cache of the inflated entries, in bytes
+CACHE_SIZE = 64 * 1024 * 1024
+
+_ZIP_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+
+
+if sys.version_info >= (3,):
+    def _buffer(view):
+        return view
+else:
+    # zlib takes no memoryview on Python 2
+    def _buffer(view):
+        if isinstance(view, memoryview):
+            return view.tobytes()
+        return view
+
+
+def _bad_zip_file(message):
+    import zipfile
+    return zipfile.BadZipfile(message)
+
+
+def map_file(filename):
+    """
+        Return the content of the file filename, as a read-only mmap (as
+        bytes on Python 2)
+    """
+    with open(filename, "rb") as fd:
+        if sys.version_info < (3,):
+            # There is no memoryview of a mmap on Python 2
+            return fd.read()
+        try:
+            return mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, mmap.error):
+            # An empty file can't be mapped
+            return fd.read()
+
+
+def open_file(filename, cache_size=CACHE_SIZE):
+    """
+        Return the :class:`ZipStorage` of the ZIP file filename, mapped in
+        memory
+    """
+    return ZipStorage(map_file(filename), cache_size)
+
+
+class ZipStorage(object):
+    """
+        The entries of a ZIP file, read from its buffer
+
+        It has the read methods of `zipfile.ZipFile`. The entries which are
+        encrypted or use other compression methods are read by zipfile.
+
+        :param data: the ZIP file
+        :type data: bytes, bytearray or mmap
+        :param cache_size: the maximum size of the inflated entries kept, in
+                           bytes
+        :type cache_size: int
+        :param entries: the central directory of data, as returned by
+                        :func:`androconf.get_zip_directory`, if it has
+                        already been read
+        :type entries: list of :class:`androconf.ZipEntry`
+
+        :raises zipfile.BadZipfile: if the central directory can't be read
+    """
+
+    def __init__(self, data, cache_size=CACHE_SIZE, entries=None):
+        self.data = data
+        self.cache_size = cache_size
+
+        self._view = memoryview(data)
+        if entries is None:
+            entries = androconf.get_zip_directory(self._read_at, len(data))
+        if entries is None:
+            raise _bad_zip_file("File is not a zip file")
+
+        self._names = [entry.filename for entry in entries]
+        # Like zipfile, the last entry of a name wins
+        self._entries = dict((entry.filename, entry) for entry in entries)
+        self._data_offsets = {}
+        self._checked = set()
+        self._zipfile = None
+
+        self._cache = collections.OrderedDict()
+        self._cached_size = 0
+        self._lock = threading.Lock()
+
+    def _read_at(self, offset, length):
+        return self._view[offset:offset + length].tobytes()
+
+    def namelist(self):
+        """
+            Return the names of the entries, in the order of the archive
+        """
+        return list(self._names)
+
+    def infolist(self):
+        """
+            Return the `zipfile.ZipInfo` of the entries
+        """
+        return self._get_zipfile().infolist()
+
+    def getinfo(self, name):
+        """
+            Return the :class:`androconf.ZipEntry` of the entry name
+
+            :raises KeyError: if there is no such entry
+        """
+        return self._entries[name]
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def _get_zipfile(self):
+        if self._zipfile is None:
+            import zipfile
+            if isinstance(self.data, mmap.mmap):
+                fd = io.BytesIO(self._view)
+            else:
+                fd = io.BytesIO(self.data)
+            self._zipfile = zipfile.ZipFile(fd)
+        return self._zipfile
+
+    def _get_data_offset(self, entry):
+        try:
+            return self._data_offsets[entry.filename]
+        except KeyError:
+            pass
+
+        header = self._read_at(entry.header_offset, _ZIP_LOCAL_HEADER.size)
+        if len(header) != _ZIP_LOCAL_HEADER.size or header[:4] != b"PK\x03\x04":
+            raise _bad_zip_file("Bad magic number for file header")
+        fields = _ZIP_LOCAL_HEADER.unpack(header)
+        # The extra field of the local header may differ from the one of the
+        # central directory
+        offset = entry.header_offset + _ZIP_LOCAL_HEADER.size + fields[9] + \
+            fields[10]
+        if offset + entry.compress_size > len(self.data):
+            raise _bad_zip_file("Truncated file %r" % entry.filename)
+        self._data_offsets[entry.filename] = offset
+        return offset
+
+    def _check(self, entry, data):
+        if entry.filename in self._checked:
+            return
+        if zlib.crc32(_buffer(data)) & 0xFFFFFFFF != entry.CRC:
+            raise _bad_zip_file("Bad CRC-32 for file %r" % entry.filename)
+        self._checked.add(entry.filename)
+
+    def get_view(self, name):
+        """
+            Return the data of the entry name as a memoryview, without any
+            copy for the STORED entries
+
+            :raises KeyError: if there is no such entry
+        """
+        entry = self._entries[name]
+        if entry.compress_type == ZIP_STORED and not entry.flag_bits & 0x1:
+            offset = self._get_data_offset(entry)
+            view = self._view[offset:offset + entry.compress_size]
+            self._check(entry, view)
+            return view
+        return memoryview(self.read(name))
+
+    def get_crc32(self, name):
+        """
+            Return the CRC-32 of the entry name, once checked against its
+            data. The entry is inflated, but not kept in the cache, if it has
+            not been read yet.
+
+            :raises KeyError: if there is no such entry
+            :raises zipfile.BadZipfile: if the data doesn't match the CRC-32
+        """
+        entry = self._entries[name]
+        if name not in self._checked:
+            self.read(name, cache=False)
+        return entry.CRC
+
+    def read(self, name, cache=True):
+        """
+            Return the data of the entry name
+
+            :param cache: keep the inflated data in the cache
+            :type cache: boolean
+
+            :rtype: bytes
+            :raises KeyError: if there is no such entry
+        """
+        entry = self._entries[name]
+        if entry.flag_bits & 0x1 or \
+                entry.compress_type not in (ZIP_STORED, ZIP_DEFLATED):
+            return self._get_zipfile().read(name)
+
+        if entry.compress_type == ZIP_STORED:
+            return self.get_view(name).tobytes()
+
+        with self._lock:
+            data = self._cache.pop(name, None)
+            if data is not None:
+                self._cache[name] = data
+                return data
+
+        offset = self._get_data_offset(entry)
+        data = zlib.decompressobj(-15).decompress(
+            _buffer(self._view[offset:offset + entry.compress_size]))
+        self._check(entry, data)
+
+        if cache and len(data) <= self.cache_size:
+            with self._lock:
+                if name not in self._cache:
+                    self._cache[name] = data
+                    self._cached_size += len(data)
+                while self._cached_size > self.cache_size:
+                    _, dropped = self._cache.popitem(last=False)
+                    self._cached_size -= len(dropped)
+        return data
+
+    def clear_cache(self):
+        """
+            Drop the inflated entries
+        """
+        with self._lock:
+            self._cache.clear()
+            self._cached_size = 0
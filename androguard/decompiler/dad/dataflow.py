@@ -19,6 +19,7 @@ from builtins import range
 from builtins import object
 import logging
 from collections import defaultdict
+from heapq import heappop, heappush
 from androguard.decompiler.dad.instruction import (Variable, ThisParam, Param)
 from androguard.decompiler.dad.util import build_path, common_dom
 from androguard.decompiler.dad.node import Node
@@ -148,25 +149,34 @@ def dead_code_elimination(graph, du, ud):
                         graph.remove_ins(i)
 
 
-def clear_path_node(graph, reg, loc1, loc2):
+def find_node_blocker(graph, reg, loc1, loc2):
+    '''
+    Return the location of the first instruction in [loc1, loc2[ which
+    redefines `reg` or has a side effect, or None if there is none.
+    '''
+    trace = logger.isEnabledFor(logging.DEBUG)
     for loc in range(loc1, loc2):
         ins = graph.get_ins_from_loc(loc)
-        logger.debug('  treat loc: %d, ins: %s', loc, ins)
+        if trace:
+            logger.debug('  treat loc: %d, ins: %s', loc, ins)
         if ins is None:
             continue
-        logger.debug('  LHS: %s, side_effect: %s', ins.get_lhs(),
-                     ins.has_side_effect())
+        if trace:
+            logger.debug('  LHS: %s, side_effect: %s', ins.get_lhs(),
+                         ins.has_side_effect())
         if ins.get_lhs() == reg or ins.has_side_effect():
-            return False
-    return True
+            return loc
+    return None
 
 
-def clear_path(graph, reg, loc1, loc2):
+def clear_path_node(graph, reg, loc1, loc2):
+    return find_node_blocker(graph, reg, loc1, loc2) is None
+
+
+def find_path_blocker(graph, reg, loc1, loc2):
     '''
-    Check that the path from loc1 to loc2 is clear.
-    We have to check that there is no side effect between the two location
-    points. We also have to check that the variable `reg` is not redefined
-    along one of the possible pathes from loc1 to loc2.
+    Return the location of the first instruction which prevents the path from
+    loc1 to loc2 to be clear (see clear_path), or None if the path is clear.
     '''
     logger.debug('clear_path: reg(%s), loc1(%s), loc2(%s)', reg, loc1, loc2)
     node1 = graph.get_node_from_loc(loc1)
@@ -174,19 +184,275 @@ def clear_path(graph, reg, loc1, loc2):
     # If both instructions are in the same node, we only have to check that the
     # path is clear inside the node
     if node1 is node2:
-        return clear_path_node(graph, reg, loc1 + 1, loc2)
+        return find_node_blocker(graph, reg, loc1 + 1, loc2)
 
     # If instructions are in different nodes, we also have to check the nodes
     # in the path between the two locations.
-    if not clear_path_node(graph, reg, loc1 + 1, node1.ins_range[1]):
-        return False
+    blocker = find_node_blocker(graph, reg, loc1 + 1, node1.ins_range[1])
+    if blocker is not None:
+        return blocker
     path = build_path(graph, node1, node2)
     for node in path:
         locs = node.ins_range
         end_loc = loc2 if (locs[0] <= loc2 <= locs[1]) else locs[1]
-        if not clear_path_node(graph, reg, locs[0], end_loc):
-            return False
-    return True
+        blocker = find_node_blocker(graph, reg, locs[0], end_loc)
+        if blocker is not None:
+            return blocker
+    return None
+
+
+def clear_path(graph, reg, loc1, loc2):
+    '''
+    Check that the path from loc1 to loc2 is clear.
+    We have to check that there is no side effect between the two location
+    points. We also have to check that the variable `reg` is not redefined
+    along one of the possible pathes from loc1 to loc2.
+    '''
+    return find_path_blocker(graph, reg, loc1, loc2) is None
+
+
+class RegisterPropagation(object):
+    '''
+    Worklist driven register propagation.
+
+    The use sites (var, loc) are visited in reverse post order, in successive
+    passes, like a full rescan of the graph would do. But a use site is only
+    evaluated again once something it depends on has changed:
+      - its UD chain, or its instruction (something was propagated in it)
+      - the DU chain or the instruction of its definition
+      - the instruction which prevented the path from its definition to be
+        clear (it has been removed)
+    Any other evaluation would fail the same way it did before, so the result
+    is the same as a fixed-point iteration over the whole graph, but the cost
+    is proportional to the number of changes instead of the number of passes
+    times the number of instructions.
+    '''
+
+    def __init__(self, graph, du, ud):
+        self.graph = graph
+        self.du = du
+        self.ud = ud
+        # Locations in the order they are visited, with their instruction
+        # and the node holding them.
+        self.order = []
+        self.position = {}
+        self.loc_ins = {}
+        self.loc_node = {}
+        for node in graph.rpo:
+            for i, ins in node.get_loc_with_ins():
+                self.position[i] = len(self.order)
+                self.order.append(i)
+                self.loc_ins[i] = ins
+                self.loc_node[i] = node
+        self.dirty = {}
+        self.blocked = defaultdict(set)
+        self.removed = set()
+        self.current = []
+        self.queued = set()
+        self.pending = set()
+        self.skipped = set()
+        self.cur = -1
+        self.trace = logger.isEnabledFor(logging.DEBUG)
+
+    def mark(self, var, loc):
+        '''
+        Schedule the evaluation of the use of var at loc. If loc has already
+        been visited during the current pass, it will be evaluated at the next
+        one.
+        '''
+        pos = self.position.get(loc)
+        if pos is None or loc in self.removed:
+            return
+        self.dirty.setdefault(loc, set()).add(var)
+        if pos > self.cur:
+            if pos not in self.queued:
+                self.queued.add(pos)
+                heappush(self.current, pos)
+        else:
+            self.pending.add(pos)
+
+    def run(self):
+        for i in self.order:
+            self.dirty[i] = set(self.loc_ins[i].get_used_vars())
+        self.pending = set(range(len(self.order)))
+        change = True
+        while change:
+            change = False
+            self.current = sorted(self.pending)
+            self.queued = set(self.current)
+            self.pending = set()
+            self.skipped = set()
+            self.cur = -1
+            while self.current:
+                pos = heappop(self.current)
+                self.cur = pos
+                i = self.order[pos]
+                if i in self.removed:
+                    continue
+                if pos in self.skipped:
+                    self.pending.add(pos)
+                    continue
+                if self.visit(pos, i):
+                    change = True
+
+    def visit(self, pos, i):
+        ins = self.loc_ins[i]
+        node = self.loc_node[i]
+        dirty = self.dirty.setdefault(i, set())
+        change = False
+        # Number of instructions removed from the node before the current
+        # one. The nodes used to be iterated while being modified, so the
+        # same number of instructions following the current one were not
+        # visited during the pass; we keep this visiting order.
+        nb_removed = 0
+        if self.trace:
+            logger.debug('Treating instruction %d: %s', i, ins)
+            logger.debug('  Used vars: %s', ins.get_used_vars())
+        for var in ins.get_used_vars():
+            if var not in dirty:
+                continue
+            dirty.discard(var)
+            removed_loc = self.propagate(var, i, ins)
+            if removed_loc is not None:
+                change = True
+                if (self.loc_node.get(removed_loc) is node and
+                        self.position[removed_loc] <= pos):
+                    nb_removed += 1
+        if dirty:
+            self.pending.add(pos)
+        next_pos = pos + 1
+        while (nb_removed and next_pos < len(self.order) and
+               self.loc_node[self.order[next_pos]] is node):
+            if self.order[next_pos] not in self.removed:
+                self.skipped.add(next_pos)
+                nb_removed -= 1
+            next_pos += 1
+        return change
+
+    def propagate(self, var, i, ins):
+        '''
+        Try to propagate the definition of var into the instruction at i.
+        Return the location of the definition if it has been removed.
+        '''
+        graph, du, ud = self.graph, self.du, self.ud
+        # Get the list of locations this variable is defined at.
+        locs = ud[var, i]
+        logger.debug('    var %s defined in lines %s', var, locs)
+        # If the variable is uniquely defined for this instruction
+        # it may be eligible for propagation.
+        if len(locs) != 1:
+            return None
+
+        loc = locs[0]
+        # Methods parameters are defined with a location < 0.
+        if loc < 0:
+            return None
+        orig_ins = graph.get_ins_from_loc(loc)
+        logger.debug('     -> %s', orig_ins)
+        logger.debug('     -> DU(%s, %s) = %s', var, loc, du[var, loc])
+
+        # We defined some instructions as not propagable.
+        # Actually this is the case only for array creation
+        # (new foo[x])
+        if not orig_ins.is_propagable():
+            logger.debug('    %s not propagable...', orig_ins)
+            return None
+
+        if not orig_ins.get_rhs().is_const():
+            # We only try to propagate constants and definition
+            # points which are used at only one location.
+            if len(du[var, loc]) > 1:
+                logger.debug('       => variable has multiple uses'
+                             ' and is not const => skip')
+                return None
+
+            # We check that the propagation is safe for all the
+            # variables that are used in the instruction.
+            # The propagation is not safe if there is a side effect
+            # along the path from the definition of the variable
+            # to its use in the instruction, or if the variable may
+            # be redifined along this path.
+            orig_ins_used_vars = orig_ins.get_used_vars()
+            logger.debug('    variables used by the original '
+                         'instruction: %s', orig_ins_used_vars)
+            for var2 in orig_ins_used_vars:
+                # loc is the location of the defined variable
+                # i is the location of the current instruction
+                blocker = find_path_blocker(graph, var2, loc, i)
+                if blocker is not None:
+                    logger.debug('Propagation NOT SAFE')
+                    self.blocked[blocker].add((var, i))
+                    return None
+
+        # We also check that the instruction itself is
+        # propagable. If the instruction has a side effect it
+        # cannot be propagated if there is another side effect
+        # along the path
+        if orig_ins.has_side_effect():
+            blocker = find_path_blocker(graph, None, loc, i)
+            if blocker is not None:
+                logger.debug('        %s has side effect and the '
+                             'path is not clear !', orig_ins)
+                self.blocked[blocker].add((var, i))
+                return None
+
+        logger.debug('     => Modification of the instruction!')
+        logger.debug('      - BEFORE: %s', ins)
+        ins.replace(var, orig_ins.get_rhs())
+        logger.debug('      -> AFTER: %s', ins)
+        logger.debug('\t UD(%s, %s) : %s', var, i, ud[var, i])
+        ud[var, i].remove(loc)
+        logger.debug('\t    -> %s', ud[var, i])
+        if len(ud[var, i]) == 0:
+            ud.pop((var, i))
+        for var2 in orig_ins.get_used_vars():
+            # We update the UD chain of the variables we
+            # propagate. We also have to take the
+            # definition points of all the variables used
+            # by the instruction and update the DU chain
+            # with this information.
+            old_ud = ud.get((var2, loc))
+            logger.debug('\t  ud(%s, %s) = %s', var2, loc, old_ud)
+            # If the instruction use the same variable
+            # multiple times, the second+ time the ud chain
+            # will be None because already treated.
+            if old_ud is None:
+                continue
+            ud[var2, i].extend(old_ud)
+            logger.debug('\t  - ud(%s, %s) = %s', var2, i, ud[var2, i])
+            ud.pop((var2, loc))
+            # The use of var2 has moved to the current instruction. The DU
+            # chains of its definitions keep the same length, so only this
+            # new use has to be evaluated.
+            self.mark(var2, i)
+
+            for def_loc in old_ud:
+                du[var2, def_loc].remove(loc)
+                du[var2, def_loc].append(i)
+
+        # The instruction has changed, so the propagation of its definition
+        # has to be evaluated again. Its own new uses have been scheduled
+        # above.
+        lhs = ins.get_lhs()
+        if lhs is not None:
+            for use_loc in du.get((lhs, i), []):
+                self.mark(lhs, use_loc)
+
+        new_du = du[var, loc]
+        logger.debug('\t new_du(%s, %s): %s', var, loc, new_du)
+        new_du.remove(i)
+        logger.debug('\t    -> %s', new_du)
+        for use_loc in new_du:
+            self.mark(var, use_loc)
+        if not new_du:
+            logger.debug('\t  REMOVING INS %d', loc)
+            du.pop((var, loc))
+            graph.remove_ins(loc)
+            self.removed.add(loc)
+            for var2, use_loc in self.blocked.pop(loc, ()):
+                self.mark(var2, use_loc)
+            return loc
+        return None
 
 
 def register_propagation(graph, du, ud):
@@ -200,116 +466,7 @@ def register_propagation(graph, du, ud):
     We have to be careful to the side effects some instructions may have.
     To do the propagation, we use the computed DU and UD chains.
     '''
-    change = True
-    while change:
-        change = False
-        for node in graph.rpo:
-            for i, ins in node.get_loc_with_ins():
-                logger.debug('Treating instruction %d: %s', i, ins)
-                logger.debug('  Used vars: %s', ins.get_used_vars())
-                for var in ins.get_used_vars():
-                    # Get the list of locations this variable is defined at.
-                    locs = ud[var, i]
-                    logger.debug('    var %s defined in lines %s', var, locs)
-                    # If the variable is uniquely defined for this instruction
-                    # it may be eligible for propagation.
-                    if len(locs) != 1:
-                        continue
-
-                    loc = locs[0]
-                    # Methods parameters are defined with a location < 0.
-                    if loc < 0:
-                        continue
-                    orig_ins = graph.get_ins_from_loc(loc)
-                    logger.debug('     -> %s', orig_ins)
-                    logger.debug('     -> DU(%s, %s) = %s', var, loc,
-                                 du[var, loc])
-
-                    # We defined some instructions as not propagable.
-                    # Actually this is the case only for array creation
-                    # (new foo[x])
-                    if not orig_ins.is_propagable():
-                        logger.debug('    %s not propagable...', orig_ins)
-                        continue
-
-                    if not orig_ins.get_rhs().is_const():
-                        # We only try to propagate constants and definition
-                        # points which are used at only one location.
-                        if len(du[var, loc]) > 1:
-                            logger.debug('       => variable has multiple uses'
-                                         ' and is not const => skip')
-                            continue
-
-                        # We check that the propagation is safe for all the
-                        # variables that are used in the instruction.
-                        # The propagation is not safe if there is a side effect
-                        # along the path from the definition of the variable
-                        # to its use in the instruction, or if the variable may
-                        # be redifined along this path.
-                        safe = True
-                        orig_ins_used_vars = orig_ins.get_used_vars()
-                        logger.debug('    variables used by the original '
-                                     'instruction: %s', orig_ins_used_vars)
-                        for var2 in orig_ins_used_vars:
-                            # loc is the location of the defined variable
-                            # i is the location of the current instruction
-                            if not clear_path(graph, var2, loc, i):
-                                safe = False
-                                break
-                        if not safe:
-                            logger.debug('Propagation NOT SAFE')
-                            continue
-
-                    # We also check that the instruction itself is
-                    # propagable. If the instruction has a side effect it
-                    # cannot be propagated if there is another side effect
-                    # along the path
-                    if orig_ins.has_side_effect():
-                        if not clear_path(graph, None, loc, i):
-                            logger.debug('        %s has side effect and the '
-                                         'path is not clear !', orig_ins)
-                            continue
-
-                    logger.debug('     => Modification of the instruction!')
-                    logger.debug('      - BEFORE: %s', ins)
-                    ins.replace(var, orig_ins.get_rhs())
-                    logger.debug('      -> AFTER: %s', ins)
-                    logger.debug('\t UD(%s, %s) : %s', var, i, ud[var, i])
-                    ud[var, i].remove(loc)
-                    logger.debug('\t    -> %s', ud[var, i])
-                    if len(ud[var, i]) == 0:
-                        ud.pop((var, i))
-                    for var2 in orig_ins.get_used_vars():
-                        # We update the UD chain of the variables we
-                        # propagate. We also have to take the
-                        # definition points of all the variables used
-                        # by the instruction and update the DU chain
-                        # with this information.
-                        old_ud = ud.get((var2, loc))
-                        logger.debug('\t  ud(%s, %s) = %s', var2, loc, old_ud)
-                        # If the instruction use the same variable
-                        # multiple times, the second+ time the ud chain
-                        # will be None because already treated.
-                        if old_ud is None:
-                            continue
-                        ud[var2, i].extend(old_ud)
-                        logger.debug('\t  - ud(%s, %s) = %s', var2, i,
-                                     ud[var2, i])
-                        ud.pop((var2, loc))
-
-                        for def_loc in old_ud:
-                            du[var2, def_loc].remove(loc)
-                            du[var2, def_loc].append(i)
-
-                    new_du = du[var, loc]
-                    logger.debug('\t new_du(%s, %s): %s', var, loc, new_du)
-                    new_du.remove(i)
-                    logger.debug('\t    -> %s', new_du)
-                    if not new_du:
-                        logger.debug('\t  REMOVING INS %d', loc)
-                        du.pop((var, loc))
-                        graph.remove_ins(loc)
-                        change = True
+    RegisterPropagation(graph, du, ud).run()
 
 
 class DummyNode(Node):
@@ -464,8 +621,9 @@ def place_declarations(graph, dvars, du, ud):
     for node in graph.post_order():
         for loc, ins in node.get_loc_with_ins():
             for var in ins.get_used_vars():
-                if (not isinstance(dvars[var], Variable) or
-                    isinstance(dvars[var], Param)):
+                # The return values of the invokes (tmpN) are not in dvars
+                decl = dvars.get(var)
+                if not isinstance(decl, Variable) or isinstance(decl, Param):
                     continue
                 var_defs_locs = ud[var, loc]
                 def_nodes = set()
@@ -484,4 +642,4 @@ def place_declarations(graph, dvars, du, ud):
                 if any(var in range(*common_dominator.ins_range)
                        for var in ud[var, loc]):
                     continue
-                common_dominator.add_variable_declaration(dvars[var])
+                common_dominator.add_variable_declaration(decl)
@@ -29,6 +29,7 @@ import logging
 import struct
 from collections import defaultdict
 import androguard.core.androconf as androconf
+from androguard.core import profiling
 import androguard.decompiler.dad.util as util
 from androguard.core.analysis import analysis
 from androguard.core.bytecodes import apk, dvm
@@ -125,6 +126,10 @@ class DvMethod(object):
                 (self.cls_name.split('/')[-1][:-1], self.name), methanalysis)
 
     def process(self, doAST=False):
+        with profiling.phase("decompile"):
+            self._process(doAST)
+
+    def _process(self, doAST):
         logger.debug('METHOD : %s', self.name)
 
         # Native methods... no blocks.
@@ -284,10 +289,40 @@ class DvClass(object):
             'methods': methods,
         }
 
-    def get_source(self):
-        source = []
+    def _iter_methods(self, process=False):
+        """
+        Yield the decompiled methods of the class one by one.
+
+        If `process` is True, the methods which are not decompiled yet are
+        decompiled just before being yielded and released right after, so
+        that only one of them is kept in memory at a time.
+        """
+        for i in range(len(self.methods)):
+            release = False
+            if process and not isinstance(self.methods[i], DvMethod):
+                release = True
+                try:
+                    self.process_method(i)
+                except Exception as e:
+                    logger.debug(
+                        'Error decompiling method %s: %s', self.methods[i], e)
+            method = self.methods[i]
+            if isinstance(method, DvMethod):
+                yield method
+                if release:
+                    self.methods[i] = method.method
+
+    def iter_source(self, process=False):
+        """
+        Yield the source code of the class chunk by chunk: the class header,
+        each field declaration and then each method.
+
+        :param process: decompile the methods on the fly instead of using
+                        the ones processed by :meth:`process`
+        :rtype: iterator of strings
+        """
         if not self.inner and self.package:
-            source.append('package %s;\n' % self.package)
+            yield 'package %s;\n' % self.package
 
         superclass, prototype = self.superclass, self.prototype
         if superclass is not None and superclass != 'Ljava/lang/Object;':
@@ -298,8 +333,9 @@ class DvClass(object):
             prototype += ' implements %s' % ', '.join(
                 [n[1:-1].replace('/', '.') for n in self.interfaces])
 
-        source.append('%s {\n' % prototype)
+        yield '%s {\n' % prototype
         for field in self.fields:
+            source = []
             name = field.get_name()
             access = util.get_access_field(field.get_access_flags())
             f_type = util.get_type(field.get_descriptor())
@@ -324,21 +360,38 @@ class DvClass(object):
                 source.append('%s %s = %s;\n' % (f_type, name, value))
             else:
                 source.append('%s %s;\n' % (f_type, name))
+            yield ''.join(source)
 
-        for method in self.methods:
-            if isinstance(method, DvMethod):
-                source.append(method.get_source())
+        for method in self._iter_methods(process):
+            yield method.get_source()
 
-        source.append('}\n')
-        return ''.join(source)
+        yield '}\n'
 
-    def get_source_ext(self):
-        source = []
+    def get_source(self):
+        return ''.join(self.iter_source())
+
+    def write_source(self, fd, process=False):
+        """
+        Write the source code of the class to the file object `fd`, without
+        building the whole source in memory.
+
+        :param fd: a file object opened in text mode
+        :param process: decompile the methods on the fly
+        """
+        for chunk in self.iter_source(process=process):
+            fd.write(chunk)
+
+    def iter_source_ext(self, process=False):
+        """
+        Yield the (section, tokens) tuples of :meth:`get_source_ext` one
+        section at a time.
+
+        :param process: decompile the methods on the fly instead of using
+                        the ones processed by :meth:`process`
+        """
         if not self.inner and self.package:
-            source.append(
-                ('PACKAGE', [('PACKAGE_START', 'package '), (
-                    'NAME_PACKAGE', '%s' % self.package), ('PACKAGE_END', ';\n')
-                        ]))
+            yield ('PACKAGE', [('PACKAGE_START', 'package '), (
+                'NAME_PACKAGE', '%s' % self.package), ('PACKAGE_END', ';\n')])
         list_proto = []
         list_proto.append(
             ('PROTOTYPE_ACCESS', '%s class ' % ' '.join(self.access)))
@@ -357,7 +410,7 @@ class DvClass(object):
                 list_proto.append(
                     ('NAME_INTERFACE', interface[1:-1].replace('/', '.')))
         list_proto.append(('PROTOTYPE_END', ' {\n'))
-        source.append(("PROTOTYPE", list_proto))
+        yield ("PROTOTYPE", list_proto)
 
         for field in self.fields:
             field_access_flags = field.get_access_flags()
@@ -388,23 +441,22 @@ class DvClass(object):
                 else:
                     value = ' = %s' % str(value)
             if value:
-                source.append(
-                    ('FIELD', [('FIELD_ACCESS', access_str), (
+                yield ('FIELD', [('FIELD_ACCESS', access_str), (
                         'FIELD_TYPE', '%s' % f_type), ('SPACE', ' '), (
                             'NAME_FIELD', '%s' % name, f_type, field), ('FIELD_VALUE', value), ('FIELD_END',
-                                                                        ';\n')]))
+                                                                        ';\n')])
             else:
-                source.append(
-                    ('FIELD', [('FIELD_ACCESS', access_str), (
+                yield ('FIELD', [('FIELD_ACCESS', access_str), (
                         'FIELD_TYPE', '%s' % f_type), ('SPACE', ' '), (
                             'NAME_FIELD', '%s' % name, f_type, field), ('FIELD_END',
-                                                                        ';\n')]))
+                                                                        ';\n')])
 
-        for method in self.methods:
-            if isinstance(method, DvMethod):
-                source.append(("METHOD", method.get_source_ext()))
-        source.append(("CLASS_END", [('CLASS_END', '}\n')]))
-        return source
+        for method in self._iter_methods(process):
+            yield ("METHOD", method.get_source_ext())
+        yield ("CLASS_END", [('CLASS_END', '}\n')])
+
+    def get_source_ext(self):
+        return list(self.iter_source_ext())
 
     def show_source(self):
         print(self.get_source())
@@ -20,7 +20,8 @@ from builtins import str
 from builtins import range
 from builtins import object
 import logging
-from collections import defaultdict
+from bisect import bisect_right
+from collections import defaultdict, OrderedDict
 from androguard.decompiler.dad.basic_blocks import (build_node_from_block,
                                                     StatementBlock, CondBlock)
 from androguard.decompiler.dad.util import get_type
@@ -34,7 +35,7 @@ class Graph(object):
     def __init__(self):
         self.entry = None
         self.exit = None
-        self.nodes = list()
+        self.nodes = OrderedDict()
         self.rpo = []
         self.edges = defaultdict(list)
         self.catch_edges = defaultdict(list)
@@ -42,6 +43,7 @@ class Graph(object):
         self.reverse_catch_edges = defaultdict(list)
         self.loc_to_ins = None
         self.loc_to_node = None
+        self.loc_starts = None
 
     def sucs(self, node):
         return self.edges.get(node, [])
@@ -57,7 +59,7 @@ class Graph(object):
             node, []))
 
     def add_node(self, node):
-        self.nodes.append(node)
+        self.nodes[node] = None
 
     def add_edge(self, e1, e2):
         lsucs = self.edges[e1]
@@ -92,28 +94,64 @@ class Graph(object):
         for suc in exc_succs:
             self.reverse_catch_edges[suc].remove(node)
 
-        self.nodes.remove(node)
-        if node in self.rpo:
-            self.rpo.remove(node)
+        del self.nodes[node]
+        idx = self._rpo_index(node)
+        if idx is not None:
+            del self.rpo[idx]
         del node
 
+    def _rpo_index(self, node):
+        '''
+        Return the position of node in the rpo list, or None if it is not in it.
+        Once computed, the rpo list is sorted by node number so we look for the
+        node by bisection, and only fall back to a scan if the list has been
+        modified since.
+        '''
+        rpo = self.rpo
+        lo, hi = 0, len(rpo)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if rpo[mid].num < node.num:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(rpo) and rpo[lo] is node:
+            return lo
+        for idx, rpo_node in enumerate(rpo):
+            if rpo_node is node:
+                return idx
+        return None
+
     def number_ins(self):
+        '''
+        Number the instructions of the graph in reverse post order.
+        The instruction ranges of the nodes are stored as two sorted arrays
+        (start locations, and (end location, node) pairs) so that the node
+        holding a location can be found by bisection.
+        '''
         self.loc_to_ins = {}
-        self.loc_to_node = {}
+        self.loc_to_node = []
+        self.loc_starts = []
         num = 0
         for node in self.rpo:
             start_node = num
             num = node.number_ins(num)
             end_node = num - 1
             self.loc_to_ins.update(node.get_loc_with_ins())
-            self.loc_to_node[start_node, end_node] = node
+            self.loc_starts.append(start_node)
+            self.loc_to_node.append((end_node, node))
 
     def get_ins_from_loc(self, loc):
         return self.loc_to_ins.get(loc)
 
     def get_node_from_loc(self, loc):
-        for (start, end), node in self.loc_to_node.items():
-            if start <= loc <= end:
+        # Nodes without instructions share their start location with the
+        # next node, so the right-most node starting before loc is the only
+        # one which may hold it.
+        idx = bisect_right(self.loc_starts, loc) - 1
+        if idx >= 0:
+            end, node = self.loc_to_node[idx]
+            if loc <= end:
                 return node
 
     def remove_ins(self, loc):
@@ -181,12 +219,15 @@ class Graph(object):
         return len(self.nodes)
 
     def __repr__(self):
-        return str(self.nodes)
+        return str(list(self.nodes))
 
     def __iter__(self):
         for node in self.nodes:
             yield node
 
+    def __contains__(self, node):
+        return node in self.nodes
+
 
 def split_if_nodes(graph):
     '''
@@ -195,7 +236,7 @@ def split_if_nodes(graph):
     '''
     node_map = {n: n for n in graph}
     to_update = set()
-    for node in graph.nodes[:]:
+    for node in list(graph.nodes):
         if node.type.is_cond:
             if len(node.get_ins()) > 1:
                 pre_ins = node.get_ins()[:-1]
@@ -264,7 +305,7 @@ def simplify(graph):
         redo = False
         node_map = {}
         to_update = set()
-        for node in graph.nodes[:]:
+        for node in list(graph.nodes):
             if node.type.is_stmt and node in graph:
                 sucs = graph.all_sucs(node)
                 if len(sucs) != 1:
@@ -1008,6 +1008,9 @@ class FillArrayExpression(ArrayExpression):
     def visit(self, visitor):
         return visitor.visit_fill_array(self.var_map[self.reg], self.value)
 
+    def __str__(self):
+        return 'FILLARRAY(%s)' % self.var_map[self.reg]
+
 
 class RefExpression(IRForm):
 
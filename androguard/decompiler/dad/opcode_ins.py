@@ -119,88 +119,88 @@ def nop(ins, vmap):
 
 # move vA, vB ( 4b, 4b )
 def move(ins, vmap):
-    logger.debug('Move %s', ins.get_output())
+    logger.debug('Move %s', util.LazyOutput(ins))
     reg_a, reg_b = get_variables(vmap, ins.A, ins.B)
     return MoveExpression(reg_a, reg_b)
 
 
 # move/from16 vAA, vBBBB ( 8b, 16b )
 def movefrom16(ins, vmap):
-    logger.debug('MoveFrom16 %s', ins.get_output())
+    logger.debug('MoveFrom16 %s', util.LazyOutput(ins))
     reg_a, reg_b = get_variables(vmap, ins.AA, ins.BBBB)
     return MoveExpression(reg_a, reg_b)
 
 
 # move/16 vAAAA, vBBBB ( 16b, 16b )
 def move16(ins, vmap):
-    logger.debug('Move16 %s', ins.get_output())
+    logger.debug('Move16 %s', util.LazyOutput(ins))
     reg_a, reg_b = get_variables(vmap, ins.AAAA, ins.BBBB)
     return MoveExpression(reg_a, reg_b)
 
 
 # move-wide vA, vB ( 4b, 4b )
 def movewide(ins, vmap):
-    logger.debug('MoveWide %s', ins.get_output())
+    logger.debug('MoveWide %s', util.LazyOutput(ins))
     reg_a, reg_b = get_variables(vmap, ins.A, ins.B)
     return MoveExpression(reg_a, reg_b)
 
 
 # move-wide/from16 vAA, vBBBB ( 8b, 16b )
 def movewidefrom16(ins, vmap):
-    logger.debug('MoveWideFrom16 : %s', ins.get_output())
+    logger.debug('MoveWideFrom16 : %s', util.LazyOutput(ins))
     reg_a, reg_b = get_variables(vmap, ins.AA, ins.BBBB)
     return MoveExpression(reg_a, reg_b)
 
 
 # move-wide/16 vAAAA, vBBBB ( 16b, 16b )
 def movewide16(ins, vmap):
-    logger.debug('MoveWide16 %s', ins.get_output())
+    logger.debug('MoveWide16 %s', util.LazyOutput(ins))
     reg_a, reg_b = get_variables(vmap, ins.AAAA, ins.BBBB)
     return MoveExpression(reg_a, reg_b)
 
 
 # move-object vA, vB ( 4b, 4b )
 def moveobject(ins, vmap):
-    logger.debug('MoveObject %s', ins.get_output())
+    logger.debug('MoveObject %s', util.LazyOutput(ins))
     reg_a, reg_b = get_variables(vmap, ins.A, ins.B)
     return MoveExpression(reg_a, reg_b)
 
 
 # move-object/from16 vAA, vBBBB ( 8b, 16b )
 def moveobjectfrom16(ins, vmap):
-    logger.debug('MoveObjectFrom16 : %s', ins.get_output())
+    logger.debug('MoveObjectFrom16 : %s', util.LazyOutput(ins))
     reg_a, reg_b = get_variables(vmap, ins.AA, ins.BBBB)
     return MoveExpression(reg_a, reg_b)
 
 
 # move-object/16 vAAAA, vBBBB ( 16b, 16b )
 def moveobject16(ins, vmap):
-    logger.debug('MoveObject16 : %s', ins.get_output())
+    logger.debug('MoveObject16 : %s', util.LazyOutput(ins))
     reg_a, reg_b = get_variables(vmap, ins.AAAA, ins.BBBB)
     return MoveExpression(reg_a, reg_b)
 
 
 # move-result vAA ( 8b )
 def moveresult(ins, vmap, ret):
-    logger.debug('MoveResult : %s', ins.get_output())
+    logger.debug('MoveResult : %s', util.LazyOutput(ins))
     return MoveResultExpression(get_variables(vmap, ins.AA), ret)
 
 
 # move-result-wide vAA ( 8b )
 def moveresultwide(ins, vmap, ret):
-    logger.debug('MoveResultWide : %s', ins.get_output())
+    logger.debug('MoveResultWide : %s', util.LazyOutput(ins))
     return MoveResultExpression(get_variables(vmap, ins.AA), ret)
 
 
 # move-result-object vAA ( 8b )
 def moveresultobject(ins, vmap, ret):
-    logger.debug('MoveResultObject : %s', ins.get_output())
+    logger.debug('MoveResultObject : %s', util.LazyOutput(ins))
     return MoveResultExpression(get_variables(vmap, ins.AA), ret)
 
 
 # move-exception vAA ( 8b )
 def moveexception(ins, vmap, _type):
-    logger.debug('MoveException : %s', ins.get_output())
+    logger.debug('MoveException : %s', util.LazyOutput(ins))
     return MoveExceptionExpression(get_variables(vmap, ins.AA), _type)
 
 
@@ -212,39 +212,39 @@ def returnvoid(ins, vmap):
 
 # return vAA ( 8b )
 def return_reg(ins, vmap):
-    logger.debug('Return : %s', ins.get_output())
+    logger.debug('Return : %s', util.LazyOutput(ins))
     return ReturnInstruction(get_variables(vmap, ins.AA))
 
 
 # return-wide vAA ( 8b )
 def returnwide(ins, vmap):
-    logger.debug('ReturnWide : %s', ins.get_output())
+    logger.debug('ReturnWide : %s', util.LazyOutput(ins))
     return ReturnInstruction(get_variables(vmap, ins.AA))
 
 
 # return-object vAA ( 8b )
 def returnobject(ins, vmap):
-    logger.debug('ReturnObject : %s', ins.get_output())
+    logger.debug('ReturnObject : %s', util.LazyOutput(ins))
     return ReturnInstruction(get_variables(vmap, ins.AA))
 
 
 # const/4 vA, #+B ( 4b, 4b )
 def const4(ins, vmap):
-    logger.debug('Const4 : %s', ins.get_output())
+    logger.debug('Const4 : %s', util.LazyOutput(ins))
     cst = Constant(ins.B, 'I')
     return assign_const(ins.A, cst, vmap)
 
 
 # const/16 vAA, #+BBBB ( 8b, 16b )
 def const16(ins, vmap):
-    logger.debug('Const16 : %s', ins.get_output())
+    logger.debug('Const16 : %s', util.LazyOutput(ins))
     cst = Constant(ins.BBBB, 'I')
     return assign_const(ins.AA, cst, vmap)
 
 
 # const vAA, #+BBBBBBBB ( 8b, 32b )
 def const(ins, vmap):
-    logger.debug('Const : %s', ins.get_output())
+    logger.debug('Const : %s', util.LazyOutput(ins))
     value = unpack("=f", pack("=i", ins.BBBBBBBB))[0]
     cst = Constant(value, 'I', ins.BBBBBBBB)
     return assign_const(ins.AA, cst, vmap)
@@ -252,7 +252,7 @@ def const(ins, vmap):
 
 # const/high16 vAA, #+BBBB0000 ( 8b, 16b )
 def consthigh16(ins, vmap):
-    logger.debug('ConstHigh16 : %s', ins.get_output())
+    logger.debug('ConstHigh16 : %s', util.LazyOutput(ins))
     value = unpack('=f', pack('=i', ins.BBBB << 16))[0]
     cst = Constant(value, 'I', ins.BBBB << 16)
     return assign_const(ins.AA, cst, vmap)
@@ -260,7 +260,7 @@ def consthigh16(ins, vmap):
 
 # const-wide/16 vAA, #+BBBB ( 8b, 16b )
 def constwide16(ins, vmap):
-    logger.debug('ConstWide16 : %s', ins.get_output())
+    logger.debug('ConstWide16 : %s', util.LazyOutput(ins))
     value = unpack('=d', pack('=d', ins.BBBB))[0]
     cst = Constant(value, 'J', ins.BBBB)
     return assign_const(ins.AA, cst, vmap)
@@ -268,7 +268,7 @@ def constwide16(ins, vmap):
 
 # const-wide/32 vAA, #+BBBBBBBB ( 8b, 32b )
 def constwide32(ins, vmap):
-    logger.debug('ConstWide32 : %s', ins.get_output())
+    logger.debug('ConstWide32 : %s', util.LazyOutput(ins))
     value = unpack('=d', pack('=d', ins.BBBBBBBB))[0]
     cst = Constant(value, 'J', ins.BBBBBBBB)
     return assign_const(ins.AA, cst, vmap)
@@ -276,7 +276,7 @@ def constwide32(ins, vmap):
 
 # const-wide vAA, #+BBBBBBBBBBBBBBBB ( 8b, 64b )
 def constwide(ins, vmap):
-    logger.debug('ConstWide : %s', ins.get_output())
+    logger.debug('ConstWide : %s', util.LazyOutput(ins))
     value = unpack('=d', pack('=q', ins.BBBBBBBBBBBBBBBB))[0]
     cst = Constant(value, 'D', ins.BBBBBBBBBBBBBBBB)
     return assign_const(ins.AA, cst, vmap)
@@ -284,7 +284,7 @@ def constwide(ins, vmap):
 
 # const-wide/high16 vAA, #+BBBB000000000000 ( 8b, 16b )
 def constwidehigh16(ins, vmap):
-    logger.debug('ConstWideHigh16 : %s', ins.get_output())
+    logger.debug('ConstWideHigh16 : %s', util.LazyOutput(ins))
     value = unpack('=d', b'\x00\x00\x00\x00\x00\x00' + pack('=h', ins.BBBB))[0]
     cst = Constant(value, 'D', ins.BBBB)
     return assign_const(ins.AA, cst, vmap)
@@ -292,21 +292,21 @@ def constwidehigh16(ins, vmap):
 
 # const-string vAA ( 8b )
 def conststring(ins, vmap):
-    logger.debug('ConstString : %s', ins.get_output())
+    logger.debug('ConstString : %s', util.LazyOutput(ins))
     cst = Constant(ins.get_raw_string(), 'Ljava/lang/String;')
     return assign_const(ins.AA, cst, vmap)
 
 
 # const-string/jumbo vAA ( 8b )
 def conststringjumbo(ins, vmap):
-    logger.debug('ConstStringJumbo %s', ins.get_output())
+    logger.debug('ConstStringJumbo %s', util.LazyOutput(ins))
     cst = Constant(ins.get_raw_string(), 'Ljava/lang/String;')
     return assign_const(ins.AA, cst, vmap)
 
 
 # const-class vAA, type@BBBB ( 8b )
 def constclass(ins, vmap):
-    logger.debug('ConstClass : %s', ins.get_output())
+    logger.debug('ConstClass : %s', util.LazyOutput(ins))
     cst = Constant(util.get_type(ins.get_string()),
                    'Ljava/lang/Class;',
                    descriptor=ins.get_string())
@@ -315,20 +315,20 @@ def constclass(ins, vmap):
 
 # monitor-enter vAA ( 8b )
 def monitorenter(ins, vmap):
-    logger.debug('MonitorEnter : %s', ins.get_output())
+    logger.debug('MonitorEnter : %s', util.LazyOutput(ins))
     return MonitorEnterExpression(get_variables(vmap, ins.AA))
 
 
 # monitor-exit vAA ( 8b )
 def monitorexit(ins, vmap):
-    logger.debug('MonitorExit : %s', ins.get_output())
+    logger.debug('MonitorExit : %s', util.LazyOutput(ins))
     a = get_variables(vmap, ins.AA)
     return MonitorExitExpression(a)
 
 
 # check-cast vAA ( 8b )
 def checkcast(ins, vmap):
-    logger.debug('CheckCast: %s', ins.get_output())
+    logger.debug('CheckCast: %s', util.LazyOutput(ins))
     cast_type = util.get_type(ins.get_translated_kind())
     cast_var = get_variables(vmap, ins.AA)
     cast_expr = CheckCastExpression(cast_var,
@@ -339,7 +339,7 @@ def checkcast(ins, vmap):
 
 # instance-of vA, vB ( 4b, 4b )
 def instanceof(ins, vmap):
-    logger.debug('InstanceOf : %s', ins.get_output())
+    logger.debug('InstanceOf : %s', util.LazyOutput(ins))
     reg_a, reg_b = get_variables(vmap, ins.A, ins.B)
     reg_c = BaseClass(util.get_type(ins.get_translated_kind()),
                       descriptor=ins.get_translated_kind())
@@ -349,14 +349,14 @@ def instanceof(ins, vmap):
 
 # array-length vA, vB ( 4b, 4b )
 def arraylength(ins, vmap):
-    logger.debug('ArrayLength: %s', ins.get_output())
+    logger.debug('ArrayLength: %s', util.LazyOutput(ins))
     reg_a, reg_b = get_variables(vmap, ins.A, ins.B)
     return AssignExpression(reg_a, ArrayLengthExpression(reg_b))
 
 
 # new-instance vAA ( 8b )
 def newinstance(ins, vmap):
-    logger.debug('NewInstance : %s', ins.get_output())
+    logger.debug('NewInstance : %s', util.LazyOutput(ins))
     reg_a = get_variables(vmap, ins.AA)
     ins_type = ins.cm.get_type(ins.BBBB)
     return AssignExpression(reg_a, NewInstance(ins_type))
@@ -364,7 +364,7 @@ def newinstance(ins, vmap):
 
 # new-array vA, vB ( 8b, size )
 def newarray(ins, vmap):
-    logger.debug('NewArray : %s', ins.get_output())
+    logger.debug('NewArray : %s', util.LazyOutput(ins))
     a, b = get_variables(vmap, ins.A, ins.B)
     exp = NewArrayExpression(b, ins.cm.get_type(ins.CCCC))
     return AssignExpression(a, exp)
@@ -372,7 +372,7 @@ def newarray(ins, vmap):
 
 # filled-new-array {vD, vE, vF, vG, vA} ( 4b each )
 def fillednewarray(ins, vmap, ret):
-    logger.debug('FilledNewArray : %s', ins.get_output())
+    logger.debug('FilledNewArray : %s', util.LazyOutput(ins))
     c, d, e, f, g = get_variables(vmap, ins.C, ins.D, ins.E, ins.F, ins.G)
     array_type = ins.cm.get_type(ins.BBBB)
     exp = FilledArrayExpression(ins.A, array_type, [c, d, e, f, g][:ins.A])
@@ -381,7 +381,7 @@ def fillednewarray(ins, vmap, ret):
 
 # filled-new-array/range {vCCCC..vNNNN} ( 16b )
 def fillednewarrayrange(ins, vmap, ret):
-    logger.debug('FilledNewArrayRange : %s', ins.get_output())
+    logger.debug('FilledNewArrayRange : %s', util.LazyOutput(ins))
     a, c, n = get_variables(vmap, ins.AA, ins.CCCC, ins.NNNN)
     array_type = ins.cm.get_type(ins.BBBB)
     exp = FilledArrayExpression(a, array_type, [c, n])
@@ -390,19 +390,19 @@ def fillednewarrayrange(ins, vmap, ret):
 
 # fill-array-data vAA, +BBBBBBBB ( 8b, 32b )
 def fillarraydata(ins, vmap, value):
-    logger.debug('FillArrayData : %s', ins.get_output())
+    logger.debug('FillArrayData : %s', util.LazyOutput(ins))
     return FillArrayExpression(get_variables(vmap, ins.AA), value)
 
 
 # fill-array-data-payload vAA, +BBBBBBBB ( 8b, 32b )
 def fillarraydatapayload(ins, vmap):
-    logger.debug('FillArrayDataPayload : %s', ins.get_output())
+    logger.debug('FillArrayDataPayload : %s', util.LazyOutput(ins))
     return FillArrayExpression(None)
 
 
 # throw vAA ( 8b )
 def throw(ins, vmap):
-    logger.debug('Throw : %s', ins.get_output())
+    logger.debug('Throw : %s', util.LazyOutput(ins))
     return ThrowExpression(get_variables(vmap, ins.AA))
 
 
@@ -423,214 +423,214 @@ def goto32(ins, vmap):
 
 # packed-switch vAA, +BBBBBBBB ( reg to test, 32b )
 def packedswitch(ins, vmap):
-    logger.debug('PackedSwitch : %s', ins.get_output())
+    logger.debug('PackedSwitch : %s', util.LazyOutput(ins))
     reg_a = get_variables(vmap, ins.AA)
     return SwitchExpression(reg_a, ins.BBBBBBBB)
 
 
 # sparse-switch vAA, +BBBBBBBB ( reg to test, 32b )
 def sparseswitch(ins, vmap):
-    logger.debug('SparseSwitch : %s', ins.get_output())
+    logger.debug('SparseSwitch : %s', util.LazyOutput(ins))
     reg_a = get_variables(vmap, ins.AA)
     return SwitchExpression(reg_a, ins.BBBBBBBB)
 
 
 # cmpl-float vAA, vBB, vCC ( 8b, 8b, 8b )
 def cmplfloat(ins, vmap):
-    logger.debug('CmpglFloat : %s', ins.get_output())
+    logger.debug('CmpglFloat : %s', util.LazyOutput(ins))
     return assign_cmp(ins.AA, ins.BB, ins.CC, 'F', vmap)
 
 
 # cmpg-float vAA, vBB, vCC ( 8b, 8b, 8b )
 def cmpgfloat(ins, vmap):
-    logger.debug('CmpgFloat : %s', ins.get_output())
+    logger.debug('CmpgFloat : %s', util.LazyOutput(ins))
     return assign_cmp(ins.AA, ins.BB, ins.CC, 'F', vmap)
 
 
 # cmpl-double vAA, vBB, vCC ( 8b, 8b, 8b )
 def cmpldouble(ins, vmap):
-    logger.debug('CmplDouble : %s', ins.get_output())
+    logger.debug('CmplDouble : %s', util.LazyOutput(ins))
     return assign_cmp(ins.AA, ins.BB, ins.CC, 'D', vmap)
 
 
 # cmpg-double vAA, vBB, vCC ( 8b, 8b, 8b )
 def cmpgdouble(ins, vmap):
-    logger.debug('CmpgDouble : %s', ins.get_output())
+    logger.debug('CmpgDouble : %s', util.LazyOutput(ins))
     return assign_cmp(ins.AA, ins.BB, ins.CC, 'D', vmap)
 
 
 # cmp-long vAA, vBB, vCC ( 8b, 8b, 8b )
 def cmplong(ins, vmap):
-    logger.debug('CmpLong : %s', ins.get_output())
+    logger.debug('CmpLong : %s', util.LazyOutput(ins))
     return assign_cmp(ins.AA, ins.BB, ins.CC, 'J', vmap)
 
 
 # if-eq vA, vB, +CCCC ( 4b, 4b, 16b )
 def ifeq(ins, vmap):
-    logger.debug('IfEq : %s', ins.get_output())
+    logger.debug('IfEq : %s', util.LazyOutput(ins))
     a, b = get_variables(vmap, ins.A, ins.B)
     return ConditionalExpression(Op.EQUAL, a, b)
 
 
 # if-ne vA, vB, +CCCC ( 4b, 4b, 16b )
 def ifne(ins, vmap):
-    logger.debug('IfNe : %s', ins.get_output())
+    logger.debug('IfNe : %s', util.LazyOutput(ins))
     a, b = get_variables(vmap, ins.A, ins.B)
     return ConditionalExpression(Op.NEQUAL, a, b)
 
 
 # if-lt vA, vB, +CCCC ( 4b, 4b, 16b )
 def iflt(ins, vmap):
-    logger.debug('IfLt : %s', ins.get_output())
+    logger.debug('IfLt : %s', util.LazyOutput(ins))
     a, b = get_variables(vmap, ins.A, ins.B)
     return ConditionalExpression(Op.LOWER, a, b)
 
 
 # if-ge vA, vB, +CCCC ( 4b, 4b, 16b )
 def ifge(ins, vmap):
-    logger.debug('IfGe : %s', ins.get_output())
+    logger.debug('IfGe : %s', util.LazyOutput(ins))
     a, b = get_variables(vmap, ins.A, ins.B)
     return ConditionalExpression(Op.GEQUAL, a, b)
 
 
 # if-gt vA, vB, +CCCC ( 4b, 4b, 16b )
 def ifgt(ins, vmap):
-    logger.debug('IfGt : %s', ins.get_output())
+    logger.debug('IfGt : %s', util.LazyOutput(ins))
     a, b = get_variables(vmap, ins.A, ins.B)
     return ConditionalExpression(Op.GREATER, a, b)
 
 
 # if-le vA, vB, +CCCC ( 4b, 4b, 16b )
 def ifle(ins, vmap):
-    logger.debug('IfLe : %s', ins.get_output())
+    logger.debug('IfLe : %s', util.LazyOutput(ins))
     a, b = get_variables(vmap, ins.A, ins.B)
     return ConditionalExpression(Op.LEQUAL, a, b)
 
 
 # if-eqz vAA, +BBBB ( 8b, 16b )
 def ifeqz(ins, vmap):
-    logger.debug('IfEqz : %s', ins.get_output())
+    logger.debug('IfEqz : %s', util.LazyOutput(ins))
     return ConditionalZExpression(Op.EQUAL, get_variables(vmap, ins.AA))
 
 
 # if-nez vAA, +BBBB ( 8b, 16b )
 def ifnez(ins, vmap):
-    logger.debug('IfNez : %s', ins.get_output())
+    logger.debug('IfNez : %s', util.LazyOutput(ins))
     return ConditionalZExpression(Op.NEQUAL, get_variables(vmap, ins.AA))
 
 
 # if-ltz vAA, +BBBB ( 8b, 16b )
 def ifltz(ins, vmap):
-    logger.debug('IfLtz : %s', ins.get_output())
+    logger.debug('IfLtz : %s', util.LazyOutput(ins))
     return ConditionalZExpression(Op.LOWER, get_variables(vmap, ins.AA))
 
 
 # if-gez vAA, +BBBB ( 8b, 16b )
 def ifgez(ins, vmap):
-    logger.debug('IfGez : %s', ins.get_output())
+    logger.debug('IfGez : %s', util.LazyOutput(ins))
     return ConditionalZExpression(Op.GEQUAL, get_variables(vmap, ins.AA))
 
 
 # if-gtz vAA, +BBBB ( 8b, 16b )
 def ifgtz(ins, vmap):
-    logger.debug('IfGtz : %s', ins.get_output())
+    logger.debug('IfGtz : %s', util.LazyOutput(ins))
     return ConditionalZExpression(Op.GREATER, get_variables(vmap, ins.AA))
 
 
 # if-lez vAA, +BBBB (8b, 16b )
 def iflez(ins, vmap):
-    logger.debug('IfLez : %s', ins.get_output())
+    logger.debug('IfLez : %s', util.LazyOutput(ins))
     return ConditionalZExpression(Op.LEQUAL, get_variables(vmap, ins.AA))
 
 
 #TODO: check type for all aget
 # aget vAA, vBB, vCC ( 8b, 8b, 8b )
 def aget(ins, vmap):
-    logger.debug('AGet : %s', ins.get_output())
+    logger.debug('AGet : %s', util.LazyOutput(ins))
     return load_array_exp(ins.AA, ins.BB, ins.CC, None, vmap)
 
 
 # aget-wide vAA, vBB, vCC ( 8b, 8b, 8b )
 def agetwide(ins, vmap):
-    logger.debug('AGetWide : %s', ins.get_output())
+    logger.debug('AGetWide : %s', util.LazyOutput(ins))
     return load_array_exp(ins.AA, ins.BB, ins.CC, 'W', vmap)
 
 
 # aget-object vAA, vBB, vCC ( 8b, 8b, 8b )
 def agetobject(ins, vmap):
-    logger.debug('AGetObject : %s', ins.get_output())
+    logger.debug('AGetObject : %s', util.LazyOutput(ins))
     return load_array_exp(ins.AA, ins.BB, ins.CC, 'O', vmap)
 
 
 # aget-boolean vAA, vBB, vCC ( 8b, 8b, 8b )
 def agetboolean(ins, vmap):
-    logger.debug('AGetBoolean : %s', ins.get_output())
+    logger.debug('AGetBoolean : %s', util.LazyOutput(ins))
     return load_array_exp(ins.AA, ins.BB, ins.CC, 'Z', vmap)
 
 
 # aget-byte vAA, vBB, vCC ( 8b, 8b, 8b )
 def agetbyte(ins, vmap):
-    logger.debug('AGetByte : %s', ins.get_output())
+    logger.debug('AGetByte : %s', util.LazyOutput(ins))
     return load_array_exp(ins.AA, ins.BB, ins.CC, 'B', vmap)
 
 
 # aget-char vAA, vBB, vCC ( 8b, 8b, 8b )
 def agetchar(ins, vmap):
-    logger.debug('AGetChar : %s', ins.get_output())
+    logger.debug('AGetChar : %s', util.LazyOutput(ins))
     return load_array_exp(ins.AA, ins.BB, ins.CC, 'C', vmap)
 
 
 # aget-short vAA, vBB, vCC ( 8b, 8b, 8b )
 def agetshort(ins, vmap):
-    logger.debug('AGetShort : %s', ins.get_output())
+    logger.debug('AGetShort : %s', util.LazyOutput(ins))
     return load_array_exp(ins.AA, ins.BB, ins.CC, 'S', vmap)
 
 
 # aput vAA, vBB, vCC
 def aput(ins, vmap):
-    logger.debug('APut : %s', ins.get_output())
+    logger.debug('APut : %s', util.LazyOutput(ins))
     return store_array_inst(ins.AA, ins.BB, ins.CC, None, vmap)
 
 
 # aput-wide vAA, vBB, vCC ( 8b, 8b, 8b )
 def aputwide(ins, vmap):
-    logger.debug('APutWide : %s', ins.get_output())
+    logger.debug('APutWide : %s', util.LazyOutput(ins))
     return store_array_inst(ins.AA, ins.BB, ins.CC, 'W', vmap)
 
 
 # aput-object vAA, vBB, vCC ( 8b, 8b, 8b )
 def aputobject(ins, vmap):
-    logger.debug('APutObject : %s', ins.get_output())
+    logger.debug('APutObject : %s', util.LazyOutput(ins))
     return store_array_inst(ins.AA, ins.BB, ins.CC, 'O', vmap)
 
 
 # aput-boolean vAA, vBB, vCC ( 8b, 8b, 8b )
 def aputboolean(ins, vmap):
-    logger.debug('APutBoolean : %s', ins.get_output())
+    logger.debug('APutBoolean : %s', util.LazyOutput(ins))
     return store_array_inst(ins.AA, ins.BB, ins.CC, 'Z', vmap)
 
 
 # aput-byte vAA, vBB, vCC ( 8b, 8b, 8b )
 def aputbyte(ins, vmap):
-    logger.debug('APutByte : %s', ins.get_output())
+    logger.debug('APutByte : %s', util.LazyOutput(ins))
     return store_array_inst(ins.AA, ins.BB, ins.CC, 'B', vmap)
 
 
 # aput-char vAA, vBB, vCC ( 8b, 8b, 8b )
 def aputchar(ins, vmap):
-    logger.debug('APutChar : %s', ins.get_output())
+    logger.debug('APutChar : %s', util.LazyOutput(ins))
     return store_array_inst(ins.AA, ins.BB, ins.CC, 'C', vmap)
 
 
 # aput-short vAA, vBB, vCC ( 8b, 8b, 8b )
 def aputshort(ins, vmap):
-    logger.debug('APutShort : %s', ins.get_output())
+    logger.debug('APutShort : %s', util.LazyOutput(ins))
     return store_array_inst(ins.AA, ins.BB, ins.CC, 'S', vmap)
 
 
 # iget vA, vB ( 4b, 4b )
 def iget(ins, vmap):
-    logger.debug('IGet : %s', ins.get_output())
+    logger.debug('IGet : %s', util.LazyOutput(ins))
     klass, ftype, name = ins.cm.get_field(ins.CCCC)
     a, b = get_variables(vmap, ins.A, ins.B)
     exp = InstanceExpression(b, klass, ftype, name)
@@ -639,7 +639,7 @@ def iget(ins, vmap):
 
 # iget-wide vA, vB ( 4b, 4b )
 def igetwide(ins, vmap):
-    logger.debug('IGetWide : %s', ins.get_output())
+    logger.debug('IGetWide : %s', util.LazyOutput(ins))
     klass, ftype, name = ins.cm.get_field(ins.CCCC)
     a, b = get_variables(vmap, ins.A, ins.B)
     exp = InstanceExpression(b, klass, ftype, name)
@@ -648,7 +648,7 @@ def igetwide(ins, vmap):
 
 # iget-object vA, vB ( 4b, 4b )
 def igetobject(ins, vmap):
-    logger.debug('IGetObject : %s', ins.get_output())
+    logger.debug('IGetObject : %s', util.LazyOutput(ins))
     klass, ftype, name = ins.cm.get_field(ins.CCCC)
     a, b = get_variables(vmap, ins.A, ins.B)
     exp = InstanceExpression(b, klass, ftype, name)
@@ -657,7 +657,7 @@ def igetobject(ins, vmap):
 
 # iget-boolean vA, vB ( 4b, 4b )
 def igetboolean(ins, vmap):
-    logger.debug('IGetBoolean : %s', ins.get_output())
+    logger.debug('IGetBoolean : %s', util.LazyOutput(ins))
     klass, ftype, name = ins.cm.get_field(ins.CCCC)
     a, b = get_variables(vmap, ins.A, ins.B)
     exp = InstanceExpression(b, klass, ftype, name)
@@ -666,7 +666,7 @@ def igetboolean(ins, vmap):
 
 # iget-byte vA, vB ( 4b, 4b )
 def igetbyte(ins, vmap):
-    logger.debug('IGetByte : %s', ins.get_output())
+    logger.debug('IGetByte : %s', util.LazyOutput(ins))
     klass, ftype, name = ins.cm.get_field(ins.CCCC)
     a, b = get_variables(vmap, ins.A, ins.B)
     exp = InstanceExpression(b, klass, ftype, name)
@@ -675,7 +675,7 @@ def igetbyte(ins, vmap):
 
 # iget-char vA, vB ( 4b, 4b )
 def igetchar(ins, vmap):
-    logger.debug('IGetChar : %s', ins.get_output())
+    logger.debug('IGetChar : %s', util.LazyOutput(ins))
     klass, ftype, name = ins.cm.get_field(ins.CCCC)
     a, b = get_variables(vmap, ins.A, ins.B)
     exp = InstanceExpression(b, klass, ftype, name)
@@ -684,7 +684,7 @@ def igetchar(ins, vmap):
 
 # iget-short vA, vB ( 4b, 4b )
 def igetshort(ins, vmap):
-    logger.debug('IGetShort : %s', ins.get_output())
+    logger.debug('IGetShort : %s', util.LazyOutput(ins))
     klass, ftype, name = ins.cm.get_field(ins.CCCC)
     a, b = get_variables(vmap, ins.A, ins.B)
     exp = InstanceExpression(b, klass, ftype, name)
@@ -693,7 +693,7 @@ def igetshort(ins, vmap):
 
 # iput vA, vB ( 4b, 4b )
 def iput(ins, vmap):
-    logger.debug('IPut %s', ins.get_output())
+    logger.debug('IPut %s', util.LazyOutput(ins))
     klass, atype, name = ins.cm.get_field(ins.CCCC)
     a, b = get_variables(vmap, ins.A, ins.B)
     return InstanceInstruction(a, b, klass, atype, name)
@@ -701,7 +701,7 @@ def iput(ins, vmap):
 
 # iput-wide vA, vB ( 4b, 4b )
 def iputwide(ins, vmap):
-    logger.debug('IPutWide %s', ins.get_output())
+    logger.debug('IPutWide %s', util.LazyOutput(ins))
     klass, atype, name = ins.cm.get_field(ins.CCCC)
     a, b = get_variables(vmap, ins.A, ins.B)
     return InstanceInstruction(a, b, klass, atype, name)
@@ -709,7 +709,7 @@ def iputwide(ins, vmap):
 
 # iput-object vA, vB ( 4b, 4b )
 def iputobject(ins, vmap):
-    logger.debug('IPutObject %s', ins.get_output())
+    logger.debug('IPutObject %s', util.LazyOutput(ins))
     klass, atype, name = ins.cm.get_field(ins.CCCC)
     a, b = get_variables(vmap, ins.A, ins.B)
     return InstanceInstruction(a, b, klass, atype, name)
@@ -717,7 +717,7 @@ def iputobject(ins, vmap):
 
 # iput-boolean vA, vB ( 4b, 4b )
 def iputboolean(ins, vmap):
-    logger.debug('IPutBoolean %s', ins.get_output())
+    logger.debug('IPutBoolean %s', util.LazyOutput(ins))
     klass, atype, name = ins.cm.get_field(ins.CCCC)
     a, b = get_variables(vmap, ins.A, ins.B)
     return InstanceInstruction(a, b, klass, atype, name)
@@ -725,7 +725,7 @@ def iputboolean(ins, vmap):
 
 # iput-byte vA, vB ( 4b, 4b )
 def iputbyte(ins, vmap):
-    logger.debug('IPutByte %s', ins.get_output())
+    logger.debug('IPutByte %s', util.LazyOutput(ins))
     klass, atype, name = ins.cm.get_field(ins.CCCC)
     a, b = get_variables(vmap, ins.A, ins.B)
     return InstanceInstruction(a, b, klass, atype, name)
@@ -733,7 +733,7 @@ def iputbyte(ins, vmap):
 
 # iput-char vA, vB ( 4b, 4b )
 def iputchar(ins, vmap):
-    logger.debug('IPutChar %s', ins.get_output())
+    logger.debug('IPutChar %s', util.LazyOutput(ins))
     klass, atype, name = ins.cm.get_field(ins.CCCC)
     a, b = get_variables(vmap, ins.A, ins.B)
     return InstanceInstruction(a, b, klass, atype, name)
@@ -741,7 +741,7 @@ def iputchar(ins, vmap):
 
 # iput-short vA, vB ( 4b, 4b )
 def iputshort(ins, vmap):
-    logger.debug('IPutShort %s', ins.get_output())
+    logger.debug('IPutShort %s', util.LazyOutput(ins))
     klass, atype, name = ins.cm.get_field(ins.CCCC)
     a, b = get_variables(vmap, ins.A, ins.B)
     return InstanceInstruction(a, b, klass, atype, name)
@@ -749,7 +749,7 @@ def iputshort(ins, vmap):
 
 # sget vAA ( 8b )
 def sget(ins, vmap):
-    logger.debug('SGet : %s', ins.get_output())
+    logger.debug('SGet : %s', util.LazyOutput(ins))
     klass, atype, name = ins.cm.get_field(ins.BBBB)
     exp = StaticExpression(klass, atype, name)
     a = get_variables(vmap, ins.AA)
@@ -758,7 +758,7 @@ def sget(ins, vmap):
 
 # sget-wide vAA ( 8b )
 def sgetwide(ins, vmap):
-    logger.debug('SGetWide : %s', ins.get_output())
+    logger.debug('SGetWide : %s', util.LazyOutput(ins))
     klass, atype, name = ins.cm.get_field(ins.BBBB)
     exp = StaticExpression(klass, atype, name)
     a = get_variables(vmap, ins.AA)
@@ -767,7 +767,7 @@ def sgetwide(ins, vmap):
 
 # sget-object vAA ( 8b )
 def sgetobject(ins, vmap):
-    logger.debug('SGetObject : %s', ins.get_output())
+    logger.debug('SGetObject : %s', util.LazyOutput(ins))
     klass, atype, name = ins.cm.get_field(ins.BBBB)
     exp = StaticExpression(klass, atype, name)
     a = get_variables(vmap, ins.AA)
@@ -776,7 +776,7 @@ def sgetobject(ins, vmap):
 
 # sget-boolean vAA ( 8b )
 def sgetboolean(ins, vmap):
-    logger.debug('SGetBoolean : %s', ins.get_output())
+    logger.debug('SGetBoolean : %s', util.LazyOutput(ins))
     klass, atype, name = ins.cm.get_field(ins.BBBB)
     exp = StaticExpression(klass, atype, name)
     a = get_variables(vmap, ins.AA)
@@ -785,7 +785,7 @@ def sgetboolean(ins, vmap):
 
 # sget-byte vAA ( 8b )
 def sgetbyte(ins, vmap):
-    logger.debug('SGetByte : %s', ins.get_output())
+    logger.debug('SGetByte : %s', util.LazyOutput(ins))
     klass, atype, name = ins.cm.get_field(ins.BBBB)
     exp = StaticExpression(klass, atype, name)
     a = get_variables(vmap, ins.AA)
@@ -794,7 +794,7 @@ def sgetbyte(ins, vmap):
 
 # sget-char vAA ( 8b )
 def sgetchar(ins, vmap):
-    logger.debug('SGetChar : %s', ins.get_output())
+    logger.debug('SGetChar : %s', util.LazyOutput(ins))
     klass, atype, name = ins.cm.get_field(ins.BBBB)
     exp = StaticExpression(klass, atype, name)
     a = get_variables(vmap, ins.AA)
@@ -803,7 +803,7 @@ def sgetchar(ins, vmap):
 
 # sget-short vAA ( 8b )
 def sgetshort(ins, vmap):
-    logger.debug('SGetShort : %s', ins.get_output())
+    logger.debug('SGetShort : %s', util.LazyOutput(ins))
     klass, atype, name = ins.cm.get_field(ins.BBBB)
     exp = StaticExpression(klass, atype, name)
     a = get_variables(vmap, ins.AA)
@@ -812,7 +812,7 @@ def sgetshort(ins, vmap):
 
 # sput vAA ( 8b )
 def sput(ins, vmap):
-    logger.debug('SPut : %s', ins.get_output())
+    logger.debug('SPut : %s', util.LazyOutput(ins))
     klass, ftype, name = ins.cm.get_field(ins.BBBB)
     a = get_variables(vmap, ins.AA)
     return StaticInstruction(a, klass, ftype, name)
@@ -820,7 +820,7 @@ def sput(ins, vmap):
 
 # sput-wide vAA ( 8b )
 def sputwide(ins, vmap):
-    logger.debug('SPutWide : %s', ins.get_output())
+    logger.debug('SPutWide : %s', util.LazyOutput(ins))
     klass, ftype, name = ins.cm.get_field(ins.BBBB)
     a = get_variables(vmap, ins.AA)
     return StaticInstruction(a, klass, ftype, name)
@@ -828,7 +828,7 @@ def sputwide(ins, vmap):
 
 # sput-object vAA ( 8b )
 def sputobject(ins, vmap):
-    logger.debug('SPutObject : %s', ins.get_output())
+    logger.debug('SPutObject : %s', util.LazyOutput(ins))
     klass, ftype, name = ins.cm.get_field(ins.BBBB)
     a = get_variables(vmap, ins.AA)
     return StaticInstruction(a, klass, ftype, name)
@@ -836,7 +836,7 @@ def sputobject(ins, vmap):
 
 # sput-boolean vAA ( 8b )
 def sputboolean(ins, vmap):
-    logger.debug('SPutBoolean : %s', ins.get_output())
+    logger.debug('SPutBoolean : %s', util.LazyOutput(ins))
     klass, ftype, name = ins.cm.get_field(ins.BBBB)
     a = get_variables(vmap, ins.AA)
     return StaticInstruction(a, klass, ftype, name)
@@ -844,7 +844,7 @@ def sputboolean(ins, vmap):
 
 # sput-wide vAA ( 8b )
 def sputbyte(ins, vmap):
-    logger.debug('SPutByte : %s', ins.get_output())
+    logger.debug('SPutByte : %s', util.LazyOutput(ins))
     klass, ftype, name = ins.cm.get_field(ins.BBBB)
     a = get_variables(vmap, ins.AA)
     return StaticInstruction(a, klass, ftype, name)
@@ -852,7 +852,7 @@ def sputbyte(ins, vmap):
 
 # sput-char vAA ( 8b )
 def sputchar(ins, vmap):
-    logger.debug('SPutChar : %s', ins.get_output())
+    logger.debug('SPutChar : %s', util.LazyOutput(ins))
     klass, ftype, name = ins.cm.get_field(ins.BBBB)
     a = get_variables(vmap, ins.AA)
     return StaticInstruction(a, klass, ftype, name)
@@ -860,7 +860,7 @@ def sputchar(ins, vmap):
 
 # sput-short vAA ( 8b )
 def sputshort(ins, vmap):
-    logger.debug('SPutShort : %s', ins.get_output())
+    logger.debug('SPutShort : %s', util.LazyOutput(ins))
     klass, ftype, name = ins.cm.get_field(ins.BBBB)
     a = get_variables(vmap, ins.AA)
     return StaticInstruction(a, klass, ftype, name)
@@ -884,7 +884,7 @@ def get_args(vmap, param_type, largs):
 
 # invoke-virtual {vD, vE, vF, vG, vA} ( 4b each )
 def invokevirtual(ins, vmap, ret):
-    logger.debug('InvokeVirtual : %s', ins.get_output())
+    logger.debug('InvokeVirtual : %s', util.LazyOutput(ins))
     method = ins.cm.get_method_ref(ins.BBBB)
     cls_name = util.get_type(method.get_class_name())
     name = method.get_name()
@@ -901,7 +901,7 @@ def invokevirtual(ins, vmap, ret):
 
 # invoke-super {vD, vE, vF, vG, vA} ( 4b each )
 def invokesuper(ins, vmap, ret):
-    logger.debug('InvokeSuper : %s', ins.get_output())
+    logger.debug('InvokeSuper : %s', util.LazyOutput(ins))
     method = ins.cm.get_method_ref(ins.BBBB)
     cls_name = util.get_type(method.get_class_name())
     name = method.get_name()
@@ -918,7 +918,7 @@ def invokesuper(ins, vmap, ret):
 
 # invoke-direct {vD, vE, vF, vG, vA} ( 4b each )
 def invokedirect(ins, vmap, ret):
-    logger.debug('InvokeDirect : %s', ins.get_output())
+    logger.debug('InvokeDirect : %s', util.LazyOutput(ins))
     method = ins.cm.get_method_ref(ins.BBBB)
     cls_name = util.get_type(method.get_class_name())
     name = method.get_name()
@@ -942,7 +942,7 @@ def invokedirect(ins, vmap, ret):
 
 # invoke-static {vD, vE, vF, vG, vA} ( 4b each )
 def invokestatic(ins, vmap, ret):
-    logger.debug('InvokeStatic : %s', ins.get_output())
+    logger.debug('InvokeStatic : %s', util.LazyOutput(ins))
     method = ins.cm.get_method_ref(ins.BBBB)
     cls_name = util.get_type(method.get_class_name())
     name = method.get_name()
@@ -959,7 +959,7 @@ def invokestatic(ins, vmap, ret):
 
 # invoke-interface {vD, vE, vF, vG, vA} ( 4b each )
 def invokeinterface(ins, vmap, ret):
-    logger.debug('InvokeInterface : %s', ins.get_output())
+    logger.debug('InvokeInterface : %s', util.LazyOutput(ins))
     method = ins.cm.get_method_ref(ins.BBBB)
     cls_name = util.get_type(method.get_class_name())
     name = method.get_name()
@@ -976,7 +976,7 @@ def invokeinterface(ins, vmap, ret):
 
 # invoke-virtual/range {vCCCC..vNNNN} ( 16b each )
 def invokevirtualrange(ins, vmap, ret):
-    logger.debug('InvokeVirtualRange : %s', ins.get_output())
+    logger.debug('InvokeVirtualRange : %s', util.LazyOutput(ins))
     method = ins.cm.get_method_ref(ins.BBBB)
     cls_name = util.get_type(method.get_class_name())
     name = method.get_name()
@@ -993,7 +993,7 @@ def invokevirtualrange(ins, vmap, ret):
 
 # invoke-super/range {vCCCC..vNNNN} ( 16b each )
 def invokesuperrange(ins, vmap, ret):
-    logger.debug('InvokeSuperRange : %s', ins.get_output())
+    logger.debug('InvokeSuperRange : %s', util.LazyOutput(ins))
     method = ins.cm.get_method_ref(ins.BBBB)
     cls_name = util.get_type(method.get_class_name())
     name = method.get_name()
@@ -1015,7 +1015,7 @@ def invokesuperrange(ins, vmap, ret):
 
 # invoke-direct/range {vCCCC..vNNNN} ( 16b each )
 def invokedirectrange(ins, vmap, ret):
-    logger.debug('InvokeDirectRange : %s', ins.get_output())
+    logger.debug('InvokeDirectRange : %s', util.LazyOutput(ins))
     method = ins.cm.get_method_ref(ins.BBBB)
     cls_name = util.get_type(method.get_class_name())
     name = method.get_name()
@@ -1037,7 +1037,7 @@ def invokedirectrange(ins, vmap, ret):
 
 # invoke-static/range {vCCCC..vNNNN} ( 16b each )
 def invokestaticrange(ins, vmap, ret):
-    logger.debug('InvokeStaticRange : %s', ins.get_output())
+    logger.debug('InvokeStaticRange : %s', util.LazyOutput(ins))
     method = ins.cm.get_method_ref(ins.BBBB)
     cls_name = util.get_type(method.get_class_name())
     name = method.get_name()
@@ -1054,7 +1054,7 @@ def invokestaticrange(ins, vmap, ret):
 
 # invoke-interface/range {vCCCC..vNNNN} ( 16b each )
 def invokeinterfacerange(ins, vmap, ret):
-    logger.debug('InvokeInterfaceRange : %s', ins.get_output())
+    logger.debug('InvokeInterfaceRange : %s', util.LazyOutput(ins))
     method = ins.cm.get_method_ref(ins.BBBB)
     cls_name = util.get_type(method.get_class_name())
     name = method.get_name()
@@ -1071,7 +1071,7 @@ def invokeinterfacerange(ins, vmap, ret):
 
 # neg-int vA, vB ( 4b, 4b )
 def negint(ins, vmap):
-    logger.debug('NegInt : %s', ins.get_output())
+    logger.debug('NegInt : %s', util.LazyOutput(ins))
     a, b = get_variables(vmap, ins.A, ins.B)
     exp = UnaryExpression(Op.NEG, b, 'I')
     return AssignExpression(a, exp)
@@ -1079,7 +1079,7 @@ def negint(ins, vmap):
 
 # not-int vA, vB ( 4b, 4b )
 def notint(ins, vmap):
-    logger.debug('NotInt : %s', ins.get_output())
+    logger.debug('NotInt : %s', util.LazyOutput(ins))
     a, b = get_variables(vmap, ins.A, ins.B)
     exp = UnaryExpression(Op.NOT, b, 'I')
     return AssignExpression(a, exp)
@@ -1087,7 +1087,7 @@ def notint(ins, vmap):
 
 # neg-long vA, vB ( 4b, 4b )
 def neglong(ins, vmap):
-    logger.debug('NegLong : %s', ins.get_output())
+    logger.debug('NegLong : %s', util.LazyOutput(ins))
     a, b = get_variables(vmap, ins.A, ins.B)
     exp = UnaryExpression(Op.NEG, b, 'J')
     return AssignExpression(a, exp)
@@ -1095,7 +1095,7 @@ def neglong(ins, vmap):
 
 # not-long vA, vB ( 4b, 4b )
 def notlong(ins, vmap):
-    logger.debug('NotLong : %s', ins.get_output())
+    logger.debug('NotLong : %s', util.LazyOutput(ins))
     a, b = get_variables(vmap, ins.A, ins.B)
     exp = UnaryExpression(Op.NOT, b, 'J')
     return AssignExpression(a, exp)
@@ -1103,7 +1103,7 @@ def notlong(ins, vmap):
 
 # neg-float vA, vB ( 4b, 4b )
 def negfloat(ins, vmap):
-    logger.debug('NegFloat : %s', ins.get_output())
+    logger.debug('NegFloat : %s', util.LazyOutput(ins))
     a, b = get_variables(vmap, ins.A, ins.B)
     exp = UnaryExpression(Op.NEG, b, 'F')
     return AssignExpression(a, exp)
@@ -1111,7 +1111,7 @@ def negfloat(ins, vmap):
 
 # neg-double vA, vB ( 4b, 4b )
 def negdouble(ins, vmap):
-    logger.debug('NegDouble : %s', ins.get_output())
+    logger.debug('NegDouble : %s', util.LazyOutput(ins))
     a, b = get_variables(vmap, ins.A, ins.B)
     exp = UnaryExpression(Op.NEG, b, 'D')
     return AssignExpression(a, exp)
@@ -1119,487 +1119,487 @@ def negdouble(ins, vmap):
 
 # int-to-long vA, vB ( 4b, 4b )
 def inttolong(ins, vmap):
-    logger.debug('IntToLong : %s', ins.get_output())
+    logger.debug('IntToLong : %s', util.LazyOutput(ins))
     return assign_cast_exp(ins.A, ins.B, '(long)', 'J', vmap)
 
 
 # int-to-float vA, vB ( 4b, 4b )
 def inttofloat(ins, vmap):
-    logger.debug('IntToFloat : %s', ins.get_output())
+    logger.debug('IntToFloat : %s', util.LazyOutput(ins))
     return assign_cast_exp(ins.A, ins.B, '(float)', 'F', vmap)
 
 
 # int-to-double vA, vB ( 4b, 4b )
 def inttodouble(ins, vmap):
-    logger.debug('IntToDouble : %s', ins.get_output())
+    logger.debug('IntToDouble : %s', util.LazyOutput(ins))
     return assign_cast_exp(ins.A, ins.B, '(double)', 'D', vmap)
 
 
 # long-to-int vA, vB ( 4b, 4b )
 def longtoint(ins, vmap):
-    logger.debug('LongToInt : %s', ins.get_output())
+    logger.debug('LongToInt : %s', util.LazyOutput(ins))
     return assign_cast_exp(ins.A, ins.B, '(int)', 'I', vmap)
 
 
 # long-to-float vA, vB ( 4b, 4b )
 def longtofloat(ins, vmap):
-    logger.debug('LongToFloat : %s', ins.get_output())
+    logger.debug('LongToFloat : %s', util.LazyOutput(ins))
     return assign_cast_exp(ins.A, ins.B, '(float)', 'F', vmap)
 
 
 # long-to-double vA, vB ( 4b, 4b )
 def longtodouble(ins, vmap):
-    logger.debug('LongToDouble : %s', ins.get_output())
+    logger.debug('LongToDouble : %s', util.LazyOutput(ins))
     return assign_cast_exp(ins.A, ins.B, '(double)', 'D', vmap)
 
 
 # float-to-int vA, vB ( 4b, 4b )
 def floattoint(ins, vmap):
-    logger.debug('FloatToInt : %s', ins.get_output())
+    logger.debug('FloatToInt : %s', util.LazyOutput(ins))
     return assign_cast_exp(ins.A, ins.B, '(int)', 'I', vmap)
 
 
 # float-to-long vA, vB ( 4b, 4b )
 def floattolong(ins, vmap):
-    logger.debug('FloatToLong : %s', ins.get_output())
+    logger.debug('FloatToLong : %s', util.LazyOutput(ins))
     return assign_cast_exp(ins.A, ins.B, '(long)', 'J', vmap)
 
 
 # float-to-double vA, vB ( 4b, 4b )
 def floattodouble(ins, vmap):
-    logger.debug('FloatToDouble : %s', ins.get_output())
+    logger.debug('FloatToDouble : %s', util.LazyOutput(ins))
     return assign_cast_exp(ins.A, ins.B, '(double)', 'D', vmap)
 
 
 # double-to-int vA, vB ( 4b, 4b )
 def doubletoint(ins, vmap):
-    logger.debug('DoubleToInt : %s', ins.get_output())
+    logger.debug('DoubleToInt : %s', util.LazyOutput(ins))
     return assign_cast_exp(ins.A, ins.B, '(int)', 'I', vmap)
 
 
 # double-to-long vA, vB ( 4b, 4b )
 def doubletolong(ins, vmap):
-    logger.debug('DoubleToLong : %s', ins.get_output())
+    logger.debug('DoubleToLong : %s', util.LazyOutput(ins))
     return assign_cast_exp(ins.A, ins.B, '(long)', 'J', vmap)
 
 
 # double-to-float vA, vB ( 4b, 4b )
 def doubletofloat(ins, vmap):
-    logger.debug('DoubleToFloat : %s', ins.get_output())
+    logger.debug('DoubleToFloat : %s', util.LazyOutput(ins))
     return assign_cast_exp(ins.A, ins.B, '(float)', 'F', vmap)
 
 
 # int-to-byte vA, vB ( 4b, 4b )
 def inttobyte(ins, vmap):
-    logger.debug('IntToByte : %s', ins.get_output())
+    logger.debug('IntToByte : %s', util.LazyOutput(ins))
     return assign_cast_exp(ins.A, ins.B, '(byte)', 'B', vmap)
 
 
 # int-to-char vA, vB ( 4b, 4b )
 def inttochar(ins, vmap):
-    logger.debug('IntToChar : %s', ins.get_output())
+    logger.debug('IntToChar : %s', util.LazyOutput(ins))
     return assign_cast_exp(ins.A, ins.B, '(char)', 'C', vmap)
 
 
 # int-to-short vA, vB ( 4b, 4b )
 def inttoshort(ins, vmap):
-    logger.debug('IntToShort : %s', ins.get_output())
+    logger.debug('IntToShort : %s', util.LazyOutput(ins))
     return assign_cast_exp(ins.A, ins.B, '(short)', 'S', vmap)
 
 
 # add-int vAA, vBB, vCC ( 8b, 8b, 8b )
 def addint(ins, vmap):
-    logger.debug('AddInt : %s', ins.get_output())
+    logger.debug('AddInt : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.ADD, 'I', vmap)
 
 
 # sub-int vAA, vBB, vCC ( 8b, 8b, 8b )
 def subint(ins, vmap):
-    logger.debug('SubInt : %s', ins.get_output())
+    logger.debug('SubInt : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.SUB, 'I', vmap)
 
 
 # mul-int vAA, vBB, vCC ( 8b, 8b, 8b )
 def mulint(ins, vmap):
-    logger.debug('MulInt : %s', ins.get_output())
+    logger.debug('MulInt : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.MUL, 'I', vmap)
 
 
 # div-int vAA, vBB, vCC ( 8b, 8b, 8b )
 def divint(ins, vmap):
-    logger.debug('DivInt : %s', ins.get_output())
+    logger.debug('DivInt : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.DIV, 'I', vmap)
 
 
 # rem-int vAA, vBB, vCC ( 8b, 8b, 8b )
 def remint(ins, vmap):
-    logger.debug('RemInt : %s', ins.get_output())
+    logger.debug('RemInt : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.MOD, 'I', vmap)
 
 
 # and-int vAA, vBB, vCC ( 8b, 8b, 8b )
 def andint(ins, vmap):
-    logger.debug('AndInt : %s', ins.get_output())
+    logger.debug('AndInt : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.AND, 'I', vmap)
 
 
 # or-int vAA, vBB, vCC ( 8b, 8b, 8b )
 def orint(ins, vmap):
-    logger.debug('OrInt : %s', ins.get_output())
+    logger.debug('OrInt : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.OR, 'I', vmap)
 
 
 # xor-int vAA, vBB, vCC ( 8b, 8b, 8b )
 def xorint(ins, vmap):
-    logger.debug('XorInt : %s', ins.get_output())
+    logger.debug('XorInt : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.XOR, 'I', vmap)
 
 
 # shl-int vAA, vBB, vCC ( 8b, 8b, 8b )
 def shlint(ins, vmap):
-    logger.debug('ShlInt : %s', ins.get_output())
+    logger.debug('ShlInt : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.INTSHL, 'I', vmap)
 
 
 # shr-int vAA, vBB, vCC ( 8b, 8b, 8b )
 def shrint(ins, vmap):
-    logger.debug('ShrInt : %s', ins.get_output())
+    logger.debug('ShrInt : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.INTSHR, 'I', vmap)
 
 
 # ushr-int vAA, vBB, vCC ( 8b, 8b, 8b )
 def ushrint(ins, vmap):
-    logger.debug('UShrInt : %s', ins.get_output())
+    logger.debug('UShrInt : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.INTSHR, 'I', vmap)
 
 
 # add-long vAA, vBB, vCC ( 8b, 8b, 8b )
 def addlong(ins, vmap):
-    logger.debug('AddLong : %s', ins.get_output())
+    logger.debug('AddLong : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.ADD, 'J', vmap)
 
 
 # sub-long vAA, vBB, vCC ( 8b, 8b, 8b )
 def sublong(ins, vmap):
-    logger.debug('SubLong : %s', ins.get_output())
+    logger.debug('SubLong : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.SUB, 'J', vmap)
 
 
 # mul-long vAA, vBB, vCC ( 8b, 8b, 8b )
 def mullong(ins, vmap):
-    logger.debug('MulLong : %s', ins.get_output())
+    logger.debug('MulLong : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.MUL, 'J', vmap)
 
 
 # div-long vAA, vBB, vCC ( 8b, 8b, 8b )
 def divlong(ins, vmap):
-    logger.debug('DivLong : %s', ins.get_output())
+    logger.debug('DivLong : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.DIV, 'J', vmap)
 
 
 # rem-long vAA, vBB, vCC ( 8b, 8b, 8b )
 def remlong(ins, vmap):
-    logger.debug('RemLong : %s', ins.get_output())
+    logger.debug('RemLong : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.MOD, 'J', vmap)
 
 
 # and-long vAA, vBB, vCC ( 8b, 8b, 8b )
 def andlong(ins, vmap):
-    logger.debug('AndLong : %s', ins.get_output())
+    logger.debug('AndLong : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.AND, 'J', vmap)
 
 
 # or-long vAA, vBB, vCC ( 8b, 8b, 8b )
 def orlong(ins, vmap):
-    logger.debug('OrLong : %s', ins.get_output())
+    logger.debug('OrLong : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.OR, 'J', vmap)
 
 
 # xor-long vAA, vBB, vCC ( 8b, 8b, 8b )
 def xorlong(ins, vmap):
-    logger.debug('XorLong : %s', ins.get_output())
+    logger.debug('XorLong : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.XOR, 'J', vmap)
 
 
 # shl-long vAA, vBB, vCC ( 8b, 8b, 8b )
 def shllong(ins, vmap):
-    logger.debug('ShlLong : %s', ins.get_output())
+    logger.debug('ShlLong : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.LONGSHL, 'J', vmap)
 
 
 # shr-long vAA, vBB, vCC ( 8b, 8b, 8b )
 def shrlong(ins, vmap):
-    logger.debug('ShrLong : %s', ins.get_output())
+    logger.debug('ShrLong : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.LONGSHR, 'J', vmap)
 
 
 # ushr-long vAA, vBB, vCC ( 8b, 8b, 8b )
 def ushrlong(ins, vmap):
-    logger.debug('UShrLong : %s', ins.get_output())
+    logger.debug('UShrLong : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.LONGSHR, 'J', vmap)
 
 
 # add-float vAA, vBB, vCC ( 8b, 8b, 8b )
 def addfloat(ins, vmap):
-    logger.debug('AddFloat : %s', ins.get_output())
+    logger.debug('AddFloat : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.ADD, 'F', vmap)
 
 
 # sub-float vAA, vBB, vCC ( 8b, 8b, 8b )
 def subfloat(ins, vmap):
-    logger.debug('SubFloat : %s', ins.get_output())
+    logger.debug('SubFloat : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.SUB, 'F', vmap)
 
 
 # mul-float vAA, vBB, vCC ( 8b, 8b, 8b )
 def mulfloat(ins, vmap):
-    logger.debug('MulFloat : %s', ins.get_output())
+    logger.debug('MulFloat : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.MUL, 'F', vmap)
 
 
 # div-float vAA, vBB, vCC ( 8b, 8b, 8b )
 def divfloat(ins, vmap):
-    logger.debug('DivFloat : %s', ins.get_output())
+    logger.debug('DivFloat : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.DIV, 'F', vmap)
 
 
 # rem-float vAA, vBB, vCC ( 8b, 8b, 8b )
 def remfloat(ins, vmap):
-    logger.debug('RemFloat : %s', ins.get_output())
+    logger.debug('RemFloat : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.MOD, 'F', vmap)
 
 
 # add-double vAA, vBB, vCC ( 8b, 8b, 8b )
 def adddouble(ins, vmap):
-    logger.debug('AddDouble : %s', ins.get_output())
+    logger.debug('AddDouble : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.ADD, 'D', vmap)
 
 
 # sub-double vAA, vBB, vCC ( 8b, 8b, 8b )
 def subdouble(ins, vmap):
-    logger.debug('SubDouble : %s', ins.get_output())
+    logger.debug('SubDouble : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.SUB, 'D', vmap)
 
 
 # mul-double vAA, vBB, vCC ( 8b, 8b, 8b )
 def muldouble(ins, vmap):
-    logger.debug('MulDouble : %s', ins.get_output())
+    logger.debug('MulDouble : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.MUL, 'D', vmap)
 
 
 # div-double vAA, vBB, vCC ( 8b, 8b, 8b )
 def divdouble(ins, vmap):
-    logger.debug('DivDouble : %s', ins.get_output())
+    logger.debug('DivDouble : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.DIV, 'D', vmap)
 
 
 # rem-double vAA, vBB, vCC ( 8b, 8b, 8b )
 def remdouble(ins, vmap):
-    logger.debug('RemDouble : %s', ins.get_output())
+    logger.debug('RemDouble : %s', util.LazyOutput(ins))
     return assign_binary_exp(ins, Op.MOD, 'D', vmap)
 
 
 # add-int/2addr vA, vB ( 4b, 4b )
 def addint2addr(ins, vmap):
-    logger.debug('AddInt2Addr : %s', ins.get_output())
+    logger.debug('AddInt2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.ADD, 'I', vmap)
 
 
 # sub-int/2addr vA, vB ( 4b, 4b )
 def subint2addr(ins, vmap):
-    logger.debug('SubInt2Addr : %s', ins.get_output())
+    logger.debug('SubInt2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.SUB, 'I', vmap)
 
 
 # mul-int/2addr vA, vB ( 4b, 4b )
 def mulint2addr(ins, vmap):
-    logger.debug('MulInt2Addr : %s', ins.get_output())
+    logger.debug('MulInt2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.MUL, 'I', vmap)
 
 
 # div-int/2addr vA, vB ( 4b, 4b )
 def divint2addr(ins, vmap):
-    logger.debug('DivInt2Addr : %s', ins.get_output())
+    logger.debug('DivInt2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.DIV, 'I', vmap)
 
 
 # rem-int/2addr vA, vB ( 4b, 4b )
 def remint2addr(ins, vmap):
-    logger.debug('RemInt2Addr : %s', ins.get_output())
+    logger.debug('RemInt2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.MOD, 'I', vmap)
 
 
 # and-int/2addr vA, vB ( 4b, 4b )
 def andint2addr(ins, vmap):
-    logger.debug('AndInt2Addr : %s', ins.get_output())
+    logger.debug('AndInt2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.AND, 'I', vmap)
 
 
 # or-int/2addr vA, vB ( 4b, 4b )
 def orint2addr(ins, vmap):
-    logger.debug('OrInt2Addr : %s', ins.get_output())
+    logger.debug('OrInt2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.OR, 'I', vmap)
 
 
 # xor-int/2addr vA, vB ( 4b, 4b )
 def xorint2addr(ins, vmap):
-    logger.debug('XorInt2Addr : %s', ins.get_output())
+    logger.debug('XorInt2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.XOR, 'I', vmap)
 
 
 # shl-int/2addr vA, vB ( 4b, 4b )
 def shlint2addr(ins, vmap):
-    logger.debug('ShlInt2Addr : %s', ins.get_output())
+    logger.debug('ShlInt2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.INTSHL, 'I', vmap)
 
 
 # shr-int/2addr vA, vB ( 4b, 4b )
 def shrint2addr(ins, vmap):
-    logger.debug('ShrInt2Addr : %s', ins.get_output())
+    logger.debug('ShrInt2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.INTSHR, 'I', vmap)
 
 
 # ushr-int/2addr vA, vB ( 4b, 4b )
 def ushrint2addr(ins, vmap):
-    logger.debug('UShrInt2Addr : %s', ins.get_output())
+    logger.debug('UShrInt2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.INTSHR, 'I', vmap)
 
 
 # add-long/2addr vA, vB ( 4b, 4b )
 def addlong2addr(ins, vmap):
-    logger.debug('AddLong2Addr : %s', ins.get_output())
+    logger.debug('AddLong2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.ADD, 'J', vmap)
 
 
 # sub-long/2addr vA, vB ( 4b, 4b )
 def sublong2addr(ins, vmap):
-    logger.debug('SubLong2Addr : %s', ins.get_output())
+    logger.debug('SubLong2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.SUB, 'J', vmap)
 
 
 # mul-long/2addr vA, vB ( 4b, 4b )
 def mullong2addr(ins, vmap):
-    logger.debug('MulLong2Addr : %s', ins.get_output())
+    logger.debug('MulLong2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.MUL, 'J', vmap)
 
 
 # div-long/2addr vA, vB ( 4b, 4b )
 def divlong2addr(ins, vmap):
-    logger.debug('DivLong2Addr : %s', ins.get_output())
+    logger.debug('DivLong2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.DIV, 'J', vmap)
 
 
 # rem-long/2addr vA, vB ( 4b, 4b )
 def remlong2addr(ins, vmap):
-    logger.debug('RemLong2Addr : %s', ins.get_output())
+    logger.debug('RemLong2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.MOD, 'J', vmap)
 
 
 # and-long/2addr vA, vB ( 4b, 4b )
 def andlong2addr(ins, vmap):
-    logger.debug('AndLong2Addr : %s', ins.get_output())
+    logger.debug('AndLong2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.AND, 'J', vmap)
 
 
 # or-long/2addr vA, vB ( 4b, 4b )
 def orlong2addr(ins, vmap):
-    logger.debug('OrLong2Addr : %s', ins.get_output())
+    logger.debug('OrLong2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.OR, 'J', vmap)
 
 
 # xor-long/2addr vA, vB ( 4b, 4b )
 def xorlong2addr(ins, vmap):
-    logger.debug('XorLong2Addr : %s', ins.get_output())
+    logger.debug('XorLong2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.XOR, 'J', vmap)
 
 
 # shl-long/2addr vA, vB ( 4b, 4b )
 def shllong2addr(ins, vmap):
-    logger.debug('ShlLong2Addr : %s', ins.get_output())
+    logger.debug('ShlLong2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.LONGSHL, 'J', vmap)
 
 
 # shr-long/2addr vA, vB ( 4b, 4b )
 def shrlong2addr(ins, vmap):
-    logger.debug('ShrLong2Addr : %s', ins.get_output())
+    logger.debug('ShrLong2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.LONGSHR, 'J', vmap)
 
 
 # ushr-long/2addr vA, vB ( 4b, 4b )
 def ushrlong2addr(ins, vmap):
-    logger.debug('UShrLong2Addr : %s', ins.get_output())
+    logger.debug('UShrLong2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.LONGSHR, 'J', vmap)
 
 
 # add-float/2addr vA, vB ( 4b, 4b )
 def addfloat2addr(ins, vmap):
-    logger.debug('AddFloat2Addr : %s', ins.get_output())
+    logger.debug('AddFloat2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.ADD, 'F', vmap)
 
 
 # sub-float/2addr vA, vB ( 4b, 4b )
 def subfloat2addr(ins, vmap):
-    logger.debug('SubFloat2Addr : %s', ins.get_output())
+    logger.debug('SubFloat2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.SUB, 'F', vmap)
 
 
 # mul-float/2addr vA, vB ( 4b, 4b )
 def mulfloat2addr(ins, vmap):
-    logger.debug('MulFloat2Addr : %s', ins.get_output())
+    logger.debug('MulFloat2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.MUL, 'F', vmap)
 
 
 # div-float/2addr vA, vB ( 4b, 4b )
 def divfloat2addr(ins, vmap):
-    logger.debug('DivFloat2Addr : %s', ins.get_output())
+    logger.debug('DivFloat2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.DIV, 'F', vmap)
 
 
 # rem-float/2addr vA, vB ( 4b, 4b )
 def remfloat2addr(ins, vmap):
-    logger.debug('RemFloat2Addr : %s', ins.get_output())
+    logger.debug('RemFloat2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.MOD, 'F', vmap)
 
 
 # add-double/2addr vA, vB ( 4b, 4b )
 def adddouble2addr(ins, vmap):
-    logger.debug('AddDouble2Addr : %s', ins.get_output())
+    logger.debug('AddDouble2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.ADD, 'D', vmap)
 
 
 # sub-double/2addr vA, vB ( 4b, 4b )
 def subdouble2addr(ins, vmap):
-    logger.debug('subDouble2Addr : %s', ins.get_output())
+    logger.debug('subDouble2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.SUB, 'D', vmap)
 
 
 # mul-double/2addr vA, vB ( 4b, 4b )
 def muldouble2addr(ins, vmap):
-    logger.debug('MulDouble2Addr : %s', ins.get_output())
+    logger.debug('MulDouble2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.MUL, 'D', vmap)
 
 
 # div-double/2addr vA, vB ( 4b, 4b )
 def divdouble2addr(ins, vmap):
-    logger.debug('DivDouble2Addr : %s', ins.get_output())
+    logger.debug('DivDouble2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.DIV, 'D', vmap)
 
 
 # rem-double/2addr vA, vB ( 4b, 4b )
 def remdouble2addr(ins, vmap):
-    logger.debug('RemDouble2Addr : %s', ins.get_output())
+    logger.debug('RemDouble2Addr : %s', util.LazyOutput(ins))
     return assign_binary_2addr_exp(ins, Op.MOD, 'D', vmap)
 
 
 # add-int/lit16 vA, vB, #+CCCC ( 4b, 4b, 16b )
 def addintlit16(ins, vmap):
-    logger.debug('AddIntLit16 : %s', ins.get_output())
+    logger.debug('AddIntLit16 : %s', util.LazyOutput(ins))
     return assign_lit(Op.ADD, ins.CCCC, ins.A, ins.B, vmap)
 
 
 # rsub-int vA, vB, #+CCCC ( 4b, 4b, 16b )
 def rsubint(ins, vmap):
-    logger.debug('RSubInt : %s', ins.get_output())
+    logger.debug('RSubInt : %s', util.LazyOutput(ins))
     var_a, var_b = get_variables(vmap, ins.A, ins.B)
     cst = Constant(ins.CCCC, 'I')
     return AssignExpression(var_a, BinaryExpressionLit(Op.SUB, cst, var_b))
@@ -1607,50 +1607,50 @@ def rsubint(ins, vmap):
 
 # mul-int/lit16 vA, vB, #+CCCC ( 4b, 4b, 16b )
 def mulintlit16(ins, vmap):
-    logger.debug('MulIntLit16 : %s', ins.get_output())
+    logger.debug('MulIntLit16 : %s', util.LazyOutput(ins))
     return assign_lit(Op.MUL, ins.CCCC, ins.A, ins.B, vmap)
 
 
 # div-int/lit16 vA, vB, #+CCCC ( 4b, 4b, 16b )
 def divintlit16(ins, vmap):
-    logger.debug('DivIntLit16 : %s', ins.get_output())
+    logger.debug('DivIntLit16 : %s', util.LazyOutput(ins))
     return assign_lit(Op.DIV, ins.CCCC, ins.A, ins.B, vmap)
 
 
 # rem-int/lit16 vA, vB, #+CCCC ( 4b, 4b, 16b )
 def remintlit16(ins, vmap):
-    logger.debug('RemIntLit16 : %s', ins.get_output())
+    logger.debug('RemIntLit16 : %s', util.LazyOutput(ins))
     return assign_lit(Op.MOD, ins.CCCC, ins.A, ins.B, vmap)
 
 
 # and-int/lit16 vA, vB, #+CCCC ( 4b, 4b, 16b )
 def andintlit16(ins, vmap):
-    logger.debug('AndIntLit16 : %s', ins.get_output())
+    logger.debug('AndIntLit16 : %s', util.LazyOutput(ins))
     return assign_lit(Op.AND, ins.CCCC, ins.A, ins.B, vmap)
 
 
 # or-int/lit16 vA, vB, #+CCCC ( 4b, 4b, 16b )
 def orintlit16(ins, vmap):
-    logger.debug('OrIntLit16 : %s', ins.get_output())
+    logger.debug('OrIntLit16 : %s', util.LazyOutput(ins))
     return assign_lit(Op.OR, ins.CCCC, ins.A, ins.B, vmap)
 
 
 # xor-int/lit16 vA, vB, #+CCCC ( 4b, 4b, 16b )
 def xorintlit16(ins, vmap):
-    logger.debug('XorIntLit16 : %s', ins.get_output())
+    logger.debug('XorIntLit16 : %s', util.LazyOutput(ins))
     return assign_lit(Op.XOR, ins.CCCC, ins.A, ins.B, vmap)
 
 
 # add-int/lit8 vAA, vBB, #+CC ( 8b, 8b, 8b )
 def addintlit8(ins, vmap):
-    logger.debug('AddIntLit8 : %s', ins.get_output())
+    logger.debug('AddIntLit8 : %s', util.LazyOutput(ins))
     literal, op = [(ins.CC, Op.ADD), (-ins.CC, Op.SUB)][ins.CC < 0]
     return assign_lit(op, literal, ins.AA, ins.BB, vmap)
 
 
 # rsub-int/lit8 vAA, vBB, #+CC ( 8b, 8b, 8b )
 def rsubintlit8(ins, vmap):
-    logger.debug('RSubIntLit8 : %s', ins.get_output())
+    logger.debug('RSubIntLit8 : %s', util.LazyOutput(ins))
     var_a, var_b = get_variables(vmap, ins.AA, ins.BB)
     cst = Constant(ins.CC, 'I')
     return AssignExpression(var_a, BinaryExpressionLit(Op.SUB, cst, var_b))
@@ -1658,55 +1658,55 @@ def rsubintlit8(ins, vmap):
 
 # mul-int/lit8 vAA, vBB, #+CC ( 8b, 8b, 8b )
 def mulintlit8(ins, vmap):
-    logger.debug('MulIntLit8 : %s', ins.get_output())
+    logger.debug('MulIntLit8 : %s', util.LazyOutput(ins))
     return assign_lit(Op.MUL, ins.CC, ins.AA, ins.BB, vmap)
 
 
 # div-int/lit8 vAA, vBB, #+CC ( 8b, 8b, 8b )
 def divintlit8(ins, vmap):
-    logger.debug('DivIntLit8 : %s', ins.get_output())
+    logger.debug('DivIntLit8 : %s', util.LazyOutput(ins))
     return assign_lit(Op.DIV, ins.CC, ins.AA, ins.BB, vmap)
 
 
 # rem-int/lit8 vAA, vBB, #+CC ( 8b, 8b, 8b )
 def remintlit8(ins, vmap):
-    logger.debug('RemIntLit8 : %s', ins.get_output())
+    logger.debug('RemIntLit8 : %s', util.LazyOutput(ins))
     return assign_lit(Op.MOD, ins.CC, ins.AA, ins.BB, vmap)
 
 
 # and-int/lit8 vAA, vBB, #+CC ( 8b, 8b, 8b )
 def andintlit8(ins, vmap):
-    logger.debug('AndIntLit8 : %s', ins.get_output())
+    logger.debug('AndIntLit8 : %s', util.LazyOutput(ins))
     return assign_lit(Op.AND, ins.CC, ins.AA, ins.BB, vmap)
 
 
 # or-int/lit8 vAA, vBB, #+CC ( 8b, 8b, 8b )
 def orintlit8(ins, vmap):
-    logger.debug('OrIntLit8 : %s', ins.get_output())
+    logger.debug('OrIntLit8 : %s', util.LazyOutput(ins))
     return assign_lit(Op.OR, ins.CC, ins.AA, ins.BB, vmap)
 
 
 # xor-int/lit8 vAA, vBB, #+CC ( 8b, 8b, 8b )
 def xorintlit8(ins, vmap):
-    logger.debug('XorIntLit8 : %s', ins.get_output())
+    logger.debug('XorIntLit8 : %s', util.LazyOutput(ins))
     return assign_lit(Op.XOR, ins.CC, ins.AA, ins.BB, vmap)
 
 
 # shl-int/lit8 vAA, vBB, #+CC ( 8b, 8b, 8b )
 def shlintlit8(ins, vmap):
-    logger.debug('ShlIntLit8 : %s', ins.get_output())
+    logger.debug('ShlIntLit8 : %s', util.LazyOutput(ins))
     return assign_lit(Op.INTSHL, ins.CC, ins.AA, ins.BB, vmap)
 
 
 # shr-int/lit8 vAA, vBB, #+CC ( 8b, 8b, 8b )
 def shrintlit8(ins, vmap):
-    logger.debug('ShrIntLit8 : %s', ins.get_output())
+    logger.debug('ShrIntLit8 : %s', util.LazyOutput(ins))
     return assign_lit(Op.INTSHR, ins.CC, ins.AA, ins.BB, vmap)
 
 
 # ushr-int/lit8 vAA, vBB, #+CC ( 8b, 8b, 8b )
 def ushrintlit8(ins, vmap):
-    logger.debug('UShrIntLit8 : %s', ins.get_output())
+    logger.debug('UShrIntLit8 : %s', util.LazyOutput(ins))
     return assign_lit(Op.INTSHR, ins.CC, ins.AA, ins.BB, vmap)
 
 
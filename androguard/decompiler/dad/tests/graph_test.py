@@ -0,0 +1,118 @@
+"""Tests for the location lookups of the graph."""
+
+import sys
+sys.path.append('.')
+
+import unittest
+from androguard.decompiler.dad import basic_blocks
+from androguard.decompiler.dad import graph
+from androguard.decompiler.dad import instruction
+
+
+class GraphTest(unittest.TestCase):
+
+    def _CreateGraph(self, sizes):
+        """
+        Build a chain of nodes, the i-th one holding sizes[i] instructions,
+        and number their instructions.
+        """
+        self.graph = graph.Graph()
+        nodes = []
+        for num, size in enumerate(sizes):
+            lins = [instruction.AssignExpression(
+                instruction.Variable(idx), instruction.Constant(idx, 'I'))
+                    for idx in range(size)]
+            node = basic_blocks.StatementBlock('n%d' % num, lins)
+            self.graph.add_node(node)
+            nodes.append(node)
+        for num, node in enumerate(nodes[:-1]):
+            self.graph.add_edge(node, nodes[num + 1])
+        self.graph.entry = nodes[0]
+        self.graph.compute_rpo()
+        self.graph.number_ins()
+        # The ranges of the nodes when they were numbered, for the reference
+        # lookup
+        self.ranges = [(node.ins_range[0], node.ins_range[1], node)
+                       for node in self.graph.rpo]
+        return nodes
+
+    def _NodeFromLoc(self, loc):
+        """Linear scan of the ranges of the nodes, used as the reference."""
+        for start, end, node in self.ranges:
+            if start <= loc < end:
+                return node
+        return None
+
+    def _CheckLocs(self):
+        end = self.ranges[-1][1]
+        for loc in range(-2, end + 2):
+            self.assertIs(self.graph.get_node_from_loc(loc),
+                          self._NodeFromLoc(loc))
+
+    def testNodeFromLoc(self):
+        nodes = self._CreateGraph([3, 1, 2, 4])
+        self._CheckLocs()
+        self.assertIs(self.graph.get_node_from_loc(0), nodes[0])
+        self.assertIs(self.graph.get_node_from_loc(3), nodes[1])
+        self.assertIs(self.graph.get_node_from_loc(9), nodes[3])
+        self.assertIsNone(self.graph.get_node_from_loc(10))
+        self.assertIsNone(self.graph.get_node_from_loc(-1))
+
+    def testNodeFromLocEmptyNodes(self):
+        # The empty nodes share their start location with the next node, so
+        # the ranges are not contiguous in the node list
+        nodes = self._CreateGraph([0, 3, 0, 0, 2, 0, 1, 0])
+        self._CheckLocs()
+        for loc in range(6):
+            self.assertIn(self.graph.get_node_from_loc(loc),
+                          [nodes[1], nodes[4], nodes[6]])
+        self.assertIs(self.graph.get_node_from_loc(3), nodes[4])
+        self.assertIsNone(self.graph.get_node_from_loc(6))
+
+    def testNodeFromLocAfterRemoveIns(self):
+        nodes = self._CreateGraph([3, 2, 4])
+        for loc in [1, 3, 4, 8]:
+            ins = self.graph.get_ins_from_loc(loc)
+            node = self.graph.get_node_from_loc(loc)
+            self.graph.remove_ins(loc)
+            self.assertIsNone(self.graph.get_ins_from_loc(loc))
+            self.assertNotIn(ins, node.get_ins())
+
+        # The locations of the nodes have holes, the other ones still lead to
+        # their nodes
+        self.assertEqual([loc for loc, _ in nodes[0].get_loc_with_ins()],
+                         [0, 2])
+        self.assertEqual(nodes[1].get_loc_with_ins(), [])
+        self.assertEqual([loc for loc, _ in nodes[2].get_loc_with_ins()],
+                         [5, 6, 7])
+        self._CheckLocs()
+        for node in nodes:
+            for loc, _ in node.get_loc_with_ins():
+                self.assertIs(self.graph.get_node_from_loc(loc), node)
+
+    def testNodeFromLocAfterRemoveNode(self):
+        nodes = self._CreateGraph([2, 3, 1, 2])
+        self.graph.remove_node(nodes[1])
+
+        self.assertEqual(list(self.graph), [nodes[0], nodes[2], nodes[3]])
+        self.assertEqual(self.graph.rpo, [nodes[0], nodes[2], nodes[3]])
+        self.assertIsNone(self.graph._rpo_index(nodes[1]))
+        self.assertEqual(self.graph._rpo_index(nodes[3]), 2)
+
+        for node in [nodes[0], nodes[2], nodes[3]]:
+            for loc, _ in node.get_loc_with_ins():
+                self.assertIs(self.graph.get_node_from_loc(loc), node)
+        self.graph.remove_ins(5)
+        self.assertEqual(nodes[2].get_loc_with_ins(), [])
+        self.assertIs(self.graph.get_node_from_loc(6), nodes[3])
+
+        # The rpo list is no longer sorted by number
+        self.graph.rpo.reverse()
+        self.assertEqual(self.graph._rpo_index(nodes[0]), 2)
+        self.graph.remove_node(nodes[0])
+        self.assertEqual(self.graph.rpo, [nodes[3], nodes[2]])
+        self.assertEqual(list(self.graph), [nodes[2], nodes[3]])
+
+
+if __name__ == '__main__':
+    unittest.main()
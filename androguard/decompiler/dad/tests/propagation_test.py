@@ -0,0 +1,267 @@
+"""Tests for the register propagation."""
+
+import sys
+sys.path.append('.')
+
+import copy
+import random
+import time
+import unittest
+from collections import defaultdict
+from androguard.core.analysis import analysis
+from androguard.core.bytecodes import dvm
+from androguard.decompiler.dad import basic_blocks
+from androguard.decompiler.dad import dataflow
+from androguard.decompiler.dad import decompile
+from androguard.decompiler.dad import graph
+from androguard.decompiler.dad import instruction
+
+
+def fixed_point_propagation(G, du, ud):
+    """
+    Former implementation of dataflow.register_propagation, which rescans the
+    whole graph until nothing changes. Used as the reference.
+    """
+    change = True
+    while change:
+        change = False
+        for node in G.rpo:
+            for i, ins in node.get_loc_with_ins():
+                for var in ins.get_used_vars():
+                    locs = ud[var, i]
+                    if len(locs) != 1:
+                        continue
+                    loc = locs[0]
+                    if loc < 0:
+                        continue
+                    orig_ins = G.get_ins_from_loc(loc)
+                    if not orig_ins.is_propagable():
+                        continue
+                    if not orig_ins.get_rhs().is_const():
+                        if len(du[var, loc]) > 1:
+                            continue
+                        safe = True
+                        for var2 in orig_ins.get_used_vars():
+                            if not dataflow.clear_path(G, var2, loc, i):
+                                safe = False
+                                break
+                        if not safe:
+                            continue
+                    if orig_ins.has_side_effect():
+                        if not dataflow.clear_path(G, None, loc, i):
+                            continue
+                    ins.replace(var, orig_ins.get_rhs())
+                    ud[var, i].remove(loc)
+                    if len(ud[var, i]) == 0:
+                        ud.pop((var, i))
+                    for var2 in orig_ins.get_used_vars():
+                        old_ud = ud.get((var2, loc))
+                        if old_ud is None:
+                            continue
+                        ud[var2, i].extend(old_ud)
+                        ud.pop((var2, loc))
+                        for def_loc in old_ud:
+                            du[var2, def_loc].remove(loc)
+                            du[var2, def_loc].append(i)
+                    new_du = du[var, loc]
+                    new_du.remove(i)
+                    if not new_du:
+                        du.pop((var, loc))
+                        G.remove_ins(loc)
+                        change = True
+
+
+class RegisterPropagationTest(unittest.TestCase):
+
+    NB_REGS = 6
+
+    def _CreateIns(self, rand, vmap, last):
+        var = lambda: vmap[rand.randrange(self.NB_REGS)]
+        if last:
+            return instruction.ReturnInstruction(var())
+        kind = rand.randrange(6)
+        if kind == 0:
+            return instruction.AssignExpression(
+                var(), instruction.Constant(rand.randrange(10), 'I'))
+        elif kind == 1:
+            return instruction.MoveExpression(var(), var())
+        elif kind == 2:
+            return instruction.StaticInstruction(var(), 'LFoo;', 'I', 'bar')
+        elif kind == 3:
+            return instruction.AssignExpression(
+                var(), instruction.InvokeInstruction(
+                    'LFoo;', 'foo', var(), 'I', [], [var()],
+                    ('LFoo;', 'foo', '(I)I')))
+        return instruction.AssignExpression(
+            var(), instruction.BinaryExpression('+', var(), var(), 'I'))
+
+    def _CreateMethod(self, seed, nb_nodes, nb_ins):
+        """
+        Build a random acyclic method, and its DU/UD chains. Register 0 is the
+        only parameter of the method, all the others are defined before the
+        body.
+        """
+        rand = random.Random(seed)
+        vmap = dict((reg, instruction.Variable(reg))
+                    for reg in range(self.NB_REGS))
+        G = graph.Graph()
+        nodes = []
+        for num in range(nb_nodes):
+            lins = []
+            if num == 0:
+                for reg in range(1, self.NB_REGS):
+                    lins.append(instruction.AssignExpression(
+                        vmap[reg], instruction.Constant(reg, 'I')))
+            for idx in range(rand.randint(1, nb_ins)):
+                last = num == nb_nodes - 1 and idx == nb_ins - 1
+                lins.append(self._CreateIns(rand, vmap, last))
+            node = basic_blocks.StatementBlock('n%d' % num, lins)
+            G.add_node(node)
+            nodes.append(node)
+        for num, node in enumerate(nodes[:-1]):
+            G.add_edge(node, nodes[num + 1])
+            if rand.random() < 0.3:
+                G.add_edge(node, nodes[rand.randrange(num + 1, nb_nodes)])
+        G.entry = nodes[0]
+        G.compute_rpo()
+        G.number_ins()
+        du, ud = self._DefUse(G)
+        return G, du, ud
+
+    def _DefUse(self, G, params=(0, )):
+        """
+        Build the DU/UD chains of the graph. The i-th parameter is defined at
+        location -i - 1, as in dataflow.build_def_use.
+        """
+        def reaching_defs(var, node, end):
+            defs = set()
+            to_visit = [(node, end)]
+            visited = set()
+            while to_visit:
+                node, end = to_visit.pop()
+                for loc, ins in reversed(node.get_loc_with_ins()[:end]):
+                    if ins.get_lhs() == var:
+                        defs.add(loc)
+                        break
+                else:
+                    if node is G.entry and var in params:
+                        defs.add(-params.index(var) - 1)
+                    for pred in G.all_preds(node):
+                        if pred not in visited:
+                            visited.add(pred)
+                            to_visit.append((pred, None))
+            return sorted(defs)
+
+        ud = defaultdict(list)
+        du = defaultdict(list)
+        for node in G.rpo:
+            for idx, (loc, ins) in enumerate(node.get_loc_with_ins()):
+                for var in ins.get_used_vars():
+                    ud[var, loc] = reaching_defs(var, node, idx)
+                    for def_loc in ud[var, loc]:
+                        du[var, def_loc].append(loc)
+        return du, ud
+
+    def _Dump(self, G, du, ud):
+        return ([(loc, str(ins)) for node in G.rpo
+                 for loc, ins in node.get_loc_with_ins()],
+                dict((k, v) for k, v in du.items() if v),
+                dict((k, v) for k, v in ud.items() if v))
+
+    def _Run(self, propagation, method):
+        # The propagation may build recursive expressions on some random
+        # methods; both implementations have to fail the same way.
+        try:
+            propagation(*method)
+        except RuntimeError as e:
+            return type(e)
+        return self._Dump(*method)
+
+    def _Compare(self, method):
+        """
+        Check that both implementations give the same result, and return
+        their times.
+        """
+        expected = copy.deepcopy(method)
+        start = time.time()
+        expected_result = self._Run(fixed_point_propagation, expected)
+        fixed_point_time = time.time() - start
+        start = time.time()
+        result = self._Run(dataflow.register_propagation, method)
+        worklist_time = time.time() - start
+        self.assertEqual(expected_result, result)
+        return fixed_point_time, worklist_time
+
+    def _MethodGraph(self, method):
+        """
+        Build the graph of a decompiled method, as DvMethod.process does, and
+        its DU/UD chains.
+        """
+        G = graph.construct(method.start_block, method.var_to_name,
+                            method.exceptions)
+        return (G, ) + self._DefUse(G, method.lparams)
+
+    def testSameAsFixedPoint(self):
+        for seed in range(300):
+            self._Compare(self._CreateMethod(seed, 6, 8))
+
+    def testSameAsFixedPointSingleNode(self):
+        for seed in range(100):
+            self._Compare(self._CreateMethod(seed, 1, 40))
+
+    def testSameAsFixedPointLongMethod(self):
+        # Each call can only be propagated once the following one has been,
+        # so the propagation needs one pass per call over the whole method.
+        nb_calls, nb_puts = 100, 2000
+        vmap = dict((reg, instruction.Variable(reg))
+                    for reg in range(nb_calls + 2))
+        lins = [instruction.StaticInstruction(vmap[0], 'LFoo;', 'I', 'bar')
+                for _ in range(nb_puts)]
+        for reg in range(1, nb_calls + 1):
+            lins.append(instruction.AssignExpression(
+                vmap[reg], instruction.InvokeInstruction(
+                    'LFoo;', 'foo', vmap[0], 'I', [], [],
+                    ('LFoo;', 'foo', '()I'))))
+        lins.append(instruction.AssignExpression(
+            vmap[nb_calls + 1], instruction.InvokeInstruction(
+                'LFoo;', 'bar', vmap[0], 'I', [],
+                [vmap[reg] for reg in range(1, nb_calls + 1)],
+                ('LFoo;', 'bar', '()I'))))
+        lins.append(instruction.ReturnInstruction(vmap[nb_calls + 1]))
+        G = graph.Graph()
+        node = basic_blocks.StatementBlock('n0', lins)
+        G.add_node(node)
+        G.entry = node
+        G.compute_rpo()
+        G.number_ins()
+        fixed_point_time, worklist_time = self._Compare((G, ) +
+                                                        self._DefUse(G))
+        # Only reported, the times are too noisy to be compared here
+        sys.stderr.write('\nregister propagation of %d instructions: '
+                         'fixed point %.3fs, worklist %.3fs\n' %
+                         (len(lins), fixed_point_time, worklist_time))
+
+    def testSameAsFixedPointDecompiledMethods(self):
+        with open('examples/android/TestsAndroguard/bin/classes.dex',
+                  'rb') as f:
+            vm = dvm.DalvikVMFormat(f.read())
+        vmx = analysis.Analysis(vm)
+        vmx.create_xref()
+        nb_methods, nb_removed = 0, 0
+        for method in vm.get_methods():
+            if method.get_code() is None:
+                continue
+            dv_method = decompile.DvMethod(vmx.get_method(method))
+            G, du, ud = self._MethodGraph(dv_method)
+            nb_ins = len(G.loc_to_ins)
+            self._Compare((G, du, ud))
+            nb_methods += 1
+            nb_removed += nb_ins - len(G.loc_to_ins)
+        self.assertGreater(nb_methods, 100)
+        # The nodes give their instructions to each pass, so the propagation
+        # actually happens on the real graphs
+        self.assertGreater(nb_removed, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -79,6 +79,20 @@ ACCESS_ORDER = [0x1, 0x4, 0x2, 0x400, 0x8, 0x10, 0x80, 0x40, 0x20, 0x100, 0x800,
 TYPE_LEN = {'J': 2, 'D': 2,}
 
 
+class LazyOutput(object):
+    '''
+    Wrap an instruction so that its output is only built when a log message
+    using it is emitted.
+    '''
+    __slots__ = ('ins', )
+
+    def __init__(self, ins):
+        self.ins = ins
+
+    def __str__(self):
+        return self.ins.get_output()
+
+
 def get_access_class(access):
     sorted_access = [i for i in ACCESS_ORDER if i & access]
     return [ACCESS_FLAGS_CLASSES.get(flag, 'unkn_%d' % flag)
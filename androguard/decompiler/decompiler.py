@@ -22,23 +22,47 @@ from subprocess import Popen, PIPE, STDOUT
 
 import tempfile
 import os
+import sys
 
 from androguard.core.androconf import rrmdir
 from androguard.decompiler.dad import decompile
 from androguard.util import read
 
-PYGMENTS = True
-try:
-    from pygments.filter import Filter
-    from pygments import highlight
-    from pygments.lexers import get_lexer_by_name
-    from pygments.formatters import TerminalFormatter
-    from pygments.token import Token
-except ImportError:
-    PYGMENTS = False
+# pygments is slow to import, so it is only imported to color a source.
+_method_filter = None
 
-    class Filter(object):
-        pass
+
+def highlight_java(source, method_name=None):
+    """
+        Return the java source colored for a terminal, or the source itself
+        if pygments is not available.
+
+        :param method_name: only keep this method of the source (optional)
+    """
+    try:
+        from pygments import highlight
+        from pygments.lexers import get_lexer_by_name
+        from pygments.formatters import TerminalFormatter
+    except ImportError:
+        return source
+
+    lexer = get_lexer_by_name("java", stripall=True)
+    if method_name is not None:
+        lexer.add_filter(get_method_filter()(method_name=method_name))
+    return highlight(source, lexer, TerminalFormatter())
+
+
+def __getattr__(name):
+    # Lazy attributes of the module (PEP 562)
+    if name == "PYGMENTS":
+        try:
+            import pygments
+        except ImportError:
+            return False
+        return True
+    if name == "MethodFilter":
+        return get_method_filter()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 
 class Dex2Jar(object):
@@ -133,14 +157,7 @@ class DecompilerDex2Jad(object):
         if class_name not in self.classes:
             return ""
 
-        if PYGMENTS:
-            lexer = get_lexer_by_name("java", stripall=True)
-            lexer.add_filter(MethodFilter(method_name=method_name))
-            formatter = TerminalFormatter()
-            result = highlight(self.classes[class_name], lexer, formatter)
-            return result
-
-        return self.classes[class_name]
+        return highlight_java(self.classes[class_name], method_name)
 
     def display_source(self, method):
         print(self.get_source_method(method))
@@ -152,12 +169,7 @@ class DecompilerDex2Jad(object):
         if class_name not in self.classes:
             return ""
 
-        if PYGMENTS:
-            lexer = get_lexer_by_name("java", stripall=True)
-            formatter = TerminalFormatter()
-            result = highlight(self.classes[class_name], lexer, formatter)
-            return result
-        return self.classes[class_name]
+        return highlight_java(self.classes[class_name])
 
     def display_all(self, _class):
         print(self.get_all(_class.get_name()))
@@ -227,14 +239,7 @@ class DecompilerDex2WineJad(object):
         if class_name not in self.classes:
             return ""
 
-        if PYGMENTS:
-            lexer = get_lexer_by_name("java", stripall=True)
-            lexer.add_filter(MethodFilter(method_name=method_name))
-            formatter = TerminalFormatter()
-            result = highlight(self.classes[class_name], lexer, formatter)
-            return result
-
-        return self.classes[class_name]
+        return highlight_java(self.classes[class_name], method_name)
 
     def display_source(self, method):
         print(self.get_source_method(method))
@@ -246,12 +251,7 @@ class DecompilerDex2WineJad(object):
         if class_name not in self.classes:
             return ""
 
-        if PYGMENTS:
-            lexer = get_lexer_by_name("java", stripall=True)
-            formatter = TerminalFormatter()
-            result = highlight(self.classes[class_name], lexer, formatter)
-            return result
-        return self.classes[class_name]
+        return highlight_java(self.classes[class_name])
 
     def display_all(self, _class):
         print(self.get_all(_class.get_name()))
@@ -313,11 +313,7 @@ class DecompilerDed(object):
         if class_name not in self.classes:
             return ""
 
-        lexer = get_lexer_by_name("java", stripall=True)
-        lexer.add_filter(MethodFilter(method_name=method_name))
-        formatter = TerminalFormatter()
-        result = highlight(self.classes[class_name], lexer, formatter)
-        return result
+        return highlight_java(self.classes[class_name], method_name)
 
     def display_source(self, method):
         print(self.get_source_method(method))
@@ -326,10 +322,7 @@ class DecompilerDed(object):
         if class_name not in self.classes:
             return ""
 
-        lexer = get_lexer_by_name("java", stripall=True)
-        formatter = TerminalFormatter()
-        result = highlight(self.classes[class_name], lexer, formatter)
-        return result
+        return highlight_java(self.classes[class_name])
 
     def get_source_class(self, _class):
         return self.classes[_class.get_name()]
@@ -409,14 +402,7 @@ class DecompilerDex2Fernflower(object):
         if class_name not in self.classes:
             return ""
 
-        if PYGMENTS:
-            lexer = get_lexer_by_name("java", stripall=True)
-            lexer.add_filter(MethodFilter(method_name=method_name))
-            formatter = TerminalFormatter()
-            result = highlight(self.classes[class_name], lexer, formatter)
-            return result
-
-        return self.classes[class_name]
+        return highlight_java(self.classes[class_name], method_name)
 
     def display_source(self, method):
         print(self.get_source_method(method))
@@ -428,79 +414,97 @@ class DecompilerDex2Fernflower(object):
         if class_name not in self.classes:
             return ""
 
-        if PYGMENTS:
-            lexer = get_lexer_by_name("java", stripall=True)
-            formatter = TerminalFormatter()
-            result = highlight(self.classes[class_name], lexer, formatter)
-            return result
-        return self.classes[class_name]
+        return highlight_java(self.classes[class_name])
 
     def display_all(self, _class):
         print(self.get_all(_class.get_name()))
 
 
-class MethodFilter(Filter):
+def get_method_filter():
+    """
+        Return the pygments filter class which only keeps the tokens of
+        a method
+    """
+    global _method_filter
+    if _method_filter is not None:
+        return _method_filter
 
-    def __init__(self, **options):
-        Filter.__init__(self, **options)
+    from pygments.filter import Filter
+    from pygments.token import Token
 
-        self.method_name = options["method_name"]
-        #self.descriptor = options["descriptor"]
+    class MethodFilter(Filter):
 
-        self.present = False
-        self.get_desc = True  #False
+        def __init__(self, **options):
+            Filter.__init__(self, **options)
 
-    def filter(self, lexer, stream):
-        a = []
-        l = []
-        rep = []
+            self.method_name = options["method_name"]
+            #self.descriptor = options["descriptor"]
 
-        for ttype, value in stream:
-            if self.method_name == value and (ttype is Token.Name.Function or
-                                                  ttype is Token.Name):
-                #print ttype, value
+            self.present = False
+            self.get_desc = True  #False
 
-                item_decl = -1
-                for i in range(len(a) - 1, 0, -1):
-                    if a[i][0] is Token.Keyword.Declaration:
-                        if a[i][1] != "class":
-                            item_decl = i
-                        break
+        def filter(self, lexer, stream):
+            a = []
+            l = []
+            rep = []
 
-                if item_decl != -1:
-                    self.present = True
-                    l.extend(a[item_decl:])
+            for ttype, value in stream:
+                if self.method_name == value and (ttype is Token.Name.Function or
+                                                      ttype is Token.Name):
+                    #print ttype, value
 
-            if self.present and ttype is Token.Keyword.Declaration:
+                    item_decl = -1
+                    for i in range(len(a) - 1, 0, -1):
+                        if a[i][0] is Token.Keyword.Declaration:
+                            if a[i][1] != "class":
+                                item_decl = i
+                            break
+
+                    if item_decl != -1:
+                        self.present = True
+                        l.extend(a[item_decl:])
+
+                if self.present and ttype is Token.Keyword.Declaration:
+                    item_end = -1
+                    for i in range(len(l) - 1, 0, -1):
+                        if l[i][0] is Token.Operator and l[i][1] == "}":
+                            item_end = i
+                            break
+
+                    if item_end != -1:
+                        rep.extend(l[:item_end + 1])
+                        l = []
+                        self.present = False
+
+                if self.present:
+                    l.append((ttype, value))
+
+                a.append((ttype, value))
+
+            if self.present:
+                nb = 0
                 item_end = -1
                 for i in range(len(l) - 1, 0, -1):
                     if l[i][0] is Token.Operator and l[i][1] == "}":
-                        item_end = i
-                        break
+                        nb += 1
+                        if nb == 2:
+                            item_end = i
+                            break
 
-                if item_end != -1:
-                    rep.extend(l[:item_end + 1])
-                    l = []
-                    self.present = False
+                rep.extend(l[:item_end + 1])
 
-            if self.present:
-                l.append((ttype, value))
-
-            a.append((ttype, value))
-
-        if self.present:
-            nb = 0
-            item_end = -1
-            for i in range(len(l) - 1, 0, -1):
-                if l[i][0] is Token.Operator and l[i][1] == "}":
-                    nb += 1
-                    if nb == 2:
-                        item_end = i
-                        break
+            return rep
 
-            rep.extend(l[:item_end + 1])
+    _method_filter = MethodFilter
+    return _method_filter
 
-        return rep
+
+if sys.version_info < (3, 7):
+    # There is no module __getattr__ before Python 3.7, so the lazy
+    # attributes are defined now
+    PYGMENTS = __getattr__("PYGMENTS")
+    if PYGMENTS:
+        MethodFilter = get_method_filter()
 
 
 class DecompilerDAD(object):
@@ -524,11 +528,7 @@ class DecompilerDAD(object):
     def display_source(self, m):
         result = self.get_source_method(m)
 
-        if PYGMENTS:
-            lexer = get_lexer_by_name("java", stripall=True)
-            formatter = TerminalFormatter()
-            result = highlight(result, lexer, formatter)
-        print(result)
+        print(highlight_java(result))
 
     def get_source_class(self, _class):
         c = decompile.DvClass(_class, self.vmx)
@@ -548,14 +548,18 @@ class DecompilerDAD(object):
 
         return result
 
+    def iter_source_class_ext(self, _class):
+        c = decompile.DvClass(_class, self.vmx)
+        return c.iter_source_ext(process=True)
+
+    def write_source_class(self, _class, fd):
+        c = decompile.DvClass(_class, self.vmx)
+        c.write_source(fd, process=True)
+
     def display_all(self, _class):
         result = self.get_source_class(_class)
 
-        if PYGMENTS:
-            lexer = get_lexer_by_name("java", stripall=True)
-            formatter = TerminalFormatter()
-            result = highlight(result, lexer, formatter)
-        print(result)
+        print(highlight_java(result))
 
     def get_all(self, class_name):
         pass
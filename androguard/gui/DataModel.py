@@ -335,9 +335,18 @@ class DexClassModel(DataModel):
         buff = bytearray()
         self.ins_size = 0
         for method in current_class.get_methods():
-            for ins in method.get_instructions():
-                buff += ins.get_raw()
-                self.ins_size += ins.get_length() * 2
+            code = method.get_code()
+            if code is None:
+                continue
+
+            if method.is_cached_instructions():
+                for ins in method.get_instructions():
+                    buff += ins.get_raw()
+                    self.ins_size += ins.get_length() * 2
+            else:
+                # The instructions are decoded by the views, when displayed
+                buff += code.get_bc().get_insn()
+                self.ins_size += code.get_insns_size() * 4
         return buff
 
     def GetViews(self):
@@ -4,6 +4,9 @@ from __future__ import absolute_import
 from builtins import hex
 from builtins import range
 from builtins import object
+import bisect
+import collections
+
 from .ViewMode import *
 from .cemu import *
 from . import TextSelection
@@ -16,6 +19,9 @@ from androguard.core import androconf
 MNEMONIC_COLUMN = 30
 MNEMONIC_WIDTH = 30
 
+# The number of methods whose decoded instructions are kept
+MAX_DECODED_METHODS = 64
+
 
 class InstructionView(object):
     def __init__(self, ins):
@@ -161,6 +167,121 @@ class InstructionView(object):
         return None, None, None
 
 
+class InstructionCache(object):
+    """
+        The instructions of the methods of a class, decoded on demand
+
+        The offset of each method is computed from the size of its code, so
+        the instructions are only decoded when the rows around them are
+        displayed. The instructions of the last methods used are kept.
+
+        The offsets are the ones of the view: twice the offsets in bytes.
+
+        :param methods: the methods, in the order they are displayed
+        :type methods: list of :class:`dvm.EncodedMethod`
+        :param max_methods: the number of methods whose instructions are kept
+        :type max_methods: int
+    """
+
+    def __init__(self, methods, max_methods=MAX_DECODED_METHODS):
+        self.methods = []
+        self.starts = []
+        self.max_methods = max_methods
+
+        offset = 0
+        for method in methods:
+            code = method.get_code()
+            if code is None or code.get_insns_size() == 0:
+                continue
+            size = code.get_insns_size() * 4
+            self.methods.append(method)
+            self.starts.append(offset)
+            offset += size
+        self.size = offset
+
+        # method index -> [instructions, end offsets, decoder]
+        self._decoded = collections.OrderedDict()
+
+    def __len__(self):
+        return self.size
+
+    def _get_method(self, idx):
+        decoded = self._decoded.pop(idx, None)
+        if decoded is None:
+            decoded = [[], [], iter(self.methods[idx].get_instructions())]
+            while len(self._decoded) >= self.max_methods:
+                self._decoded.popitem(last=False)
+        self._decoded[idx] = decoded
+        return decoded
+
+    def _find(self, offset):
+        """
+            Return the (method index, instruction index) of the instruction
+            containing offset, or None
+        """
+        if offset < 0 or offset >= self.size:
+            return None
+
+        idx = bisect.bisect_right(self.starts, offset) - 1
+        instructions, ends, decoder = self._get_method(idx)
+        relative = offset - self.starts[idx]
+        while not ends or ends[-1] <= relative:
+            ins = next(decoder, None)
+            if ins is None:
+                return None
+            ins = InstructionView(ins)
+            instructions.append(ins)
+            ends.append((ends[-1] if ends else 0) + ins.get_length())
+        return idx, bisect.bisect_right(ends, relative)
+
+    def get_start(self, offset):
+        """
+            Return the offset of the instruction containing offset, or None
+        """
+        position = self._find(offset)
+        if position is None:
+            return None
+        idx, i = position
+        ends = self._decoded[idx][1]
+        return self.starts[idx] + (ends[i - 1] if i else 0)
+
+    def get(self, offset):
+        """
+            Return the :class:`InstructionView` of the instruction containing
+            offset, or None
+        """
+        position = self._find(offset)
+        if position is None:
+            return None
+        idx, i = position
+        return self._decoded[idx][0][i]
+
+    def get_previous(self, offset):
+        """
+            Return the :class:`InstructionView` of the instruction before the
+            one containing offset, or None
+        """
+        start = self.get_start(offset)
+        if not start:
+            return None
+        return self.get(start - 1)
+
+    def get_instructions(self, offset, count):
+        """
+            Return the :class:`InstructionView` of at most count instructions,
+            from the one containing offset
+        """
+        instructions = []
+        offset = self.get_start(offset)
+        while offset is not None and len(instructions) < count:
+            ins = self.get(offset)
+            if ins is None:
+                break
+            instructions.append(ins)
+            offset += ins.get_length()
+        return instructions
+
+
 class DisasmViewMode(ViewMode):
     def __init__(self, themes, width, height, data, cursor, widget=None):
         super(DisasmViewMode, self).__init__()
@@ -192,35 +313,12 @@ class DisasmViewMode(ViewMode):
         self._fontHeight = fm.height()
 
         self.FlowHistory = []
-        self.CACHE_OPCODES = []
-        self.CACHE_IDX_OPCODES = {}
-        self.CACHE_IDX_OPCODES_OFF = {}
-
         self.OPCODES = []
 
-        vm_analysis = self.dataModel.current_class.CM.get_vmanalysis()
-
-        methods = [i for i in self.dataModel.current_class.get_methods()]
-        print(methods)
-        methods = sorted(methods, key=lambda x: x.get_address(), reverse=True)
-
-        offset = 0
-        cnt = 0
-        for method in methods:
-            mx = vm_analysis.get_method(method)
-            for DVMBasicMethodBlockInstruction in method.get_instructions():
-            #for DVMBasicMethodBlock in mx.basic_blocks.gets():
-            #    for DVMBasicMethodBlockInstruction in DVMBasicMethodBlock.get_instructions():
-                ins = InstructionView(DVMBasicMethodBlockInstruction)
-                self.CACHE_OPCODES.append(ins)
-                self.CACHE_IDX_OPCODES[offset] = ins
-                self.CACHE_IDX_OPCODES_OFF[offset] = cnt
-                offset += ins.get_length()
-                cnt += 1
-
-        self.max_offset = offset
-
-        print(sorted(self.CACHE_IDX_OPCODES_OFF.keys()))
+        methods = sorted(self.dataModel.current_class.get_methods(),
+                         key=lambda x: x.get_address(), reverse=True)
+        self.instructions = InstructionCache(methods)
+        self.max_offset = self.instructions.size
 
         self.textPen = QtGui.QPen(self.themes['pen'], 0, QtCore.Qt.SolidLine)
         self.resize(width, height)
@@ -233,19 +331,13 @@ class DisasmViewMode(ViewMode):
         self.selector = TextSelection.DisasmSelection(themes, self)
 
     def GetLengthOpcodes(self):
-        length = 0
-        for i in self.CACHE_OPCODES:
-            length += i.get_length()
-        return length
+        return self.instructions.size
 
     def FeedOpcodes(self, cnt):
-        print('FEED ', cnt)
-        self.OPCODES = []
-        for i in range(0, min(cnt, len(self.CACHE_OPCODES))):
-            ins = self.CACHE_OPCODES[i]
+        self.OPCODES = self.instructions.get_instructions(
+            self.dataModel.getOffset(), cnt)
+        for ins in self.OPCODES:
             ins.Load()
-            self.OPCODES.append(ins)
-
 
     @property
     def fontWidth(self):
@@ -326,11 +418,9 @@ class DisasmViewMode(ViewMode):
     def drawCursor(self, qp):
         cursorX, cursorY = self.cursor.getPosition()
 
-        print(cursorX, cursorY)
-
         xstart = cursorX
 
-        if cursorY not in self.OPCODES:
+        if cursorY >= len(self.OPCODES):
             androconf.warning("Impossible to find instruction at cursor %d, %d" % (cursorY, len(self.OPCODES)))
             return
 
@@ -531,8 +621,6 @@ class DisasmViewMode(ViewMode):
 
 
     def _drawRow(self, qp, cemu, row, asm, offset=-1):
-        print('DRAW AN INSTRUCTION', asm, row, asm.get_name(), len(asm.get_operands(offset)), hex(self.getPageOffset()))
-
         qp.setPen(QtGui.QPen(QtGui.QColor(192, 192, 192), 1, QtCore.Qt.SolidLine))
 
         hex_data = asm.get_hex()
@@ -645,7 +733,6 @@ class DisasmViewMode(ViewMode):
             cemu.write(s[idx:])
 
     def drawTextMode(self, qp):
-        print('OFFSET', self.dataModel.getOffset())
         # draw background
         qp.fillRect(0, 0, self.COLUMNS * self.fontWidth,  self.ROWS * self.fontHeight, self.backgroundBrush)
 
@@ -686,8 +773,6 @@ class DisasmViewMode(ViewMode):
         return None
 
     def goTo(self, offset):
-        print("GOTO ", offset)
-        
         tsize = sum([opcode.get_length() for opcode in self.OPCODES])
 
         if offset < self.dataModel.getOffset() + tsize and offset > self.dataModel.getOffset():
@@ -701,7 +786,10 @@ class DisasmViewMode(ViewMode):
 
             self.draw(refresh=False)
         else:
-            # else, move page
+            # else, move page, to the start of the instruction
+            start = self.instructions.get_start(offset)
+            if start is not None:
+                offset = start
             self.dataModel.goTo(offset)
             self.FeedOpcodes(self.ROWS)
             self.cursor.moveAbsolute(0, 0)
@@ -718,37 +806,19 @@ class DisasmViewMode(ViewMode):
         self.scroll(0, -number*self.ROWS, cachePix=cachePix, pageOffset=pageOffset)
 
     def scroll_v(self, dy, cachePix=None, pageOffset=None):
-        print('scroll_v', dy, cachePix, pageOffset, hex(self.getCursorAbsolutePosition()))
-
         RowsToDraw = []
         factor = abs(dy)
-        # repeat as many rows we have scrolled
+        # repeat as many rows we have scrolled, decoding the new ones
         for row in range(factor):
-            current_idx = None
             if dy < 0:
                 tsize = sum([asm.get_length() for asm in self.OPCODES])
-                current_offset = self.dataModel.getOffset() + tsize
-                if current_offset not in self.CACHE_IDX_OPCODES_OFF:
-                    print('INVALID OFFSET', hex(current_offset))
-                    return
-
-                current_idx = self.CACHE_IDX_OPCODES_OFF[current_offset] - 1
-                print("IDX", current_idx, hex(current_offset))
-
-                if current_idx + 1 >= len(self.CACHE_OPCODES):
-                    print('END OF DATA')
-                    return
-
-                current_idx += 1
-
-            if dy >= 0:
-                current_offset = self.dataModel.getOffset()
-                current_idx = self.CACHE_IDX_OPCODES_OFF[current_offset]
-                print("IDX", current_idx, hex(current_offset))
-                #start = self.CACHE_OPCODES[self.CACHE_IDX_OPCODES_OFF[self.getCursorAbsolutePosition()]-1]
-                current_idx -= 1
+                newins = self.instructions.get(self.dataModel.getOffset() + tsize)
+            else:
+                newins = self.instructions.get_previous(self.dataModel.getOffset())
 
-            newins = self.CACHE_OPCODES[current_idx]
+            if newins is None:
+                # end or beginning of the data
+                break
 
             if dy < 0:
                 self.dataModel.slide(self.OPCODES[0].get_length())
@@ -771,10 +841,12 @@ class DisasmViewMode(ViewMode):
             if dy > 0:
                 RowsToDraw.append((-row - 1, newins))
 
-        print('ROW TO DRAW', RowsToDraw)
+        if not RowsToDraw:
+            return
+
         if len(RowsToDraw) < abs(dy):
             # maybe we couldn't draw dy rows (possible we reached the beginning of the data to early), recalculate dy
-            dy = len(RowsToDraw)*dy/abs(dy)
+            dy = len(RowsToDraw)*dy//abs(dy)
             factor = abs(dy)
 
         if not cachePix:
@@ -803,10 +875,8 @@ class DisasmViewMode(ViewMode):
             self._drawRow(qp, cemu, dy + row, asm)
 
         qp.end()
-        print('')
 
     def scroll(self, dx, dy, cachePix=None, pageOffset=None):
-        print('scroll ', dx, dy, self.dataModel.inLimits((self.dataModel.getOffset() - dx)), 'offset', self.dataModel.getOffset())
         if dx != 0:
             if self.dataModel.inLimits((self.dataModel.getOffset() - dx)):
                 self.dataModel.slide(dx)
@@ -816,14 +886,12 @@ class DisasmViewMode(ViewMode):
         if dy != 0:
             if dy > 0:
                 if self.dataModel.getOffset() == 0:
-                    print('OFFSET == 0')
                     return
 
             if dy < 0:
                 tsize = sum([asm.get_length() for asm in self.OPCODES])
 
                 if self.dataModel.getOffset() + tsize ==  self.dataModel.getDataSize():
-                    print('END')
                     return
 
             self.scroll_v(dy, cachePix, pageOffset)
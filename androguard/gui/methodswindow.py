@@ -1,7 +1,43 @@
 from PyQt5 import QtCore, QtGui, QtWidgets
+from androguard.gui.models import LazyListModel
 from androguard.gui.xrefwindow import XrefDialogMethod
 
 
+class MethodsModel(LazyListModel):
+    """
+        The methods of the DEX files of the session, filtered by name
+    """
+
+    def __init__(self, session, parent=None):
+        super(MethodsModel, self).__init__(
+            ["Name", "Class Name", "Prototype", "Address", "Digest"], parent)
+        self.session = session
+        self.reset()
+
+    def iter_rows(self, pattern):
+        for digest, d, dx in self.session.get_objects_dex():
+            for method in d.get_methods():
+                if pattern is None or pattern.search(method.get_name()):
+                    yield (method, digest, dx)
+
+    def get_column(self, row, column):
+        method, digest, _ = row
+        if column == 0:
+            return method.get_name()
+        elif column == 1:
+            return method.get_class_name()
+        elif column == 2:
+            return method.get_descriptor()
+        elif column == 3:
+            return "0x%x" % method.get_address()
+        return digest
+
+    def get_sort_key(self, row, column):
+        if column == 3:
+            return row[0].get_address()
+        return self.get_column(row, column)
+
+
 class MethodsWindow(QtWidgets.QWidget):
 
     def __init__(self, parent=None, win=None, session=None):
@@ -25,8 +61,7 @@ class MethodsWindow(QtWidgets.QWidget):
         self.setLayout(sourceLayout)
 
     def filterRegExpChanged(self, value):
-        regExp = QtCore.QRegExp(value)
-        self.methodswindow.proxyModel.setFilterRegExp(regExp)
+        self.methodswindow.model.setFilter(value)
 
 
 class MethodsValueWindow(QtWidgets.QTreeView):
@@ -37,63 +72,25 @@ class MethodsValueWindow(QtWidgets.QTreeView):
         self.session = session
         self.title = "Methods"
 
-        self.reverse_methods = {}
-
-        self.proxyModel = QtCore.QSortFilterProxyModel()
-        self.proxyModel.setDynamicSortFilter(True)
-
-        nb = 0
-        for digest, d, dx in self.session.get_objects_dex():
-            for method in d.get_methods():
-                nb += 1
-
-        self.model = QtGui.QStandardItemModel(nb, 5,
-                                              self)
-
-        self.model.setHeaderData(0, QtCore.Qt.Horizontal, "Name")
-        self.model.setHeaderData(1, QtCore.Qt.Horizontal, "Class Name")
-        self.model.setHeaderData(2, QtCore.Qt.Horizontal, "Prototype")
-        self.model.setHeaderData(3, QtCore.Qt.Horizontal, "Address")
-        self.model.setHeaderData(4, QtCore.Qt.Horizontal, "Digest")
-
-        row = 0
-        for digest, d, dx in self.session.get_objects_dex():
-            for method in d.get_methods():
-                self.model.setData(self.model.index(
-                    row, 0, QtCore.QModelIndex()), method.get_name())
-                self.model.setData(self.model.index(
-                    row, 1, QtCore.QModelIndex()), method.get_class_name())
-                self.model.setData(self.model.index(
-                    row, 2, QtCore.QModelIndex()), method.get_descriptor())
-                self.model.setData(self.model.index(
-                    row, 3, QtCore.QModelIndex()), "0x%x" % method.get_address())
-                self.model.setData(self.model.index(
-                    row, 4, QtCore.QModelIndex()), digest)
-                self.reverse_methods[method.get_name() + method.get_class_name() + method.get_descriptor() + digest
-                                    ] = dx.get_method_analysis(method)
-                row += 1
-
-        self.proxyModel.setSourceModel(self.model)
+        self.model = MethodsModel(self.session, self)
 
         self.setRootIsDecorated(False)
         self.setAlternatingRowColors(True)
-        self.setModel(self.proxyModel)
+        self.setModel(self.model)
+        # No sort at first, it would fetch all the methods
+        self.header().setSortIndicator(-1, QtCore.Qt.AscendingOrder)
         self.setSortingEnabled(True)
         self.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
 
         self.doubleClicked.connect(self.slotDoubleClicked)
 
     def slotDoubleClicked(self, mi):
-        mi = self.proxyModel.mapToSource(mi)
-        row = mi.row()
         column = mi.column()
 
         if column == 0:
+            method, _, dx = self.model.get_row(mi)
             xwin = XrefDialogMethod(
                 parent=self.mainwin,
                 win=self.mainwin,
-                method_analysis=self.reverse_methods[self.model.item(row).text() +
-                                                     self.model.item(row, 1).text() + 
-                                                     self.model.item(row, 2).text() + 
-                                                     self.model.item(row, 4).text()])
+                method_analysis=dx.get_method_analysis(method))
             xwin.show()
@@ -0,0 +1,154 @@
+"""
+Item models of the windows listing the content of a session.
+
+The rows of a :class:`LazyListModel` come from an iterator over the indexes
+of the session: they are fetched by blocks, when the view displays them
+(see `QAbstractItemModel.canFetchMore`), and their columns are only computed
+when they are displayed. The filter is applied by the iterator, so the rows
+which don't match are never fetched.
+"""
+import itertools
+import re
+
+from PyQt5 import QtCore
+
+# The number of rows fetched at once
+FETCH_SIZE = 256
+
+
+def compile_filter(pattern):
+    """
+        Return the compiled regex of the pattern of a filter, or None if it
+        is empty. A pattern which is not a valid regex is searched as is.
+    """
+    if not pattern:
+        return None
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return re.compile(re.escape(pattern))
+
+
+class LazyListModel(QtCore.QAbstractItemModel):
+    """
+        A list of rows, fetched when they are displayed
+
+        The subclasses yield the rows matching a filter in :meth:`iter_rows`,
+        and give the value of their columns with :meth:`get_column`.
+
+        :param headers: the names of the columns
+        :type headers: list of string
+    """
+
+    def __init__(self, headers, parent=None):
+        super(LazyListModel, self).__init__(parent)
+        self.headers = headers
+        self.pattern = None
+        self.sort_column = -1
+        self.sort_order = QtCore.Qt.AscendingOrder
+
+        self._rows = []
+        self._iterator = None
+
+    def iter_rows(self, pattern):
+        """
+            Yield the rows matching the pattern of the filter, or all of them
+            if it is None
+        """
+        raise NotImplementedError('method not implemented.')
+
+    def get_column(self, row, column):
+        """
+            Return the value displayed in the column of the row
+        """
+        raise NotImplementedError('method not implemented.')
+
+    def get_sort_key(self, row, column):
+        return self.get_column(row, column)
+
+    def get_row(self, index):
+        """
+            Return the row of the index
+        """
+        return self._rows[index.row()]
+
+    def reset(self):
+        """
+            Drop the rows fetched, and start again from the first one
+        """
+        self.beginResetModel()
+        self._rows = []
+        self._iterator = iter(self.iter_rows(compile_filter(self.pattern)))
+        self.endResetModel()
+
+        if self.sort_column >= 0:
+            self.sort(self.sort_column, self.sort_order)
+
+    def setFilter(self, pattern):
+        self.pattern = pattern
+        self.reset()
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        if parent.isValid() or not 0 <= row < len(self._rows) or \
+                not 0 <= column < len(self.headers):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QtCore.QModelIndex()):
+        return QtCore.QModelIndex()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return len(self.headers)
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        return not parent.isValid()
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and \
+                orientation == QtCore.Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.DisplayRole:
+            return None
+        return self.get_column(self._rows[index.row()], index.column())
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        return not parent.isValid() and self._iterator is not None
+
+    def fetchMore(self, parent=QtCore.QModelIndex(), size=FETCH_SIZE):
+        if not self.canFetchMore(parent):
+            return
+
+        rows = list(itertools.islice(self._iterator, size))
+        if len(rows) < size:
+            self._iterator = None
+        if not rows:
+            return
+
+        first = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), first,
+                             first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        self.sort_column = column
+        self.sort_order = order
+        if column < 0:
+            return
+
+        # All the rows are needed to sort them
+        self.beginResetModel()
+        if self._iterator is not None:
+            self._rows.extend(self._iterator)
+            self._iterator = None
+        self._rows.sort(key=lambda row: self.get_sort_key(row, column),
+                        reverse=order == QtCore.Qt.DescendingOrder)
+        self.endResetModel()
@@ -1,5 +1,6 @@
 from __future__ import print_function
 from builtins import str
+import itertools
 from PyQt5 import QtCore, QtGui, QtWidgets
 from androguard.core import androconf
 from androguard.gui.helpers import class2func, method2func, classdot2func, classdot2class, proto2methodprotofunc
@@ -364,7 +365,7 @@ class SourceWindow(QtWidgets.QTextEdit):
         lines.append(("COMMENTS", [(
             "COMMENT", method_info_buff + "\n\n")]))
 
-        lines.extend(self.current_class.get_source_ext())
+        lines = itertools.chain(lines, self.current_class.iter_source_ext())
 
         #TODO: delete doc when tab is closed? not deleted by "self" :(
         if hasattr(self, "doc"):
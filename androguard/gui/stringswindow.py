@@ -1,7 +1,46 @@
 from PyQt5 import QtCore, QtGui, QtWidgets
+from androguard.gui.models import LazyListModel
 from androguard.gui.xrefwindow import XrefDialogString
 
 
+class StringsModel(LazyListModel):
+    """
+        The strings used by the DEX files of the session
+
+        The filter is searched in the string pools of the DEX files, see
+        :meth:`Session.search_strings`.
+    """
+
+    def __init__(self, session, parent=None):
+        super(StringsModel, self).__init__(
+            ["String", "Usage", "Filename", "Digest"], parent)
+        self.session = session
+        self.reset()
+
+    def iter_rows(self, pattern):
+        if pattern is None:
+            for digest, filename, strings_analysis in self.session.get_strings():
+                for string_value in strings_analysis:
+                    yield (strings_analysis[string_value], filename, digest)
+            return
+
+        for digest, filename, match in self.session.search_strings(
+                [pattern.pattern]):
+            # Only the strings used by the code have an analysis
+            if match.get_string_analysis() is not None:
+                yield (match.get_string_analysis(), filename, digest)
+
+    def get_column(self, row, column):
+        string_analysis, filename, digest = row
+        if column == 0:
+            return repr(string_analysis.get_value())
+        elif column == 1:
+            return len(string_analysis.get_xref_from())
+        elif column == 2:
+            return filename
+        return digest
+
+
 class StringsWindow(QtWidgets.QWidget):
 
     def __init__(self, parent=None, win=None, session=None):
@@ -25,8 +64,7 @@ class StringsWindow(QtWidgets.QWidget):
         self.setLayout(sourceLayout)
 
     def filterRegExpChanged(self, value):
-        regExp = QtCore.QRegExp(value)
-        self.stringswindow.proxyModel.setFilterRegExp(regExp)
+        self.stringswindow.model.setFilter(value)
 
 
 class StringsValueWindow(QtWidgets.QTreeView):
@@ -37,54 +75,25 @@ class StringsValueWindow(QtWidgets.QTreeView):
         self.session = session
         self.title = "Strings"
 
-        self.reverse_strings = {}
-
-        self.proxyModel = QtCore.QSortFilterProxyModel()
-        self.proxyModel.setDynamicSortFilter(True)
-
-        self.model = QtGui.QStandardItemModel(self.session.get_nb_strings(), 4,
-                                              self)
-
-        self.model.setHeaderData(0, QtCore.Qt.Horizontal, "String")
-        self.model.setHeaderData(1, QtCore.Qt.Horizontal, "Usage")
-        self.model.setHeaderData(2, QtCore.Qt.Horizontal, "Filename")
-        self.model.setHeaderData(3, QtCore.Qt.Horizontal, "Digest")
-
-        row = 0
-        for digest, filename, strings_analysis in self.session.get_strings():
-            for string_value in strings_analysis:
-                self.model.setData(self.model.index(
-                    row, 0, QtCore.QModelIndex()), repr(strings_analysis[string_value].get_value()))
-                self.model.setData(
-                    self.model.index(row, 1, QtCore.QModelIndex()),
-                    len(strings_analysis[string_value].get_xref_from()))
-                self.model.setData(self.model.index(
-                    row, 2, QtCore.QModelIndex()), filename)
-                self.model.setData(self.model.index(
-                    row, 3, QtCore.QModelIndex()), digest)
-                self.reverse_strings[repr(strings_analysis[string_value].get_value()) + digest
-                                    ] = strings_analysis[string_value]
-                row += 1
-
-        self.proxyModel.setSourceModel(self.model)
+        self.model = StringsModel(self.session, self)
 
         self.setRootIsDecorated(False)
         self.setAlternatingRowColors(True)
-        self.setModel(self.proxyModel)
+        self.setModel(self.model)
+        # Not sorted until asked, as all the strings are needed to sort them
+        self.header().setSortIndicator(-1, QtCore.Qt.AscendingOrder)
         self.setSortingEnabled(True)
         self.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
 
         self.doubleClicked.connect(self.slotDoubleClicked)
 
     def slotDoubleClicked(self, mi):
-        mi = self.proxyModel.mapToSource(mi)
-        row = mi.row()
         column = mi.column()
 
         if column == 0:
+            string_analysis, _, _ = self.model.get_row(mi)
             xwin = XrefDialogString(
                 parent=self.mainwin,
                 win=self.mainwin,
-                string_analysis=self.reverse_strings[self.model.item(row).text(
-                ) + self.model.item(row, 3).text()])
+                string_analysis=string_analysis)
             xwin.show()
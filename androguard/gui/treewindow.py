@@ -1,89 +1,162 @@
 from builtins import str
 from builtins import range
-from PyQt5 import QtWidgets, QtGui
+from builtins import object
+import itertools
+
+from PyQt5 import QtCore, QtWidgets, QtGui
 
 from androguard.core import androconf
 from androguard.gui.xrefwindow import XrefDialogClass
 from androguard.gui.sourcewindow import SourceWindow
 from androguard.gui.helpers import classdot2class, Signature
 
-class HashableQTreeWidgetItem(QtWidgets.QTreeWidgetItem):
-    
-    # TODO this is a pure workaround to have a hash method!
-    # It seems that for python2 is __hash__ available
-    # But not on python3
-    def __hash__(self):
-        return hash(self.__str__())
+
+class ClassNode(object):
+    """
+        A package or a class of the tree
+
+        The children of a package are only built when it is expanded, from
+        the entries of the classes it contains: (path, class name, class,
+        filename, digest), where path is the list of the packages of the
+        class.
+    """
+
+    def __init__(self, name, parent=None, row=0, depth=0, entries=None,
+                 current_class=None, filename=None, digest=None):
+        self.name = name
+        self.parent = parent
+        self.row = row
+        self.depth = depth
+        self.entries = entries
+        self.children = []
+
+        self.current_class = current_class
+        self.filename = filename
+        self.digest = digest
+
+    def build_children(self):
+        children = []
+        depth = self.depth
+        key = lambda entry: (len(entry[0]) == depth, entry[0][depth:depth + 1])
+        for (is_class, path), entries in itertools.groupby(self.entries, key):
+            if is_class:
+                for _, class_name, current_class, filename, digest in entries:
+                    children.append(ClassNode(
+                        class_name, self, len(children), depth + 1,
+                        current_class=current_class, filename=filename,
+                        digest=digest))
+            else:
+                children.append(ClassNode(path[0], self, len(children),
+                                          depth + 1, entries=list(entries)))
+        return children
+
+
+class ClassesTreeModel(QtCore.QAbstractItemModel):
+    """
+        The classes of the session, by package
+
+        All the classes are sorted by path when the model is filled, but the
+        nodes of a package are only built when it is expanded.
+    """
+
+    def __init__(self, parent=None):
+        super(ClassesTreeModel, self).__init__(parent)
+        self.root = ClassNode(None, entries=[])
+
+    def fill(self, session):
+        entries = []
+        for idx, filename, digest, classes in session.get_classes():
+            for c in classes:
+                sig = Signature(c)
+                path = tuple(sig.class_path) or (".",)
+                class_name = sig.class_name
+                if idx > 0:
+                    class_name += "@%d" % idx
+                c.current_title = class_name
+                entries.append((path, class_name, c, filename, digest))
+        entries.sort(key=lambda entry: entry[:2])
+
+        self.beginResetModel()
+        self.root = ClassNode(None, entries=entries)
+        self.endResetModel()
+
+    def get_node(self, index):
+        if index.isValid():
+            return index.internalPointer()
+        return self.root
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        node = self.get_node(parent)
+        if column != 0 or not 0 <= row < len(node.children):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index=QtCore.QModelIndex()):
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self.root:
+            return QtCore.QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return len(self.get_node(parent).children)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        node = self.get_node(parent)
+        return bool(node.children or node.entries)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.DisplayRole:
+            return None
+        return index.internalPointer().name
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        return bool(self.get_node(parent).entries)
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        node = self.get_node(parent)
+        if not node.entries:
+            return
+
+        children = node.build_children()
+        self.beginInsertRows(parent, 0, len(children) - 1)
+        node.children = children
+        node.entries = None
+        self.endInsertRows()
 
 
-class TreeWindow(QtWidgets.QTreeWidget):
+class TreeWindow(QtWidgets.QTreeView):
 
     def __init__(self, parent=None, win=None, session=None):
         super(TreeWindow, self).__init__(parent)
-        self.itemDoubleClicked.connect(self.itemDoubleClickedHandler)
+        self.doubleClicked.connect(self.itemDoubleClickedHandler)
         self.mainwin = win
         self.session = session
         self.createActions()
         self.header().close()
-        self.root_path_node = ({}, self)
-
-        self.setupCaches()
 
-    def setupCaches(self):
-        self._reverse_cache = {}
+        self.classes_model = ClassesTreeModel(self)
+        self.setModel(self.classes_model)
 
     def fill(self):
-        '''Parse all the paths (['Lcom/example/myclass/MyActivity$1;', ...])
-           and build a tree using the QTreeWidgetItem insertion method.'''
+        '''Index all the paths (['Lcom/example/myclass/MyActivity$1;', ...]).
+           The items of the tree are built when their parent is expanded.'''
         androconf.debug("Fill classes tree")
 
-        for idx, filename, digest, classes in self.session.get_classes():
-            for c in sorted(classes, key=lambda c: c.name):
-                sig = Signature(c)
-                path_node = self.root_path_node
-
-                path = None
-                if sig.class_path == []:
-                    path = '.'
-                    if path not in path_node[0]:
-                        path_node[0][path] = (
-                            {}, HashableQTreeWidgetItem(path_node[1]))
-                        path_node[0][path][1].setText(0, path)
-                    path_node = path_node[0][path]
-                else:
-                    # Namespaces
-                    for path in sig.class_path:
-                        if path not in path_node[0]:
-                            path_node[0][path] = (
-                                {}, HashableQTreeWidgetItem(path_node[1]))
-                            path_node[0][path][1].setText(0, path)
-                        path_node = path_node[0][path]
-
-                # Class
-                path_node[0][path] = ({}, HashableQTreeWidgetItem(path_node[1]))
-
-                class_name = sig.class_name
-
-                if idx > 0:
-                    class_name += "@%d" % idx
-
-                c.current_title = class_name
-                self._reverse_cache[path_node[0][path][1]] = (c, filename,
-                                                              digest)
-
-                path_node[0][path][1].setText(0, class_name)
+        self.classes_model.fill(self.session)
 
-    def itemDoubleClickedHandler(self, item, column):
-        androconf.debug("item %s has been double clicked at column %s" %
-                        (str(item), str(column)))
-        if item.childCount() != 0:
+    def itemDoubleClickedHandler(self, index):
+        androconf.debug("item %s has been double clicked" % str(index.data()))
+        node = self.classes_model.get_node(index)
+        if node.current_class is None:
             self.mainwin.showStatus("Sources not available.")
             return
 
-        current_class, current_filename, current_digest = self._reverse_cache[
-            item
-        ]
-        self.mainwin.openBinWindow(current_class)
+        self.mainwin.openBinWindow(node.current_class)
 
     def createActions(self):
         self.xrefAct = QtWidgets.QAction(
@@ -101,12 +174,12 @@ class TreeWindow(QtWidgets.QTreeWidget):
                                          triggered=self.actionCollapse)
 
     def actionXref(self):
-        item = self.currentItem()
-        if item.childCount() != 0:
+        node = self.classes_model.get_node(self.currentIndex())
+        if node.current_class is None:
             self.mainwin.showStatus("Xref not availables")
             return
 
-        current_class, _, _ = self._reverse_cache[item]
+        current_class = node.current_class
 
         current_analysis = self.session.get_analysis(current_class)
         if not current_analysis:
@@ -127,21 +200,25 @@ class TreeWindow(QtWidgets.QTreeWidget):
         xwin.show()
 
 
-    def expand_children(self, item):
-        self.expandItem(item)
-        for i in range(item.childCount()):
-            self.expand_children(item.child(i))
+    def expand_children(self, index):
+        self.expand(index)
+        model = self.classes_model
+        if model.canFetchMore(index):
+            model.fetchMore(index)
+        for i in range(model.rowCount(index)):
+            self.expand_children(model.index(i, 0, index))
 
     def actionExpand(self):
-        self.expand_children(self.currentItem())
+        self.expand_children(self.currentIndex())
 
-    def collapse_children(self, item):
-        for i in range(item.childCount()):
-            self.collapse_children(item.child(i))
-        self.collapseItem(item)
+    def collapse_children(self, index):
+        model = self.classes_model
+        for i in range(model.rowCount(index)):
+            self.collapse_children(model.index(i, 0, index))
+        self.collapse(index)
 
     def actionCollapse(self):
-        self.collapse_children(self.currentItem())
+        self.collapse_children(self.currentIndex())
 
     def contextMenuEvent(self, event):
         menu = QtWidgets.QMenu(self)
@@ -1,5 +1,7 @@
-from future import standard_library
-standard_library.install_aliases()
+import sys
+if sys.version_info[0] < 3:
+    from future import standard_library
+    standard_library.install_aliases()
 from androguard.core import *
 from androguard.core.bytecode import *
 from androguard.core.bytecodes.dvm import *
@@ -9,6 +11,7 @@ from androguard.decompiler.decompiler import *
 
 from pickle import dump, load
 from androguard.core import androconf
+from androguard.core import profiling
 
 
 def init_print_colors():
@@ -49,7 +52,7 @@ def load_session(filename):
         return load(fd)
 
 
-def AnalyzeAPK(filename, decompiler="dad", session=None):
+def AnalyzeAPK(filename, decompiler="dad", session=None, profiler=None):
     """
         Analyze an android application and setup all stuff for a more quickly analysis !
 
@@ -57,6 +60,8 @@ def AnalyzeAPK(filename, decompiler="dad", session=None):
         :type filename: string
         :param decompiler: ded, dex2jad, dad (optional)
         :type decompiler: string
+        :param profiler: records the phases of the analysis, see :func:`profiling.Profiler.get_report` (optional)
+        :type profiler: :class:`profiling.Profiler`
 
         :rtype: return the :class:`APK`, :class:`DalvikVMFormat`, and :class:`VMAnalysis` objects
     """
@@ -65,19 +70,23 @@ def AnalyzeAPK(filename, decompiler="dad", session=None):
     if not session:
         session = CONF["SESSION"]
 
-    with open(filename, "rb") as fd:
-        data = fd.read()
+    with profiling.activate(profiler):
+        with profiling.phase("read"):
+            with open(filename, "rb") as fd:
+                data = fd.read()
 
-    session.add(filename, data)
-    return session.get_objects_apk(filename)
+        session.add(filename, data)
+        return session.get_objects_apk(filename)
 
 
-def AnalyzeDex(filename, decompiler="dad", session=None):
+def AnalyzeDex(filename, decompiler="dad", session=None, profiler=None):
     """
         Analyze an android dex file and setup all stuff for a more quickly analysis !
 
         :param filename: the filename of the android dex file or a buffer which represents the dex file
         :type filename: string
+        :param profiler: records the phases of the analysis, see :func:`profiling.Profiler.get_report` (optional)
+        :type profiler: :class:`profiling.Profiler`
 
         :rtype: return the :class:`DalvikVMFormat`, and :class:`VMAnalysis` objects
     """
@@ -86,18 +95,22 @@ def AnalyzeDex(filename, decompiler="dad", session=None):
     if not session:
         session = CONF["SESSION"]
 
-    with open(filename, "rb") as fd:
-        data = fd.read()
+    with profiling.activate(profiler):
+        with profiling.phase("read"):
+            with open(filename, "rb") as fd:
+                data = fd.read()
 
-    return session.addDEX(filename, data)
+        return session.addDEX(filename, data)
 
 
-def AnalyzeODex(filename, decompiler="dad", session=None):
+def AnalyzeODex(filename, decompiler="dad", session=None, profiler=None):
     """
         Analyze an android odex file and setup all stuff for a more quickly analysis !
 
         :param filename: the filename of the android dex file or a buffer which represents the dex file
         :type filename: string
+        :param profiler: records the phases of the analysis, see :func:`profiling.Profiler.get_report` (optional)
+        :type profiler: :class:`profiling.Profiler`
 
         :rtype: return the :class:`DalvikOdexVMFormat`, and :class:`VMAnalysis` objects
     """
@@ -106,10 +119,12 @@ def AnalyzeODex(filename, decompiler="dad", session=None):
     if not session:
         session = CONF["SESSION"]
 
-    with open(filename, "rb") as fd:
-        data = fd.read()
+    with profiling.activate(profiler):
+        with profiling.phase("read"):
+            with open(filename, "rb") as fd:
+                data = fd.read()
 
-    return session.addDEY(filename, data)
+        return session.addDEY(filename, data)
 
 
 def RunDecompiler(d, dx, decompiler, session=None):
@@ -4,6 +4,7 @@ import hashlib
 import collections
 
 from androguard.core import androconf
+from androguard.core import profiling
 from androguard.core.bytecodes.apk import *
 from androguard.core.bytecodes.dvm import *
 from androguard.core.analysis.analysis import *
@@ -19,15 +20,41 @@ def Load(filename):
     return load_session(filename)
 
 class Session(object):
-    def __init__(self, export_ipython=False):
+    def __init__(self, export_ipython=False, profiler=None):
+        """
+            :param profiler: a :class:`profiling.Profiler` recording the phases
+                             of the files added to the session (optional)
+        """
         self.setupObjects()
         self.export_ipython = export_ipython
+        self.profiler = profiler
 
     def setupObjects(self):
         self.analyzed_files = collections.OrderedDict()
         self.analyzed_digest = {}
         self.analyzed_apk = {}
         self.analyzed_dex = {}
+        self._clear_index()
+
+    def _clear_index(self):
+        # class name -> digest of the first DEX file which defines it
+        self.analyzed_classes = {}
+        self._nb_strings = None
+
+    def _index_classes(self, digest, d):
+        self._nb_strings = None
+        for current_class in d.get_classes():
+            self.analyzed_classes.setdefault(current_class.get_name(), digest)
+
+    def __setstate__(self, state):
+        self.__dict__ = state
+        # Sessions saved before the profiler existed
+        self.__dict__.setdefault("profiler", None)
+        # Sessions saved before the class index existed
+        if "analyzed_classes" not in state:
+            self._clear_index()
+            for digest in self.analyzed_dex:
+                self._index_classes(digest, self.analyzed_dex[digest][0])
 
     def reset(self):
         self.setupObjects()
@@ -35,10 +62,11 @@ class Session(object):
     def isOpen(self):
         return self.analyzed_digest != {}
 
-    def addAPK(self, filename, data):
+    def addAPK(self, filename, data, zip_directory=None):
         digest = hashlib.sha256(data).hexdigest()
         androconf.debug("add APK:%s" % digest)
-        apk = APK(data, True)
+        with profiling.phase("apk"):
+            apk = APK(data, True, zip_directory=zip_directory)
         self.analyzed_apk[digest] = [apk]
         self.analyzed_files[filename].append(digest)
         self.analyzed_digest[digest] = filename
@@ -46,40 +74,68 @@ class Session(object):
         return (digest, apk)
 
     def addDEX(self, filename, data, dx=None):
-        digest = hashlib.sha256(data).hexdigest()
-        androconf.debug("add DEX:%s" % digest)
-
-        androconf.debug("Parsing format ...")
-        d = DalvikVMFormat(data)
+        digest, d = self._parseDEX(data)
 
         androconf.debug("Running analysis ...")
-        dx = self.runAnalysis(d, dx)
+        with profiling.phase("analysis"):
+            dx = self.runAnalysis(d, dx)
 
-        androconf.debug("added DEX:%s" % digest)
+        self._registerDEX(filename, digest, d, dx)
+        return (digest, d, dx)
 
-        self.analyzed_dex[digest] = (d, dx)
-        if filename not in self.analyzed_files:
-            self.analyzed_files[filename] = []
+    def addMultiDEX(self, filename, dex_files, dx=None):
+        """
+            Add the DEX files of a multidex application. They share a single
+            :class:`Analysis`, whose xrefs are created once all of them have
+            been parsed.
 
-        self.analyzed_files[filename].append(digest)
-        self.analyzed_digest[digest] = filename
+            The DEX files are parsed one after another: parsing them in a
+            process pool would not be faster, since unpickling the
+            :class:`DalvikVMFormat` objects in this process costs as much
+            as parsing them.
 
-        if self.export_ipython:
-            androconf.debug("Exporting in ipython")
-            d.create_python_export()
+            :param dex_files: the raw DEX files
+            :param dx: an analysis to extend, instead of a new one
 
-        return (digest, d, dx)
+            :rtype: a list of (digest, :class:`DalvikVMFormat`), and the
+                    :class:`Analysis`
+        """
+        dex = [self._parseDEX(data) for data in dex_files]
+
+        androconf.debug("Running analysis ...")
+        with profiling.phase("analysis"):
+            dx = self._runAnalysis([d for _, d in dex], dx)
+
+        for digest, d in dex:
+            self._registerDEX(filename, digest, d, dx)
+        return dex, dx
 
     def addDEY(self, filename, data, dx=None):
         digest = hashlib.sha256(data).hexdigest()
         androconf.debug("add DEY:%s" % digest)
 
-        d = DalvikOdexVMFormat(data)
-        dx = self.runAnalysis(d, dx)
+        with profiling.phase("dey"):
+            d = DalvikOdexVMFormat(data)
+        with profiling.phase("analysis"):
+            dx = self.runAnalysis(d, dx)
 
-        androconf.debug("added DEY:%s" % digest)
+        self._registerDEX(filename, digest, d, dx)
+        return (digest, d, dx)
+
+    def _parseDEX(self, data):
+        digest = hashlib.sha256(data).hexdigest()
+        androconf.debug("add DEX:%s" % digest)
+
+        androconf.debug("Parsing format ...")
+        with profiling.phase("dex"):
+            d = DalvikVMFormat(data)
+        return digest, d
+
+    def _registerDEX(self, filename, digest, d, dx):
+        androconf.debug("added DEX:%s" % digest)
 
         self.analyzed_dex[digest] = (d, dx)
+        self._index_classes(digest, d)
         if filename not in self.analyzed_files:
             self.analyzed_files[filename] = []
 
@@ -87,38 +143,54 @@ class Session(object):
         self.analyzed_digest[digest] = filename
 
         if self.export_ipython:
+            androconf.debug("Exporting in ipython")
             d.create_python_export()
 
-        return (digest, d, dx)
-
     def runAnalysis(self, d, dx=None):
-        if dx == None:
-            dx = Analysis(d)
-        else:
-            dx.add(d)
+        return self._runAnalysis([d], dx)
+
+    def _runAnalysis(self, vms, dx=None):
+        for d in vms:
+            if dx == None:
+                dx = Analysis(d)
+            else:
+                dx.add(d)
 
         dx.create_xref()
 
-        d.set_decompiler(DecompilerDAD(d, dx))
-        d.set_vmanalysis(dx)
+        for d in vms:
+            d.set_decompiler(DecompilerDAD(d, dx))
+            d.set_vmanalysis(dx)
 
         return dx
 
     def add(self, filename, raw_data, dx=None):
-        ret = androconf.is_android_raw(raw_data)
+        with profiling.activate(self.profiler):
+            return self._add(filename, raw_data, dx)
+
+    def get_profile_report(self):
+        """
+            Return the :class:`profiling.ProfileReport` of the files added to
+            the session, or None if the session has no profiler
+        """
+        if self.profiler is None:
+            return None
+        return self.profiler.get_report()
+
+    def _add(self, filename, raw_data, dx=None):
+        # The central directory read to find the type is given to the APK
+        ret, zip_directory = androconf.sniff_android_directory_raw(raw_data)
         if ret:
             self.analyzed_files[filename] = []
             digest = hashlib.sha256(raw_data).hexdigest()
             if ret == "APK":
-                apk_digest, apk = self.addAPK(filename, raw_data)
-                dex_files = list(apk.get_all_dex())
+                apk_digest, apk = self.addAPK(filename, raw_data,
+                                              zip_directory)
+                dex_files = apk.read_files(apk.get_dex_names())
 
                 if dex_files:
-                    dex_digest, _, dx = self.addDEX(filename, dex_files[0], dx)
-                    self.analyzed_apk[digest].append(dex_digest)
-                    for i in range(1, len(dex_files)):
-                        dex_digest, _, _ = self.addDEX(filename, dex_files[i],
-                                                       dx)
+                    dex, dx = self.addMultiDEX(filename, dex_files, dx)
+                    for dex_digest, _ in dex:
                         self.analyzed_apk[digest].append(dex_digest)
             elif ret == "DEX":
                 self.addDEX(filename, raw_data, dx)
@@ -138,33 +210,45 @@ class Session(object):
                     yield idx, filename, digest, d.get_classes()
             idx += 1
 
-    def get_analysis(self, current_class):
+    def get_nb_classes(self):
+        """
+            Return the number of classes defined by the DEX files of the session
+        """
+        return len(self.analyzed_classes)
+
+    def _get_class_digest(self, current_class):
+        name = current_class.get_name()
+        if name in self.analyzed_classes:
+            return self.analyzed_classes[name]
+
+        # Not defined by any DEX file, but an analysis may know it as an
+        # external class
         for digest in self.analyzed_dex:
             d, dx = self.analyzed_dex[digest]
-            if dx.is_class_present(current_class.get_name()):
-                return dx
+            if dx.is_class_present(name):
+                return digest
         return None
 
+    def get_analysis(self, current_class):
+        digest = self._get_class_digest(current_class)
+        if digest is None:
+            return None
+        return self.analyzed_dex[digest][1]
+
     def get_format(self, current_class):
-        for digest in self.analyzed_dex:
-            d, dx = self.analyzed_dex[digest]
-            if dx.is_class_present(current_class.get_name()):
-                return d
-        return None
+        digest = self._get_class_digest(current_class)
+        if digest is None:
+            return None
+        return self.analyzed_dex[digest][0]
 
     def get_filename_by_class(self, current_class):
-        for digest in self.analyzed_dex:
-            d, dx = self.analyzed_dex[digest]
-            if dx.is_class_present(current_class.get_name()):
-                return self.analyzed_digest[digest]
-        return None
+        digest = self._get_class_digest(current_class)
+        if digest is None:
+            return None
+        return self.analyzed_digest[digest]
 
     def get_digest_by_class(self, current_class):
-        for digest in self.analyzed_dex:
-            d, dx = self.analyzed_dex[digest]
-            if dx.is_class_present(current_class.get_name()):
-                return digest
-        return None
+        return self._get_class_digest(current_class)
 
     def get_strings(self):
         for digest in self.analyzed_dex:
@@ -173,11 +257,25 @@ class Session(object):
             )
 
     def get_nb_strings(self):
-        nb = 0
+        if self._nb_strings is None:
+            self._nb_strings = 0
+            for digest in self.analyzed_dex:
+                d, dx = self.analyzed_dex[digest]
+                self._nb_strings += len(dx.get_strings_analysis())
+        return self._nb_strings
+
+    def search_strings(self, patterns=(), literals=(), flags=0):
+        """
+            Search many patterns at once in the strings of all the DEX files of
+            the session, see :class:`dvm.StringSearch`
+
+            :rtype: an iterator of (digest, filename, :class:`StringMatch`)
+        """
+        search = StringSearch(patterns, literals, flags)
         for digest in self.analyzed_dex:
             d, dx = self.analyzed_dex[digest]
-            nb += len(dx.get_strings_analysis())
-        return nb
+            for match in dx.get_string_matches(d, search.search(d)):
+                yield digest, self.analyzed_digest[digest], match
 
     def get_all_apks(self):
         for digest in self.analyzed_apk:
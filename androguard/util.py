@@ -1,3 +1,14 @@
 def read(filename, binary=True):
     with open(filename, 'rb' if binary else 'r') as f:
         return f.read()
+
+
+def escape(data):
+    """
+    Escape '&', '<' and '>' in a string, like xml.sax.saxutils.escape, which
+    is slow to import (it imports urllib.request).
+    """
+    data = data.replace("&", "&amp;")
+    data = data.replace(">", "&gt;")
+    data = data.replace("<", "&lt;")
+    return data
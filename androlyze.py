@@ -36,9 +36,6 @@ from androguard.session import Session
 from androguard.util import *
 from androguard.misc import *
 
-from IPython.terminal.embed import InteractiveShellEmbed
-from traitlets.config import Config
-
 option_0 = {
     'name': ('-s', '--shell'),
     'help': 'open an interactive shell to play more easily with objects',
@@ -59,6 +56,9 @@ options = [option_0, option_1, option_2]
 
 
 def interact():
+    from IPython.terminal.embed import InteractiveShellEmbed
+    from traitlets.config import Config
+
     CONF["SESSION"] = Session(True)
     cfg = Config()
     ipshell = InteractiveShellEmbed(
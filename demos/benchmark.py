@@ -1,74 +1,72 @@
 #!/usr/bin/env python
+"""
+Analyze (and optionally decompile) every APK/DEX file of a directory, and
+print the time and memory spent in each phase of the analysis.
+"""
 
 from __future__ import division
 from __future__ import print_function
-from past.utils import old_div
 import sys, os
-import cProfile
-
-# http://code.activestate.com/recipes/286222-memory-usage/
-_proc_status = '/proc/%d/status' % os.getpid()
-
-_scale = {
-    'kB': 1024.0,
-    'mB': 1024.0 * 1024.0,
-    'KB': 1024.0,
-    'MB': 1024.0 * 1024.0
-}
-
-
-def _VmB(VmKey):
-    global _proc_status, _scale
-    # get pseudo file  /proc/<pid>/status
-    try:
-        with open(_proc_status) as t:
-            v = t.read()
-    except:
-        return 0.0  # non-Linux?
-    # get VmKey line e.g. 'VmRSS:  9999  kB\n ...'
-    i = v.index(VmKey)
-    v = v[i:].split(None, 3)  # whitespace
-    if len(v) < 3:
-        return 0.0  # invalid format?
-    # convert Vm value to bytes
-    return float(v[1]) * _scale[v[2]]
-
-
-def memory(since=0.0):
-    '''Return memory usage in bytes.
-    '''
-    return _VmB('VmSize:') - since
-
-
-def resident(since=0.0):
-    '''Return resident memory usage in bytes.
-    '''
-    return _VmB('VmRSS:') - since
-
-
-def stacksize(since=0.0):
-    '''Return stack size in bytes.
-    '''
-    return _VmB('VmStk:') - since
-
+import argparse
 
 PATH_INSTALL = "./"
-sys.path.append(PATH_INSTALL + "./")
-
-import androguard, analysis
-
-# a directory with apks files"
-
-TEST = "./apks/"
-
-l = []
-for i in os.walk(TEST):
-    for j in i[2]:
-        l.append(i[0] + j)
-
-print(len(l), l)
-
-_a = androguard.Androguard(l)
-
-print("MEMORY : ", old_div(memory(), _scale["MB"]), "RESIDENT ", old_div(resident(
-), _scale["MB"]), "STACKSIZE ", old_div(stacksize(), _scale["MB"]))
+sys.path.append(PATH_INSTALL)
+
+from androguard.bench.meminfo import memory, resident, stacksize
+from androguard.core import androconf
+from androguard.core.profiling import Profiler
+from androguard.session import Session
+
+MB = 1024.0 * 1024.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("directory", nargs="?", default="./apks/",
+                        help="a directory with APK or DEX files")
+    parser.add_argument("--decompile", action="store_true",
+                        help="also decompile all the classes")
+    parser.add_argument("--memory", action="store_true",
+                        help="record the allocations with tracemalloc")
+    parser.add_argument("--objects", action="store_true",
+                        help="record the number of objects created")
+    parser.add_argument("--cprofile", action="store_true",
+                        help="also run cProfile")
+    parser.add_argument("--json", help="save the report in this file")
+    parser.add_argument("--stats",
+                        help="save the cProfile statistics in this file")
+    args = parser.parse_args()
+
+    profiler = Profiler(memory=args.memory, count_objects=args.objects,
+                        cprofile=args.cprofile)
+
+    for root, dirs, files in os.walk(args.directory):
+        for name in sorted(files):
+            filename = os.path.join(root, name)
+            if not androconf.is_android(filename):
+                continue
+            print(filename)
+
+            s = Session(profiler=profiler)
+            with open(filename, "rb") as fd:
+                s.add(filename, fd.read())
+
+            if args.decompile:
+                with profiler:
+                    for _, d, _ in s.get_objects_dex():
+                        for current_class in d.get_classes():
+                            current_class.get_source()
+
+    report = profiler.get_report()
+    report.show()
+    if args.json:
+        report.save(args.json)
+    if args.stats:
+        profiler.dump_stats(args.stats)
+
+    print("MEMORY : ", memory() / MB, "RESIDENT ", resident() / MB,
+          "STACKSIZE ", stacksize() / MB)
+
+
+if __name__ == "__main__":
+    main()
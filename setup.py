@@ -23,6 +23,12 @@ setup(
     description='Androguard is a full python tool to play with Android files.',
     version='2.0',
     packages=find_packages(),
+    package_data={
+        'androguard.core.api_specific_resources': [
+            'aosp_permissions/*.json.gz',
+            'api_permission_mappings/*.json.gz',
+        ],
+    },
     data_files = [(data_prefix,
                    ['androguard/gui/annotation.ui',
                     'androguard/gui/search.ui',
@@ -4,6 +4,7 @@ import sys
 PATH_INSTALL = "./"
 sys.path.append(PATH_INSTALL)
 
+from androguard.bench import generator
 from androguard.core.bytecodes import dvm
 from androguard.core.analysis import analysis
 
@@ -17,6 +18,97 @@ class AnalysisTest(unittest.TestCase):
             dx = analysis.Analysis(d)
             self.assertTrue(dx)
 
+    def testPermissions(self):
+        with open("examples/android/TestsAndroguard/bin/classes.dex",
+                  "rb") as fd:
+            d = dvm.DalvikVMFormat(fd.read())
+            dx = analysis.Analysis(d)
+            dx.create_xref()
+
+            api = "Landroid/net/ConnectivityManager;->getActiveNetworkInfo()" \
+                  "Landroid/net/NetworkInfo;"
+            apis = dict((str(method_analysis.method), permissions)
+                        for method_analysis, permissions in
+                        dx.get_permission_apis("16").items())
+            self.assertEqual(apis[api],
+                             ["android.permission.ACCESS_NETWORK_STATE"])
+
+            permissions = dx.get_permissions("16")
+            self.assertEqual(list(permissions),
+                             ["android.permission.ACCESS_NETWORK_STATE"])
+            self.assertIs(permissions, dx.get_permissions("16"))
+
+            paths = permissions["android.permission.ACCESS_NETWORK_STATE"]
+            method = dx.get_method_by_name(
+                "Landroid/support/v4/net/ConnectivityManagerCompatGingerbread;",
+                "isActiveNetworkMetered", "(Landroid/net/ConnectivityManager;)Z")
+            self.assertEqual([str(m) for m in paths[method][1:]], [api])
+            self.assertEqual(dx.get_method_permissions(method, "16"),
+                             ["android.permission.ACCESS_NETWORK_STATE"])
+
+            # the callers of a method reach at least its permissions, through
+            # the path of the next method
+            for method, path in paths.items():
+                for callee in path[1:]:
+                    self.assertIn(callee, paths)
+                if len(path) > 1:
+                    self.assertEqual(paths[path[1]], path[1:])
+            self.assertEqual(len(paths), len(list(paths)))
+
+    def testClassAnalysisKept(self):
+        # classes.dex calls the methods of classes2.dex
+        app = dvm.DalvikVMFormat(generator.generate_dex(
+            5, 3, 10, package="app", callee_package="lib"))
+        lib = dvm.DalvikVMFormat(generator.generate_dex(5, 3, 10,
+                                                        package="lib"))
+        app_class = app.get_classes()[0]
+        method = app_class.get_methods()[0]
+
+        # The ClassAnalysis obtained before the xrefs are created gets them
+        dx = analysis.Analysis(app)
+        class_analysis = dx.get_class_analysis(app_class.get_name())
+        self.assertIsNone(class_analysis.get_method_analysis(method))
+        dx.create_xref()
+        self.assertIs(dx.get_class_analysis(app_class.get_name()),
+                      class_analysis)
+        method_analysis = class_analysis.get_method_analysis(method)
+        (target_analysis, _, _), = method_analysis.get_xref_to()
+        self.assertFalse(target_analysis.internal)
+
+        # The xrefs are created again once the callees are defined, in the
+        # same analyses, with the xrefs of a new analysis
+        dx.add(lib)
+        dx.create_xref()
+        self.assertIs(dx.get_class_analysis(app_class.get_name()),
+                      class_analysis)
+        self.assertIs(class_analysis.get_method_analysis(method),
+                      method_analysis)
+        (target_analysis, target, _), = method_analysis.get_xref_to()
+        self.assertTrue(target_analysis.internal)
+        self.assertIn(target, lib.get_methods())
+        self.assertIn(target_analysis, class_analysis.get_xref_to())
+
+        new_dx = analysis.Analysis(app)
+        new_dx.add(lib)
+        new_dx.create_xref()
+        for name, new_class_analysis in new_dx.classes.items():
+            class_analysis = dx.get_class_analysis(name)
+            self.assertEqual(
+                len(class_analysis.get_xref_to()),
+                len(new_class_analysis.get_xref_to()))
+            self.assertEqual(
+                len(class_analysis.get_xref_from()),
+                len(new_class_analysis.get_xref_from()))
+            for new_method_analysis in new_class_analysis.get_methods():
+                method_analysis = class_analysis.get_method_analysis(
+                    new_method_analysis.method)
+                self.assertEqual(
+                    len(method_analysis.get_xref_to()),
+                    len(new_method_analysis.get_xref_to()))
+                self.assertEqual(
+                    len(method_analysis.get_xref_from()),
+                    len(new_method_analysis.get_xref_from()))
+
 
 if __name__ == '__main__':
     unittest.main()
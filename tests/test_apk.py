@@ -1,9 +1,16 @@
 import unittest
 
+import binascii
+import io
+import pickle
 import sys
+import warnings
+import zipfile
 PATH_INSTALL = "./"
 sys.path.append(PATH_INSTALL)
 
+from androguard.core import androconf
+from androguard.core import zipstorage
 from androguard.core.bytecodes import apk
 
 
@@ -15,6 +22,233 @@ class APKTest(unittest.TestCase):
             a = apk.APK(fd.read(), True)
             self.assertTrue(a)
 
+    def testAPKPermissions(self):
+        with open("examples/android/TestsAndroguard/bin/TestActivity.apk",
+                  "rb") as fd:
+            a = apk.APK(fd.read(), True)
+            b = apk.APK(fd.name)
+            self.assertIs(a.permission_module, b.permission_module)
+            self.assertIn("android.permission.INTERNET",
+                          a.permission_module["AOSP_PERMISSIONS"])
+
+    def testPermissionResources(self):
+        perms = androconf.load_api_specific_resource_module(
+            "aosp_permissions", "22")
+        self.assertEqual(
+            perms["AOSP_PERMISSIONS"]["android.permission.CAMERA"]
+            ["protectionLevel"], "dangerous")
+        self.assertIn("android.permission-group.LOCATION",
+                      perms["AOSP_PERMISSIONS_GROUPS"])
+        self.assertIs(perms, androconf.load_api_specific_resource_module(
+            "aosp_permissions", 22))
+
+        mappings = androconf.load_api_specific_resource_module(
+            "api_permission_mappings", "19")
+        self.assertEqual(
+            sorted(mappings.keys()),
+            ["AOSP_PERMISSIONS_BY_FIELDS", "AOSP_PERMISSIONS_BY_METHODS"])
+
+        # Unknown API levels fall back to the API 9
+        self.assertIs(
+            androconf.load_api_specific_resource_module("aosp_permissions",
+                                                        "1000"),
+            androconf.load_api_specific_resource_module("aosp_permissions",
+                                                        "9"))
+
+    def testCertificate(self):
+        from cryptography.hazmat.primitives import hashes
+
+        filename = "examples/android/TestsAndroguard/bin/TestActivity.apk"
+        a = apk.APK(filename)
+        b = apk.APK(filename)
+        self.assertEqual(a.get_signature_names(), ["META-INF/CERT.RSA"])
+
+        certificate = a.get_certificate("META-INF/CERT.RSA")
+        self.assertIs(a.get_certificate("META-INF/CERT.RSA"), certificate)
+        # The same certificate is shared by the APKs
+        self.assertIs(b.get_certificate("META-INF/CERT.RSA"), certificate)
+        self.assertEqual(a.get_certificates(), [certificate])
+
+        fingerprints = a.get_certificate_fingerprints("META-INF/CERT.RSA")
+        self.assertEqual(fingerprints["sha1"], binascii.hexlify(
+            certificate.fingerprint(hashes.SHA1())).decode("ascii"))
+        self.assertEqual(fingerprints["sha256"], binascii.hexlify(
+            certificate.fingerprint(hashes.SHA256())).decode("ascii"))
+
+        self.assertEqual(apk.get_signature_files(filename),
+                         [("META-INF/CERT.RSA", a.get_signature())])
+        self.assertEqual(apk.get_signature_certificates(filename),
+                         [("META-INF/CERT.RSA", certificate)])
+
+    def testCertificateCache(self):
+        with open("examples/android/TC/bin/TC-debug.apk", "rb") as fd:
+            a = apk.APK(fd.read(), True)
+        der = a.get_certificate_der(a.get_signature_name())
+
+        cache = apk.CertificateCache(maxsize=1)
+        certificate = cache.get(der)
+        self.assertIs(cache.get(der), certificate)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertIsNot(cache.get(der), certificate)
+
+        # Nothing is kept beyond maxsize
+        cache = apk.CertificateCache(maxsize=0)
+        cache.get(der)
+        cache.get(der)
+        self.assertEqual((len(cache), cache.misses), (0, 2))
+
+    def testFileTypes(self):
+        for filename, file_type in [
+                ("examples/android/TestsAndroguard/bin/TestActivity.apk", "APK"),
+                ("examples/android/Invalid/Invalid.apk", "APK"),
+                ("examples/android/TestsAndroguard/bin/classes.dex", "DEX"),
+                ("examples/axml/AndroidManifest.xml", "AXML"),
+                ("setup.py", None)]:
+            self.assertEqual(androconf.is_android(filename), file_type)
+            with open(filename, "rb") as fd:
+                self.assertEqual(androconf.is_android_raw(fd.read()),
+                                 file_type)
+
+        for filename in ["examples/android/TestsAndroguard/bin/TestActivity.apk",
+                         "examples/android/Invalid/Invalid.apk"]:
+            file_type, entries = androconf.sniff_android(filename)
+            self.assertEqual(entries, zipfile.ZipFile(filename).namelist())
+
+    def testFileTypesZip(self):
+        fd = io.BytesIO()
+        with zipfile.ZipFile(fd, "w") as z:
+            z.writestr("META-INF/MANIFEST.MF", "")
+            z.writestr("classes.dex", "")
+            z.comment = b"PK\x05\x06"
+        raw = fd.getvalue()
+
+        # Data prepended to the archive
+        self.assertEqual(androconf.sniff_android_raw(b"PK" + raw),
+                         ("APK", ["META-INF/MANIFEST.MF", "classes.dex"]))
+
+        # Truncated archive, without central directory
+        self.assertEqual(androconf.sniff_android_raw(raw[:60]), ("APK", None))
+
+        fd = io.BytesIO()
+        with zipfile.ZipFile(fd, "w") as z:
+            z.writestr("classes.dex", "")
+        self.assertEqual(androconf.sniff_android_raw(fd.getvalue()),
+                         (None, ["classes.dex"]))
+
+
+    def testMultiDex(self):
+        fd = io.BytesIO()
+        with zipfile.ZipFile(fd, "w", zipfile.ZIP_DEFLATED) as z:
+            z.writestr("AndroidManifest.xml", b"")
+            for name in ["classes3.dex", "classes.dex", "classes2.dex",
+                         "classes5.dex"]:
+                z.writestr(name, name.encode("ascii") * 1000)
+        a = apk.APK(fd.getvalue(), True, skip_analysis=True)
+
+        # classes5.dex is not loaded, as classes4.dex is missing
+        names = ["classes.dex", "classes2.dex", "classes3.dex"]
+        self.assertEqual(a.get_dex_names(), names)
+        dex_files = [name.encode("ascii") * 1000 for name in names]
+        self.assertEqual(list(a.get_all_dex()), dex_files)
+        self.assertEqual(a.read_files(names, max_workers=3), dex_files)
+        self.assertEqual(a.read_files(names, max_workers=1), dex_files)
+        self.assertEqual(a.read_files([]), [])
+
+    def testZipStorage(self):
+        fd = io.BytesIO()
+        with zipfile.ZipFile(fd, "w", zipfile.ZIP_DEFLATED) as z:
+            z.writestr("deflated", b"d" * 1000)
+            z.writestr(zipfile.ZipInfo("stored"), b"s" * 1000)
+            z.writestr("dup", b"1")
+            if sys.version_info >= (3, 6):
+                with z.open("zip64", "w", force_zip64=True) as f:
+                    f.write(b"z" * 1000)
+            else:
+                # zipfile can't force a zip64 entry
+                z.writestr("zip64", b"z" * 1000)
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                z.writestr("dup", b"2")
+        # Data prepended to the archive
+        raw = b"JUNK" + fd.getvalue()
+        reference = zipfile.ZipFile(io.BytesIO(raw))
+
+        storage = zipstorage.ZipStorage(raw, cache_size=1500)
+        self.assertEqual(storage.namelist(), reference.namelist())
+        for name in reference.namelist():
+            self.assertEqual(storage.read(name), reference.read(name))
+            self.assertEqual(storage.getinfo(name).CRC,
+                             reference.getinfo(name).CRC)
+        self.assertRaises(KeyError, storage.read, "missing")
+
+        # The STORED entries are not copied, the DEFLATED ones are inflated
+        # once, within the size of the cache
+        storage = zipstorage.ZipStorage(raw, cache_size=1500)
+        view = storage.get_view("stored")
+        self.assertEqual(view.tobytes(), b"s" * 1000)
+        if sys.version_info >= (3,):
+            self.assertIs(view.obj, raw)
+        self.assertIs(storage.read("zip64"), storage.read("zip64"))
+        storage.read("deflated")
+        self.assertEqual(list(storage._cache), ["deflated"])
+        storage.read("dup")
+        self.assertEqual(list(storage._cache), ["deflated", "dup"])
+        storage.read("dup")
+        storage.read("zip64")
+        self.assertEqual(list(storage._cache), ["dup", "zip64"])
+
+        corrupted = bytearray(raw)
+        offset = storage._get_data_offset(storage.getinfo("stored"))
+        corrupted[offset] ^= 0xff
+        self.assertRaises(zipfile.BadZipfile,
+                          zipstorage.ZipStorage(corrupted).read, "stored")
+        self.assertRaises(zipfile.BadZipfile,
+                          zipstorage.ZipStorage(corrupted).get_crc32, "stored")
+        storage = zipstorage.ZipStorage(raw, cache_size=1024)
+        self.assertEqual(storage.get_crc32("deflated"),
+                         storage.getinfo("deflated").CRC)
+        storage.read("dup", cache=False)
+        self.assertEqual(list(storage._cache), [])
+        self.assertRaises(zipfile.BadZipfile, zipstorage.ZipStorage,
+                          raw[:-10])
+
+    def testMappedAPK(self):
+        filename = "examples/android/TestsAndroguard/bin/TestActivity.apk"
+        a = apk.APK(filename)
+        with open(filename, "rb") as fd:
+            raw = fd.read()
+        self.assertEqual(a.get_raw()[:], raw)
+        self.assertEqual(a.get_files(), zipfile.ZipFile(filename).namelist())
+        # Nothing is inflated and kept to construct the APK, or to compute
+        # the CRCs
+        self.assertEqual(list(a.zip._cache), [])
+        crcs = a.get_files_crc32()
+        self.assertEqual(list(a.zip._cache), [])
+        with zipfile.ZipFile(filename) as z:
+            self.assertEqual(crcs, dict((info.filename, info.CRC)
+                                        for info in z.infolist()))
+
+        b = pickle.loads(pickle.dumps(a))
+        self.assertEqual(b.get_raw(), raw)
+        self.assertEqual(b.get_dex(), a.get_dex())
+        self.assertEqual(b.get_package(), "tests.androguard")
+
+    def testSniffedDirectory(self):
+        filename = "examples/android/TestsAndroguard/bin/TestActivity.apk"
+        with open(filename, "rb") as fd:
+            raw = fd.read()
+        file_type, directory = androconf.sniff_android_directory_raw(raw)
+        self.assertEqual(file_type, "APK")
+        self.assertEqual([entry.filename for entry in directory],
+                         zipfile.ZipFile(filename).namelist())
+
+        # The APK takes the entries read to find the type
+        a = apk.APK(raw, True, zip_directory=directory)
+        for entry in directory:
+            self.assertIs(a.zip.getinfo(entry.filename), entry)
+        self.assertEqual(a.get_package(), "tests.androguard")
 
 if __name__ == '__main__':
     unittest.main()
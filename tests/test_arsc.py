@@ -4,8 +4,13 @@ import sys
 PATH_INSTALL = "./"
 sys.path.append(PATH_INSTALL)
 
+from androguard.core import bytecode
 from androguard.core.bytecodes import apk
 import collections
+import io
+import json
+import struct
+from xml.dom import minidom
 
 
 TEST_APP_NAME = "TestsAndroguardApplication"
@@ -67,6 +72,187 @@ class ARSCTest(unittest.TestCase):
         self.assertEqual(len(unexpected_types), 0,
                          "received unexpected resource types: %s" % unexpected_types)
 
+    def testLazyEntries(self):
+        arsc = apk.ARSCParser(self.apk.get_file("resources.arsc"))
+        self.assertEqual(
+            arsc.get_resolved_res_configs(
+                0x7f040001, apk.ARSCResTableConfig.default_config()),
+            [(apk.ARSCResTableConfig.default_config(), TEST_APP_NAME)])
+        self.assertEqual(len(arsc.get_res_configs(0x7f020000)), 3)
+        self.assertEqual(arsc.get_id("tests.androguard", 0x7f030000),
+                         ("layout", "main", 0x7f030000))
+        self.assertIsNone(arsc.get_id("tests.androguard", 0x7f030001))
+        self.assertEqual(arsc.get_res_configs(0x7f090000), [])
+        self.assertFalse(arsc.analyzed)
+
+        # The same entries are decoded when all of them are needed
+        entries = arsc.get_res_configs(0x7f040001)[0][1]
+        self.assertEqual(arsc.get_string("tests.androguard", "app_name"),
+                         ["app_name", TEST_APP_NAME])
+        self.assertIs(arsc.get_res_configs(0x7f040001)[0][1], entries)
+        self.assertIn(entries, arsc.get_items("tests.androguard"))
+
+    def testResourceIndexes(self):
+        arsc = apk.ARSCParser(self.apk.get_file("resources.arsc"))
+        self.assertEqual(arsc.get_res_id_by_key("tests.androguard", "string",
+                                                "app_name"), 0x7f040001)
+        self.assertEqual(arsc.get_res_id_by_key("tests.androguard", "drawable",
+                                                "icon"), 0x7f020000)
+        self.assertIsNone(arsc.get_res_id_by_key("tests.androguard", "string",
+                                                 "icon"))
+        self.assertEqual(arsc.get_string("tests.androguard", "hello"),
+                         ["hello", "Hello World, TestActivity! kikoololmodif"])
+        self.assertIsNone(arsc.get_string("tests.androguard", "hello", "fr"))
+        self.assertIsNone(arsc.get_string("other.package", "hello"))
+        self.assertIsNone(arsc.get_res_value("tests.androguard", "layout",
+                                             "main"))
+        self.assertFalse(arsc.analyzed)
+
+        self.assertEqual(arsc.get_string("tests.androguard", "app_name"),
+                         ["app_name", TEST_APP_NAME])
+        arsc.get_public_resources("tests.androguard")
+        self.assertTrue(arsc.analyzed)
+        self.assertEqual(arsc.resource_keys["tests.androguard"]["layout"],
+                         {"main": 0x7f030000})
+
+    def testWriteResources(self):
+        arsc = apk.ARSCParser(self.apk.get_file("resources.arsc"))
+        fd = io.StringIO()
+        arsc.write_resources(fd)
+        resources = minidom.parseString(fd.getvalue().encode("utf-8"))
+        strings = dict((s.getAttribute("name"), s.firstChild.data)
+                       for s in resources.getElementsByTagName("string"))
+        self.assertEqual(strings["app_name"], TEST_APP_NAME)
+        self.assertEqual(len(resources.getElementsByTagName("resources")), 5)
+
+        fd = io.StringIO()
+        arsc.write_resources(fd, type_name="public")
+        self.assertEqual(fd.getvalue().count("<public "), 4)
+        self.assertIn('<public type="layout" name="main" id="0x7f030000" />',
+                      fd.getvalue())
+
+        fd = io.StringIO()
+        arsc.write_resources(fd, "tests.androguard", "\x00\x00", "drawable",
+                             output_format="jsonl")
+        records = [json.loads(line) for line in fd.getvalue().splitlines()]
+        self.assertEqual([record["value"] for record in records],
+                         [TEST_ICONS[120], TEST_ICONS[160], TEST_ICONS[240]])
+        self.assertEqual(records[0]["id"], 0x7f020000)
+        self.assertEqual(records[0]["config"][5], 4)
+
+        # The entries are not kept
+        self.assertFalse(arsc.analyzed)
+        self.assertEqual(arsc.resource_values, {})
+        self.assertEqual(arsc._get_res_types(0x7f020000)[0]._entries, {})
+
+    def testStringBlock(self):
+        arsc = apk.ARSCParser(self.apk.get_file("resources.arsc"))
+        for sb in [arsc.stringpool_main] + arsc.get_items("tests.androguard")[1:3]:
+            strings = [sb.getString(i) for i in range(sb.stringCount)]
+            self.assertEqual(sb.getStrings(), strings)
+            self.assertEqual(sb.getString(sb.stringCount), "")
+
+    def testLongStrings(self):
+        # The lengths are on two bytes, or two uint16 in UTF-16
+        for utf8, strings in [(True, [u"short", u"\u00e9" * 0x1000]),
+                              (False, [u"short", u"\u00e9" * 0x9000])]:
+            sb = string_pool(strings, utf8)
+            self.assertEqual([sb.getString(0), sb.getString(1)], strings)
+            self.assertEqual(string_pool(strings, utf8).getStrings(), strings)
+
+
+def string_pool(strings, utf8):
+    """
+        Return the :class:`apk.StringBlock` of strings
+    """
+    def length(value, size):
+        if value < 0x80 << (size - 1) * 8:
+            return struct.pack("<" + "BH"[size - 1], value)
+        return struct.pack("<2" + "BH"[size - 1],
+                           (value >> size * 8) | 0x80 << (size - 1) * 8,
+                           value & (0xff << (size - 1) * 8 | 0xff))
+
+    data = b""
+    offsets = []
+    for string in strings:
+        offsets.append(len(data))
+        if utf8:
+            encoded = string.encode("utf-8")
+            data += length(len(string), 1) + length(len(encoded), 1) + \
+                encoded + b"\x00"
+        else:
+            data += length(len(string), 2) + string.encode("utf-16-le") + \
+                b"\x00\x00"
+    data += b"\x00" * (-len(data) % 4)
+
+    header_size = 28
+    strings_offset = header_size + 4 * len(strings)
+    raw = struct.pack("<2HL5L", apk.RES_STRING_POOL_TYPE, header_size,
+                      strings_offset + len(data), len(strings), 0,
+                      apk.UTF8_FLAG if utf8 else 0, strings_offset, 0)
+    raw += struct.pack("<%dL" % len(offsets), *offsets) + data
+    buff = bytecode.BuffHandle(raw)
+    return apk.StringBlock(buff, apk.ARSCHeader(buff))
+
+
+class FakeResources(object):
+    """
+        The entries of resources referencing each others, or integers
+    """
+
+    def __init__(self, values):
+        self.calls = collections.Counter()
+        self.entries = {}
+        package = apk.PackageContext(None, self, None, None)
+        for res_id, (data_type, data) in values.items():
+            buff = bytecode.BuffHandle(struct.pack("<HHI3sBI", 8, 0, 0, b"\x08",
+                                                   data_type, data))
+            self.entries[res_id] = apk.ARSCResTableEntry(buff, res_id, package)
+
+    def getString(self, idx):
+        return ""
+
+    def get_res_configs(self, rid, config=None):
+        self.calls[rid] += 1
+        return [(apk.ARSCResTableConfig.default_config(), self.entries[rid])]
+
+
+class ResourceResolverTest(unittest.TestCase):
+
+    def testResolve(self):
+        resources = FakeResources({
+            0x7f010000: (apk.TYPE_REFERENCE, 0x7f010001),
+            0x7f010001: (apk.TYPE_REFERENCE, 0x7f010002),
+            0x7f010002: (apk.TYPE_INT_DEC, 42),
+            0x7f010003: (apk.TYPE_REFERENCE, 0x7f010001),
+        })
+        resolver = apk.ARSCParser.ResourceResolver(resources)
+        config = apk.ARSCResTableConfig.default_config()
+
+        self.assertEqual(resolver.resolve(0x7f010000), [(config, "42")])
+        self.assertEqual(resolver.resolve_many([0x7f010003, 0x7f010002]),
+                         {0x7f010003: [(config, "42")],
+                          0x7f010002: [(config, "42")]})
+        self.assertEqual(resources.calls[0x7f010001], 1)
+        self.assertEqual(resources.calls[0x7f010002], 1)
+
+        # The results are copies of the cache
+        resolver.resolve(0x7f010000).append(None)
+        self.assertEqual(resolver.resolve(0x7f010000), [(config, "42")])
+
+    def testCycle(self):
+        resources = FakeResources({
+            0x7f010000: (apk.TYPE_REFERENCE, 0x7f010001),
+            0x7f010001: (apk.TYPE_REFERENCE, 0x7f010000),
+            0x7f010002: (apk.TYPE_INT_DEC, 1),
+        })
+        resolver = apk.ARSCParser.ResourceResolver(resources)
+        self.assertEqual(resolver.resolve(0x7f010000), [])
+        self.assertEqual(resolver.resolve(0x7f010001), [])
+        self.assertEqual(len(resolver.resolve(0x7f010002)), 1)
+        self.assertNotIn(0x7f010000, resolver.cache)
+        self.assertIn(0x7f010002, resolver.cache)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+
+import io
+import os
+import sys
+import zipfile
+PATH_INSTALL = "./"
+sys.path.append(PATH_INSTALL)
+
+from androguard.bench import generator
+from androguard.bench import meminfo
+from androguard.bench import runner
+from androguard.core.bytecodes import apk
+from androguard.core.bytecodes import dvm
+from androguard.core.analysis import analysis
+
+
+class BenchTest(unittest.TestCase):
+
+    def testGenerateDex(self):
+        raw = generator.generate_dex(30, 4, 200)
+        self.assertEqual(raw, generator.generate_dex(30, 4, 200))
+
+        d = dvm.DalvikVMFormat(raw)
+        self.assertEqual(len(d.get_classes()), 30)
+        self.assertEqual(len(d.get_methods()), 120)
+        self.assertEqual(len(d.get_fields()), 30)
+        self.assertIn("str00000199", d.get_strings())
+
+        dx = analysis.Analysis(d)
+        dx.create_xref()
+        method = d.get_method_descriptor("Lbench/C000000;", "m0", "()V")
+        self.assertEqual(len(dx.get_method_analysis(method).get_xref_to()), 1)
+        field = d.get_fields_class("Lbench/C000000;")[0]
+        self.assertEqual(len(dx.get_field_analysis(field).get_xref_read()), 4)
+
+    def testGenerateAPK(self):
+        dex_files = [generator.generate_dex(10, 2, 10),
+                     generator.generate_dex(5, 2, 10, seed=1)]
+        raw = generator.generate_apk(dex_files)
+
+        names = zipfile.ZipFile(io.BytesIO(raw)).namelist()
+        self.assertIn("AndroidManifest.xml", names)
+        a = apk.APK(raw, raw=True)
+        self.assertEqual(list(a.get_all_dex()), dex_files)
+
+    def testRun(self):
+        raw = generator.generate_apk([generator.generate_dex(10, 2, 10)])
+        result = runner.run("test", raw, ["apk", "axml", "dex", "xref"])
+        self.assertEqual(result["type"], "APK")
+        self.assertEqual(result["classes"], 10)
+        self.assertEqual(result["methods"], 20)
+        for phase in ["apk", "axml", "dex", "xref", "dex/TYPE_CODE_ITEM"]:
+            self.assertIn(phase, result["phases"])
+        self.assertNotIn("cfg", result["phases"])
+
+    def testMemory(self):
+        if not os.path.exists("/proc/self/status"):
+            self.skipTest("no /proc/self/status")
+        rss = runner.get_rss()
+        self.assertGreater(rss, 0)
+        self.assertGreaterEqual(runner.get_peak_rss(), rss)
+        self.assertGreaterEqual(meminfo.memory(), meminfo.resident())
+
+    def testTemplate(self):
+        # Found whatever the current directory
+        self.assertTrue(os.path.isabs(generator.TEMPLATE_APK))
+        self.assertTrue(os.path.isfile(generator.TEMPLATE_APK))
+
+    def testCompare(self):
+        def results(**phases):
+            return {"results": [{
+                "name": "test",
+                "phases": dict((name, {"wall": wall})
+                               for name, wall in phases.items())}]}
+
+        baseline = results(dex=1.0, xref=1.0, cfg=0.01)
+        self.assertEqual(runner.compare(results(dex=1.1, xref=0.5, cfg=1.0,
+                                                decompile=1.0), baseline), [])
+        self.assertEqual(runner.compare(results(dex=1.5, xref=1.0), baseline),
+                         [("test", "dex", 1.0, 1.5)])
+        self.assertEqual(runner.compare(results(dex=1.1), baseline,
+                                        tolerance=0.05),
+                         [("test", "dex", 1.0, 1.1)])
+        self.assertEqual(runner.compare({"results": [{"name": "other",
+                                                       "phases": {}}]},
+                                        baseline), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
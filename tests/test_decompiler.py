@@ -0,0 +1,46 @@
+import unittest
+
+import sys
+try:
+    # Takes the str and unicode chunks of Python 2
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+PATH_INSTALL = "./"
+sys.path.append(PATH_INSTALL)
+
+from androguard.core.bytecodes import dvm
+from androguard.core.analysis import analysis
+from androguard.decompiler.dad import decompile
+
+
+class DecompilerTest(unittest.TestCase):
+
+    def testStreamingSource(self):
+        with open("examples/android/TestsAndroguard/bin/classes.dex",
+                  "rb") as fd:
+            d = dvm.DalvikVMFormat(fd.read())
+            dx = analysis.Analysis(d)
+            dx.create_xref()
+
+            for name in ["Ltests/androguard/TestActivity;",
+                         "Ltests/androguard/TestLoops;"]:
+                c = decompile.DvClass(d.get_class(name), dx)
+                c.process()
+                source = c.get_source()
+                self.assertEqual(''.join(c.iter_source()), source)
+                self.assertEqual(list(c.iter_source_ext()),
+                                 c.get_source_ext())
+
+                streamed = StringIO()
+                c = decompile.DvClass(d.get_class(name), dx)
+                c.write_source(streamed, process=True)
+                self.assertEqual(streamed.getvalue(), source)
+
+                # Methods decompiled on the fly are released afterwards
+                self.assertFalse([m for m in c.get_methods()
+                                  if isinstance(m, decompile.DvMethod)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 
+import re
 import sys
 PATH_INSTALL = "./"
 sys.path.append(PATH_INSTALL)
@@ -27,6 +28,88 @@ class DexTest(unittest.TestCase):
             self.assertTrue(fields)
             self.assertEqual(len(fields), 803)
 
+    def testIndexes(self):
+        with open("examples/android/TestsAndroguard/bin/classes.dex",
+                  "rb") as fd:
+            d = dvm.DalvikVMFormat(fd.read())
+
+            for current_class in d.get_classes():
+                name = current_class.get_name()
+                self.assertIs(d.get_class(name), current_class)
+                self.assertEqual(d.get_methods_class(name),
+                                 tuple(current_class.get_methods()))
+                self.assertEqual(d.get_fields_class(name),
+                                 tuple(current_class.get_fields()))
+            self.assertIsNone(d.get_class("LDoesNotExist;"))
+            self.assertEqual(d.get_methods_class("LDoesNotExist;"), ())
+            self.assertIs(d.get_methods(), d.get_methods())
+
+            current_class = d.get_class("Ltests/androguard/TestActivity;")
+            methods = d.get_methods_descriptor(
+                "Ltests/androguard/TestActivity;", "onCreate")
+            self.assertEqual(len(methods), 1)
+            self.assertEqual(methods[0].get_name(), "onCreate")
+
+            # The indexes follow the renaming of the methods and classes
+            methods[0].set_name("renamedOnCreate")
+            self.assertEqual(d.get_methods_descriptor(
+                "Ltests/androguard/TestActivity;", "onCreate"), ())
+            self.assertEqual(d.get_methods_descriptor(
+                "Ltests/androguard/TestActivity;", "renamedOnCreate"),
+                             methods)
+
+            current_class.set_name("Ltests/androguard/RenamedActivity;")
+            self.assertIsNone(d.get_class("Ltests/androguard/TestActivity;"))
+            self.assertIs(d.get_class("Ltests/androguard/RenamedActivity;"),
+                          current_class)
+            self.assertEqual(
+                len(d.get_methods_class("Ltests/androguard/RenamedActivity;")),
+                len(current_class.get_methods()))
+
+    def testSearchStrings(self):
+        with open("examples/android/TestsAndroguard/bin/classes.dex",
+                  "rb") as fd:
+            d = dvm.DalvikVMFormat(fd.read())
+
+            matches = d.search_strings([r"^Test\d", "Activity$"],
+                                       ["TestActivity;"])
+            self.assertTrue(matches)
+            self.assertEqual([m[0] for m in matches],
+                             sorted(m[0] for m in matches))
+            for idx, value, patterns in matches:
+                self.assertEqual(d.get_cm_string(idx), value)
+
+            found = dict((value, patterns) for _, value, patterns in matches)
+            self.assertEqual(found["Ltests/androguard/TestActivity;"],
+                             ["TestActivity;"])
+            self.assertEqual(found["Test2: "], [r"^Test\d"])
+            self.assertNotIn("TestActivity.java", found)
+
+            # Same results as a scan of all the strings with each pattern
+            for pattern in [r"^Test\d", "Activity$"]:
+                self.assertEqual(
+                    sorted(value for value, patterns in found.items()
+                           if pattern in patterns),
+                    sorted(set(value for value in d.get_strings()
+                               if re.search(pattern, value))))
+
+            self.assertEqual(d.search_strings(), [])
+            self.assertEqual(d.search_strings(["^NoSuchString$"]), [])
+            self.assertEqual(d.get_regex_strings("Test2"), ["Test2: "])
+
+            # Patterns which can't be combined into a single regex
+            found = dict((value, patterns) for _, value, patterns in
+                         d.search_strings(["(?i)^test2: ", "def",
+                                           r"(?P<x>T)est(\d)",
+                                           r"(?P<x>T)est(\d): $",
+                                           r"^(T)est\1"],
+                                          ["TestActivity;"]))
+            self.assertEqual(found["Test2: "], ["(?i)^test2: ",
+                                                r"(?P<x>T)est(\d)",
+                                                r"(?P<x>T)est(\d): $"])
+            self.assertEqual(found["Ltests/androguard/TestActivity;"],
+                             ["TestActivity;"])
+
     def testMultiDex(self):
         pass
 
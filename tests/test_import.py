@@ -0,0 +1,102 @@
+import unittest
+
+import os
+import subprocess
+import sys
+import time
+PATH_INSTALL = "./"
+sys.path.append(PATH_INSTALL)
+
+# Modules which must not be imported by the short-lived tools
+HEAVY_MODULES = [
+    "IPython",
+    "pygments",
+    "cryptography",
+    "pyasn1",
+    "xml.sax.saxutils",
+    "androguard.core.bytecodes.api_permissions",
+]
+if sys.version_info < (3, 7):
+    # The lazy attributes of the modules (PEP 562) are defined when they are
+    # imported
+    HEAVY_MODULES = [name for name in HEAVY_MODULES if name not in
+                     ("pygments", "androguard.core.bytecodes.api_permissions")]
+
+
+# Maximum time, in seconds, to start each of the command line tools (the
+# best of 3 runs), several times what they take. A slow or loaded machine can
+# raise it with ANDROGUARD_IMPORT_TIME_BUDGET.
+IMPORT_TIME_BUDGET = float(os.environ.get("ANDROGUARD_IMPORT_TIME_BUDGET",
+                                          "1.5"))
+
+
+def run_python(*args):
+    return subprocess.check_output([sys.executable] + list(args),
+                                   stderr=subprocess.STDOUT)
+
+
+def best_time(args, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        run_python(*args)
+        elapsed = time.time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+class ImportTest(unittest.TestCase):
+
+    def _GetImportedModules(self, module):
+        output = run_python("-c", "import sys, %s; "
+                                  "print('\\n'.join(sys.modules))" % module)
+        return set(output.decode("utf-8").split())
+
+    def testLazyAPK(self):
+        modules = self._GetImportedModules("androguard.core.bytecodes.apk")
+        for name in HEAVY_MODULES:
+            self.assertNotIn(name, modules)
+
+    def testLazyMisc(self):
+        modules = self._GetImportedModules("androguard.misc")
+        for name in HEAVY_MODULES:
+            self.assertNotIn(name, modules)
+
+    def testLazyPackage(self):
+        modules = self._GetImportedModules("androguard")
+        self.assertNotIn("androguard.core.bytecodes.dvm", modules)
+        if sys.version_info < (3, 7):
+            # The submodules are not attributes of the package before
+            # Python 3.7 (PEP 562)
+            return
+        output = run_python("-c", "import androguard; "
+                                  "print(androguard.misc.__name__)")
+        self.assertEqual(output.decode("utf-8").strip(), "androguard.misc")
+
+    def testLazyPermissions(self):
+        output = run_python(
+            "-c", "from androguard.core.analysis import analysis; "
+                  "print(len(analysis.DVM_PERMISSIONS_BY_PERMISSION) > 0)")
+        self.assertEqual(output.decode("utf-8").strip(), "True")
+
+    def testImportTime(self):
+        for args in [["-c", "import androguard.core.bytecodes.apk"],
+                     ["androaxml.py", "-h"],
+                     ["androdd.py", "-h"],
+                     ["androlyze.py", "-v"]]:
+            elapsed = best_time(args)
+            sys.stderr.write("\nimport time of %s: %.3fs\n" %
+                             (" ".join(args), elapsed))
+            self.assertLess(elapsed, IMPORT_TIME_BUDGET)
+
+    def testLazyTools(self):
+        # The command line tools, imported as modules
+        for tool in ["androaxml", "androdd", "androlyze"]:
+            modules = self._GetImportedModules(tool)
+            for name in HEAVY_MODULES:
+                self.assertNotIn(name, modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,18 @@
 import unittest
 
+import io
+import json
 import sys
+import zipfile
 PATH_INSTALL = "./"
 sys.path.append(PATH_INSTALL)
 
 from androguard import session
+from androguard.bench import generator
+from androguard.core import androconf
+from androguard.core import profiling
+from androguard.core.analysis import analysis
+from androguard.core.bytecodes import dvm
 
 
 class SessionTest(unittest.TestCase):
@@ -30,6 +38,28 @@ class SessionTest(unittest.TestCase):
             self.assertEqual(len(s.analyzed_digest), 2)
             self.assertEqual(len(s.analyzed_dex), 1)
 
+    def testSessionAPKDirectory(self):
+        # The central directory is read once, to find the type of the file
+        get_zip_directory = androconf.get_zip_directory
+        calls = []
+
+        def counting_get_zip_directory(read_at, size):
+            calls.append(size)
+            return get_zip_directory(read_at, size)
+
+        androconf.get_zip_directory = counting_get_zip_directory
+        try:
+            s = session.Session()
+            with open("examples/android/TestsAndroguard/bin/TestActivity.apk",
+                      "rb") as fd:
+                self.assertTrue(s.add(
+                    "examples/android/TestsAndroguard/bin/TestActivity.apk",
+                    fd.read()))
+        finally:
+            androconf.get_zip_directory = get_zip_directory
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(s.analyzed_dex), 1)
+
     def testSessionSave(self):
         s = session.Session()
         with open("examples/android/TestsAndroguard/bin/TestActivity.apk",
@@ -38,6 +68,226 @@ class SessionTest(unittest.TestCase):
                   fd.read())
             session.Save(s, "test_session")
 
+    def testSessionSaveProfiler(self):
+        s = session.Session(profiler=profiling.Profiler())
+        with open("examples/android/TestsAndroguard/bin/classes.dex",
+                  "rb") as fd:
+            raw = fd.read()
+        s.add("classes.dex", raw)
+        session.Save(s, "test_session")
+
+        s = session.Load("test_session")
+        self.assertEqual(s.get_profile_report().get_phase("dex")["calls"], 1)
+        with open("examples/android/TC/bin/classes.dex", "rb") as fd:
+            s.add("TC.dex", fd.read())
+        self.assertEqual(s.get_profile_report().get_phase("dex")["calls"], 2)
+
+        # Sessions saved before the profiler existed
+        s = session.Session()
+        del s.profiler
+        session.Save(s, "test_session")
+        s = session.Load("test_session")
+        self.assertIsNone(s.profiler)
+        s.add("classes.dex", raw)
+        self.assertEqual(len(s.analyzed_dex), 1)
+
+    def testSessionClasses(self):
+        s = session.Session()
+        with open("examples/android/TestsAndroguard/bin/TestActivity.apk",
+                  "rb") as fd:
+            s.add("examples/android/TestsAndroguard/bin/TestActivity.apk",
+                  fd.read())
+        with open("examples/android/TC/bin/classes.dex", "rb") as fd:
+            s.add("examples/android/TC/bin/classes.dex", fd.read())
+
+        dex = list(s.get_objects_dex())
+        self.assertEqual(len(dex), 2)
+        self.assertEqual(s.get_nb_classes(),
+                         len(set(c.get_name() for _, d, _ in dex
+                                 for c in d.get_classes())))
+        for digest, d, dx in dex:
+            for current_class in d.get_classes():
+                if s.get_digest_by_class(current_class) != digest:
+                    # Also defined by the first file
+                    self.assertTrue(dex[0][1].get_class(
+                        current_class.get_name()))
+                    continue
+                self.assertIs(s.get_format(current_class), d)
+                self.assertIs(s.get_analysis(current_class), dx)
+                self.assertEqual(s.get_filename_by_class(current_class),
+                                 s.analyzed_digest[digest])
+
+        self.assertEqual(s.get_nb_strings(),
+                         sum(len(strings) for _, _, strings in s.get_strings()))
+
+        # External classes are only known by the analysis
+        external = next(dex[0][2].get_external_classes()).get_vm_class()
+        self.assertIs(s.get_analysis(external), dex[0][2])
+        self.assertIsNone(
+            s.get_digest_by_class(analysis.ExternalClass("LNoSuchClass;")))
+
+    def testSessionMultiDex(self):
+        dex_files = []
+        for filename in ["examples/android/TC/bin/classes.dex",
+                         "examples/android/TestsAndroguard/bin/classes.dex"]:
+            with open(filename, "rb") as fd:
+                dex_files.append(fd.read())
+
+        raw = io.BytesIO()
+        with zipfile.ZipFile(
+                "examples/android/TestsAndroguard/bin/TestActivity.apk") as z:
+            with zipfile.ZipFile(raw, "w") as multidex:
+                for name in z.namelist():
+                    if name != "classes.dex":
+                        multidex.writestr(name, z.read(name))
+                multidex.writestr("classes.dex", dex_files[0])
+                multidex.writestr("classes2.dex", dex_files[1])
+
+        s = session.Session(profiler=profiling.Profiler())
+        s.add("multidex.apk", raw.getvalue())
+        self.assertEqual(s.get_profile_report().get_phase(
+            "analysis/xref")["calls"], 1)
+
+        a, d, dx = s.get_objects_apk("multidex.apk")
+        self.assertEqual(len(d), 2)
+        self.assertIs(dx[0], dx[1])
+        self.assertEqual(dx[0].vms, d)
+
+        # The shared analysis has the same xrefs as one analysis per DEX
+        # file, as they do not reference each other
+        for vm, raw_dex in zip(d, dex_files):
+            alone = analysis.Analysis(dvm.DalvikVMFormat(raw_dex))
+            alone.create_xref()
+            for current_class in vm.get_classes():
+                class_analysis = dx[0].get_class_analysis(
+                    current_class.get_name())
+                self.assertIs(class_analysis.get_vm_class(), current_class)
+                self.assertTrue(class_analysis.internal)
+                self.assertEqual(
+                    sorted(str(m.method) for m in class_analysis.get_methods()),
+                    sorted(str(m.method) for m in alone.get_class_analysis(
+                        current_class.get_name()).get_methods()))
+
+    def _checkCrossDexXref(self, dx, app, lib):
+        # The methods of app call the ones of lib and use their fields: the
+        # xrefs lead to the classes of lib, not to external ones
+        lib_methods = set(lib.get_methods())
+        lib_fields = set(lib.get_fields())
+        self.assertFalse([c for c in dx.get_external_classes()
+                          if c.get_vm_class().get_name().startswith("Llib/")])
+        for current_class in app.get_classes():
+            class_analysis = dx.get_class_analysis(current_class.get_name())
+            self.assertIs(class_analysis.get_vm_class(), current_class)
+            for method in current_class.get_methods():
+                xref_to = class_analysis.get_method_analysis(
+                    method).get_xref_to()
+                self.assertEqual(len(xref_to), 1)
+                for target_analysis, target, offset in xref_to:
+                    self.assertTrue(target_analysis.internal)
+                    self.assertIs(target_analysis, dx.get_class_analysis(
+                        target.get_class_name()))
+                    self.assertIn(target, lib_methods)
+                    self.assertIn(
+                        (class_analysis, method, offset),
+                        target_analysis.get_method_analysis(
+                            target).get_xref_from())
+                    self.assertIn(target_analysis,
+                                  class_analysis.get_xref_to())
+
+            fields = [field for field in lib_fields
+                      if class_analysis.get_field_analysis(field)]
+            self.assertTrue(fields)
+            for field in fields:
+                field_analysis = class_analysis.get_field_analysis(field)
+                self.assertTrue(field_analysis.get_xref_read())
+                self.assertTrue(field_analysis.get_xref_write())
+
+    def testSessionMultiDexXref(self):
+        # classes.dex calls the methods of classes2.dex
+        dex_files = [generator.generate_dex(5, 3, 10, package="app",
+                                            callee_package="lib"),
+                     generator.generate_dex(5, 3, 10, package="lib")]
+
+        s = session.Session()
+        s.add("multidex.apk", generator.generate_apk(dex_files))
+        a, d, dx = s.get_objects_apk("multidex.apk")
+        self.assertIs(dx[0], dx[1])
+        self._checkCrossDexXref(dx[0], d[0], d[1])
+
+        # Same xrefs when the DEX files are added one by one to an analysis,
+        # whichever comes first
+        for order in [(0, 1), (1, 0)]:
+            s = session.Session()
+            vms = [None, None]
+            dx = None
+            for num in order:
+                _, vms[num], dx = s.addDEX("classes%d.dex" % num,
+                                           dex_files[num], dx)
+            self._checkCrossDexXref(dx, vms[0], vms[1])
+
+    def testSessionSearchStrings(self):
+        s = session.Session()
+        with open("examples/android/TestsAndroguard/bin/TestActivity.apk",
+                  "rb") as fd:
+            s.add("examples/android/TestsAndroguard/bin/TestActivity.apk",
+                  fd.read())
+
+        matches = list(s.search_strings([r"^Test\d?: "]))
+        self.assertEqual(sorted(m.get_value() for _, _, m in matches),
+                         ["Test2: ", "Test: "])
+        for _, filename, match in matches:
+            self.assertEqual(
+                filename,
+                "examples/android/TestsAndroguard/bin/TestActivity.apk")
+            self.assertEqual(match.get_patterns(), [r"^Test\d?: "])
+            self.assertEqual(len(match.get_xref_from()), 1)
+
+        _, _, dx = s.get_objects_apk(
+            "examples/android/TestsAndroguard/bin/TestActivity.apk")
+        self.assertEqual(
+            sorted(m.get_value() for m in dx.search_strings([r"^Test\d?: "])),
+            ["Test2: ", "Test: "])
+
+    def testSessionProfile(self):
+        self.assertEqual(session.Session().get_profile_report(), None)
+
+        s = session.Session(profiler=profiling.Profiler(count_objects=True))
+        self.assertEqual(s.get_profile_report().phases, [])
+        with open("examples/android/TestsAndroguard/bin/classes.dex",
+                  "rb") as fd:
+            s.add("examples/android/TestsAndroguard/bin/classes.dex", fd.read())
+        self.assertEqual(profiling.get_active_profiler(), None)
+
+        report = s.get_profile_report()
+        for name in ["dex", "dex/TYPE_STRING_DATA_ITEM", "analysis/xref"]:
+            phase = report.get_phase(name)
+            self.assertEqual(phase["calls"], 1)
+            self.assertGreater(phase["wall"], 0)
+        self.assertGreater(report.get_phase("dex")["objects"], 0)
+        self.assertGreaterEqual(report.wall, report.get_phase("dex")["wall"])
+
+        data = json.loads(report.get_json())
+        self.assertEqual([phase["name"] for phase in data["phases"]],
+                         [phase["name"] for phase in report.phases])
+
+    def testProfilerActivation(self):
+        # Profilers deactivated in another order than activated, like by two
+        # threads
+        first = profiling.Profiler()
+        second = profiling.Profiler()
+        first.__enter__()
+        with second:
+            self.assertIs(profiling.get_active_profiler(), second)
+            first.__exit__(None, None, None)
+            self.assertIs(profiling.get_active_profiler(), second)
+        self.assertEqual(profiling.get_active_profiler(), None)
+
+        with first:
+            with first:
+                self.assertIs(profiling.get_active_profiler(), first)
+            self.assertIs(profiling.get_active_profiler(), first)
+        self.assertEqual(profiling.get_active_profiler(), None)
+
 
 if __name__ == '__main__':
     unittest.main()
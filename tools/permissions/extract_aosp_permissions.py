@@ -21,7 +21,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os, re, codecs
+import os, re, gzip, json
 from xml.dom import minidom
 from xml.parsers.expat import ExpatError
 
@@ -41,7 +41,7 @@ PLATFORM_VERSIONS_FILE_REL_PATH = "build/core/version_defaults.mk"
 NS_ANDROID_URI = "http://schemas.android.com/apk/res/android"
 
 AOSP_PERMISSIONS_PARAM_NAME = "AOSP_PERMISSIONS"
-AOSP_PERMISSION_GROUPS_PARAM_NAME = "AOSP_PERMISSION_GROUPS"
+AOSP_PERMISSION_GROUPS_PARAM_NAME = "AOSP_PERMISSIONS_GROUPS"
 
 
 def getPlatformVersions(aosp_root_dir):
@@ -175,7 +175,8 @@ if sdk_version == None:
     exit(1)
 
 print "Checking if we already have the file with the version..."
-perms_module_name = "%s_api%s.py" % (AOSP_PERMISSION_MODULE_NAME, sdk_version)
+perms_module_name = "%s_api%s.json.gz" % (AOSP_PERMISSION_MODULE_NAME,
+                                            sdk_version)
 perms_module_path = os.path.join(AOSP_PERMISSION_MODULE_PATH, perms_module_name)
 if os.path.exists(perms_module_path):
     print "API specific file for this version already exists!"
@@ -202,29 +203,13 @@ if not os.path.exists(AOSP_PERMISSION_MODULE_PATH):
     os.makedirs(AOSP_PERMISSION_MODULE_PATH)
 
 print "Appending found information to the permission file..."
-with codecs.open(perms_module_path, 'w', 'utf-8') as perm_py_module:
-    perm_py_module.write("#!/usr/bin/python\n")
-    perm_py_module.write("# -*- coding: %s -*-\n" % "utf-8")
-    perm_py_module.write("#################################################\n")
-    perm_py_module.write("### Extracted from platform version: %s \n" %
-                         platform_version)
-    perm_py_module.write("#################################################\n")
-
-    perm_py_module.write("%s = {\n" % AOSP_PERMISSIONS_PARAM_NAME)
-    for p_key in permissions.keys():
-        properties = permissions.get(p_key)
-        props_string = ", ".join(["'%s' : '%s'" % (prop_key, properties.get(
-            prop_key)) for prop_key in properties.keys()])
-        perm_py_module.write("\t'%s' : {%s},\n" % (p_key, props_string))
-    perm_py_module.write("}\n\n")
-
-    perm_py_module.write("%s = {\n" % AOSP_PERMISSION_GROUPS_PARAM_NAME)
-    for pg_key in permission_groups.keys():
-        properties = permission_groups.get(pg_key)
-        props_string = ", ".join(["'%s' : '%s'" % (prop_key, properties.get(
-            prop_key)) for prop_key in properties.keys()])
-        perm_py_module.write("\t'%s' : {%s},\n" % (pg_key, props_string))
-    perm_py_module.write("}\n")
-    perm_py_module.write("#################################################\n")
+with open(perms_module_path, 'wb') as perm_file:
+    # mtime=0 keeps the file identical for the same data
+    with gzip.GzipFile(filename='', mode='wb', fileobj=perm_file,
+                       mtime=0) as perm_gz:
+        perm_gz.write(json.dumps({
+            AOSP_PERMISSIONS_PARAM_NAME: permissions,
+            AOSP_PERMISSION_GROUPS_PARAM_NAME: permission_groups,
+        }, sort_keys=True, separators=(',', ':')).encode('utf-8'))
 
 print "Done..."
@@ -35,7 +35,7 @@ METHODS_MAPPING_PARAM_NAME = "AOSP_PERMISSIONS_BY_METHODS"
 FIELDS_MAPPING_PARAM_NAME = "AOSP_PERMISSIONS_BY_FIELDS"
 
 #IMPORTS
-import os, re, codecs
+import os, re, gzip, json
 
 #auxiliary
 TYPE_DESCRIPTOR = {
@@ -116,8 +116,8 @@ if not os.path.exists(MAPPINGS_MODULE_PATH):
     os.makedirs(MAPPINGS_MODULE_PATH)
 
 print "Checking if we already have the file with the version %d..." % API_VERSION
-api_specific_mappings_module_name = "%s_api%s.py" % (MAPPINGS_MODULE_NAME,
-                                                     API_VERSION)
+api_specific_mappings_module_name = "%s_api%s.json.gz" % (MAPPINGS_MODULE_NAME,
+                                                          API_VERSION)
 api_specific_mappings_module_path = os.path.join(
     MAPPINGS_MODULE_PATH, api_specific_mappings_module_name)
 if os.path.exists(api_specific_mappings_module_path):
@@ -198,58 +198,17 @@ for line in contentproviderfields_mapping_file_lines:
             fields_mapping[field_identificator].add(perm_name)
 
 print "Appending found information to the mappings file..."
-with codecs.open(api_specific_mappings_module_path, 'w',
-                 'utf-8') as perm_py_module:
-    perm_py_module.write('#!/usr/bin/python\n')
-    perm_py_module.write('# -*- coding: %s -*-\n\n' % 'utf-8')
-
-    perm_py_module.write('# This file is a part of Androguard.\n')
-    perm_py_module.write('#\n')
-    perm_py_module.write(
-        '# This file is generated automatically from the data\n')
-    perm_py_module.write(
-        '# provided by PScout tool [http://pscout.csl.toronto.edu/]\n')
-    perm_py_module.write('# using script: %s\n' % os.path.basename(__file__))
-    perm_py_module.write('#\n')
-    perm_py_module.write('# Author: Yury Zhauniarovich\n')
-    perm_py_module.write('#\n')
-    perm_py_module.write('#\n')
-    perm_py_module.write(
-        '# Licensed under the Apache License, Version 2.0 (the "License");\n')
-    perm_py_module.write(
-        '# you may not use this file except in compliance with the License.\n')
-    perm_py_module.write('# You may obtain a copy of the License at\n')
-    perm_py_module.write('#\n')
-    perm_py_module.write('#      http://www.apache.org/licenses/LICENSE-2.0\n')
-    perm_py_module.write('#\n')
-    perm_py_module.write(
-        '# Unless required by applicable law or agreed to in writing, software\n')
-    perm_py_module.write(
-        '# distributed under the License is distributed on an "AS-IS" BASIS,\n')
-    perm_py_module.write(
-        '# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.\n')
-    perm_py_module.write(
-        '# See the License for the specific language governing permissions and\n')
-    perm_py_module.write('# limitations under the License"\n\n')
-
-    perm_py_module.write('#################################################\n')
-    perm_py_module.write('### API version: %d \n' % API_VERSION)
-    perm_py_module.write(
-        '#################################################\n\n\n')
-
-    perm_py_module.write("%s = {\n" % METHODS_MAPPING_PARAM_NAME)
-    for method in methods_mapping.keys():
-        permissions = methods_mapping.get(method)
-        perms_string = ", ".join(["'%s'" % prm for prm in permissions])
-        perm_py_module.write("\t'%s' : [%s],\n" % (method, perms_string))
-    perm_py_module.write("}\n\n")
-
-    perm_py_module.write("%s = {\n" % FIELDS_MAPPING_PARAM_NAME)
-    for field in fields_mapping.keys():
-        permissions = fields_mapping.get(field)
-        perms_string = ", ".join(["'%s'" % prm for prm in permissions])
-        perm_py_module.write("\t'%s' : [%s],\n" % (field, perms_string))
-    perm_py_module.write("}\n")
-    perm_py_module.write("#################################################\n")
+with open(api_specific_mappings_module_path, 'wb') as mappings_file:
+    # mtime=0 keeps the file identical for the same data
+    with gzip.GzipFile(filename='', mode='wb', fileobj=mappings_file,
+                       mtime=0) as mappings_gz:
+        mappings_gz.write(json.dumps({
+            METHODS_MAPPING_PARAM_NAME: dict(
+                (method, sorted(perms))
+                for method, perms in methods_mapping.items()),
+            FIELDS_MAPPING_PARAM_NAME: dict(
+                (field, sorted(perms))
+                for field, perms in fields_mapping.items()),
+        }, sort_keys=True, separators=(',', ':')).encode('utf-8'))
 
 print "Done..."